@@ -0,0 +1,194 @@
+from collections import OrderedDict
+
+from PySide2.QtGui import QPixmap
+
+
+class PixmapCache:
+    """
+    The least recently used cache of rendered pixmaps.
+
+    The pixmaps are stored by key and the least recently used entries are
+    evicted when the cache grows over its byte budget. Each widget subclasses
+    it with its own default byte budget and process wide instance.
+    """
+    defaultByteBudget = 16 * 1024 * 1024
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> 'PixmapCache':
+        """
+        Get the process wide instance of the cache class.
+
+        Return
+            The shared cache.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, byteBudget: int = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            byteBudget:         The maximum byte count of the cached pixmaps,
+                                the class default byte budget if None.
+        """
+        self._entries = OrderedDict()
+        self._byteBudget = self.defaultByteBudget if byteBudget is None \
+            else byteBudget
+        self._byteCount = 0
+        self._hitCount = 0
+        self._missCount = 0
+        self._evictionCount = 0
+
+    def _calcByteCount(self, pixmap: QPixmap) -> int:
+        """
+        Calculate the byte count of the given pixmap.
+
+        Params:
+            pixmap:             The rendered pixmap.
+
+        Return
+            The pixmap byte count.
+        """
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def _evict(self, byteBudget: int) -> None:
+        """
+        Evict the least recently used entries until the cache fits in the
+        given byte budget.
+
+        Params:
+            byteBudget:         The byte budget to fit in.
+        """
+        while self._entries and self._byteCount > byteBudget:
+            _, (_, byteCount) = self._entries.popitem(last=False)
+            self._byteCount -= byteCount
+            self._evictionCount += 1
+
+    def get(self, key: tuple) -> QPixmap:
+        """
+        Get the pixmap rendered for the given key.
+
+        Params:
+            key:                The pixmap key.
+
+        Return
+            The cached pixmap, None if it is not in the cache.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._missCount += 1
+            return None
+        self._hitCount += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def insert(self, key: tuple, pixmap: QPixmap) -> None:
+        """
+        Insert the pixmap rendered for the given key. The pixmap is not
+        cached if it is bigger than the whole byte budget.
+
+        Params:
+            key:                The pixmap key.
+            pixmap:             The rendered pixmap.
+        """
+        self.remove(key)
+        byteCount = self._calcByteCount(pixmap)
+        if byteCount > self._byteBudget:
+            return
+        self._evict(self._byteBudget - byteCount)
+        self._entries[key] = (pixmap, byteCount)
+        self._byteCount += byteCount
+
+    def remove(self, key: tuple) -> None:
+        """
+        Remove the pixmap rendered for the given key.
+
+        Params:
+            key:                The pixmap key.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._byteCount -= entry[1]
+
+    def clear(self) -> None:
+        """
+        Clear the cache content.
+        """
+        self._entries.clear()
+        self._byteCount = 0
+
+    def resetStats(self) -> None:
+        """
+        Reset the hit, miss and eviction counters.
+        """
+        self._hitCount = 0
+        self._missCount = 0
+        self._evictionCount = 0
+
+    def getEntryCount(self) -> int:
+        """
+        Get the entry count.
+
+        Return
+            The number of cached pixmaps.
+        """
+        return len(self._entries)
+
+    def getByteCount(self) -> int:
+        """
+        Get the byte count.
+
+        Return
+            The byte count of the cached pixmaps.
+        """
+        return self._byteCount
+
+    def getByteBudget(self) -> int:
+        """
+        Get the byte budget.
+
+        Return
+            The maximum byte count of the cached pixmaps.
+        """
+        return self._byteBudget
+
+    def setByteBudget(self, byteBudget: int) -> None:
+        """
+        Set the byte budget. The least recently used entries are evicted if
+        the cache does not fit in the new budget.
+
+        Params:
+            byteBudget:         The new maximum byte count.
+        """
+        self._byteBudget = byteBudget
+        self._evict(byteBudget)
+
+    def getHitCount(self) -> int:
+        """
+        Get the hit count.
+
+        Return
+            The number of lookups that found their pixmap.
+        """
+        return self._hitCount
+
+    def getMissCount(self) -> int:
+        """
+        Get the miss count.
+
+        Return
+            The number of lookups that did not find their pixmap.
+        """
+        return self._missCount
+
+    def getEvictionCount(self) -> int:
+        """
+        Get the eviction count.
+
+        Return
+            The number of entries evicted to fit in the byte budget.
+        """
+        return self._evictionCount
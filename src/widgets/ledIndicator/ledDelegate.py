@@ -0,0 +1,127 @@
+from PySide2.QtCore import QModelIndex, QRect, Qt
+from PySide2.QtGui import QIcon, QPainter
+from PySide2.QtWidgets import QAbstractItemView, QApplication, QStyle, \
+    QStyledItemDelegate, QStyleOptionViewItem
+
+from .ledIndicator import LedIndicator, LedIndicatorColor
+
+
+class LedDelegate(QStyledItemDelegate):
+    """
+    The item view delegate painting a LED indicator in the cells.
+
+    The LED role data is either the LED state, painted with the default
+    color, or a (state, color) pair, the color being any color accepted by
+    LedIndicator. The cells without LED role data are painted as usual. The
+    LEDs are rendered without any widget and shared with the indicators
+    through the LED render cache, so painting a cell is a single blit. The
+    view only paints the visible cells and repaints the cells reported by
+    dataChanged, so a cell is painted again only when its LED changed or it
+    is scrolled into view.
+    """
+    def __init__(self, view: QAbstractItemView, ledRole: int = Qt.UserRole,
+                 defaultColor: object = LedIndicatorColor.GRN) -> None:
+        """
+        Constructor.
+
+        Params:
+            view:               The item view the delegate paints for.
+            ledRole:            The model role holding the LED state.
+            defaultColor:       The color of the LEDs given by their state
+                                only.
+        """
+        super().__init__(view)
+        self._view = view
+        self._ledRole = ledRole
+        self._defaultColor = defaultColor
+
+    def _getLedState(self, index: QModelIndex) -> tuple:
+        """
+        Get the LED state of a cell.
+
+        Params:
+            index:              The cell index.
+
+        Return
+            The LED state and color, None if the cell has no LED.
+        """
+        data = index.data(self._ledRole)
+        if data is None:
+            return None
+        if isinstance(data, (tuple, list)):
+            isOn, color = data
+            return bool(isOn), color
+        return bool(data), self._defaultColor
+
+    def getLedRole(self) -> int:
+        """
+        Get the LED role.
+
+        Return
+            The model role holding the LED state.
+        """
+        return self._ledRole
+
+    def setLedRole(self, ledRole: int) -> None:
+        """
+        Set the LED role.
+
+        Params:
+            ledRole:            The model role holding the LED state.
+        """
+        self._ledRole = ledRole
+        self._view.viewport().update()
+
+    def getDefaultColor(self) -> object:
+        """
+        Get the default color.
+
+        Return
+            The color of the LEDs given by their state only.
+        """
+        return self._defaultColor
+
+    def setDefaultColor(self, color: object) -> None:
+        """
+        Set the default color.
+
+        Params:
+            color:              The color of the LEDs given by their state
+                                only.
+        """
+        self._defaultColor = color
+        self._view.viewport().update()
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem,
+              index: QModelIndex) -> None:
+        """
+        Paint a cell. A LED cell shows its background and the LED, centered
+        and as large as the cell allows, instead of its content.
+
+        Params:
+            painter:            The painter.
+            option:             The cell style options.
+            index:              The cell index.
+        """
+        ledState = self._getLedState(index)
+        if ledState is None:
+            super().paint(painter, option, index)
+            return
+        cellOption = QStyleOptionViewItem(option)
+        self.initStyleOption(cellOption, index)
+        cellOption.text = ''
+        cellOption.icon = QIcon()
+        widget = cellOption.widget
+        style = widget.style() if widget is not None else \
+            QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, cellOption, painter, widget)
+        rect = option.rect
+        size = min(rect.width(), rect.height())
+        if size <= 0:
+            return
+        isOn, color = ledState
+        pixmap = LedIndicator.getRenderedPixmap(
+            color, isOn, size, size, painter.device().devicePixelRatioF())
+        ledRect = QRect(0, 0, size, size)
+        ledRect.moveCenter(rect.center())
+        painter.drawPixmap(ledRect.topLeft(), pixmap)
@@ -1,63 +1,129 @@
-from enum import Enum
+import math
+from collections import OrderedDict
 
-from PySide2.QtCore import QPointF, Qt
+from PySide2.QtCore import QEvent, QPointF, Qt, QTimer
 from PySide2.QtGui import QBrush, QColor, QPainter, QPaintEvent, QPen, \
-    QRadialGradient, QResizeEvent
+    QPixmap, QRadialGradient, QResizeEvent
 from PySide2.QtWidgets import QAbstractButton, QWidget
 
-
-class LedIndicatorColor(dict, Enum):
-    """
-    The led indicator colors.
-    """
-    GRN = {'onColor1': {'r': 0, 'g': 255, 'b': 0},
-           'onColor2': {'r': 0, 'g': 192, 'b': 0},
-           'offColor1': {'r': 0, 'g': 28, 'b': 0},
-           'offColor2': {'r': 0, 'g': 128, 'b': 0}}
-    RED = {'onColor1': {'r': 255, 'g': 0, 'b': 0},
-           'onColor2': {'r': 192, 'g': 0, 'b': 0},
-           'offColor1': {'r': 28, 'g': 0, 'b': 0},
-           'offColor2': {'r': 128, 'g': 0, 'b': 0}}
-    BLU = {'onColor1': {'r': 0, 'g': 0, 'b': 255},
-           'onColor2': {'r': 0, 'g': 0, 'b': 192},
-           'offColor1': {'r': 0, 'g': 0, 'b': 28},
-           'offColor2': {'r': 0, 'g': 0, 'b': 128}}
-    YEL = {'onColor1': {'r': 255, 'g': 255, 'b': 0},
-           'onColor2': {'r': 192, 'g': 192, 'b': 0},
-           'offColor1': {'r': 28, 'g': 28, 'b': 0},
-           'offColor2': {'r': 128, 'g': 128, 'b': 0}}
+from .ledIndicatorColor import LedIndicatorColor
+from .ledPalette import LedPalette
+from .ledRenderCache import LedRenderCache
 
 
 class LedIndicator(QAbstractButton):
+    """
+    The LED indicator.
+
+    The checked state and the toggled signal always follow the changes at
+    once, however they are made, but the painted state is refreshed at most
+    at the maximum refresh rate, when one is set for the indicator or for
+    every indicator by the class default. The first change after an idle
+    interval is painted at once, the changes made during the following
+    interval are merged and the final state is painted when it ends, so a
+    flapping state is not painted more often than the refresh rate and the
+    last state is always painted. In the latched mode, a pulse merged away
+    in an interval is still painted for one interval before the final state.
+    """
     scaledSize = 1000.0
+    defaultMaxRefreshRate = 0.0
+    defaultLatched = False
+    ledBrushCacheSize = 256
+    _center = QPointF(0, 0)
+    _pen = None
+    _borderBrushes = None
+    _ledBrushCache = OrderedDict()
 
     def __init__(self, parent: QWidget = None,
-                 color: LedIndicatorColor = LedIndicatorColor.GRN) -> None:
+                 color: object = LedIndicatorColor.GRN) -> None:
         """
         Constructor.
 
         Params:
             parent:         The widget parent.
-            color:          The indicator color.
+            color:          The indicator color, a LedIndicatorColor scheme,
+                            a LedPalette, a base QColor or a base (red,
+                            green, blue) tuple.
         """
         QAbstractButton.__init__(self, parent)
 
         self.setMinimumSize(24, 24)
         self.setCheckable(True)
-        self._onColor1 = QColor(color.value['onColor1']['r'],
-                                color.value['onColor1']['g'],
-                                color.value['onColor1']['b'])
-        self._onColor2 = QColor(color.value['onColor2']['r'],
-                                color.value['onColor2']['g'],
-                                color.value['onColor2']['b'])
-        self._offColor1 = QColor(color.value['offColor1']['r'],
-                                 color.value['offColor1']['g'],
-                                 color.value['offColor1']['b'])
-        self._offColor2 = QColor(color.value['offColor2']['r'],
-                                 color.value['offColor2']['g'],
-                                 color.value['offColor2']['b'])
-
-    def _drawBorder(self, painter: QPainter, isExternal: bool) -> None:
+        self._palette = LedPalette.get(color)
+        self._pixmap = None
+        self._pixmapKey = None
+        self._maxRefreshRate = None
+        self._isLatched = None
+        self._refreshTimer = None
+        self._paintedState = False
+        self._isPulsed = False
+
+    @staticmethod
+    def _createGradientBrush(gradPoint: int, color1: QColor,
+                             color2: QColor) -> QBrush:
+        """
+        Create a radial gradient brush lit from the given point.
+
+        Params:
+            gradPoint:      The gradient center and focal coordinate.
+            color1:         The gradient center color.
+            color2:         The gradient outer color.
+
+        Return
+            The gradient brush.
+        """
+        gradient = QRadialGradient(QPointF(gradPoint, gradPoint), 1500,
+                                   QPointF(gradPoint, gradPoint))
+        gradient.setColorAt(0, color1)
+        gradient.setColorAt(1, color2)
+        return QBrush(gradient)
+
+    @classmethod
+    def _initPaintObjects(cls) -> None:
+        """
+        Initialize the pen and border brushes shared by every indicator on
+        first use, so the painting does not allocate them anymore.
+        """
+        if cls._pen is None:
+            cls._pen = QPen(Qt.black)
+            cls._pen.setWidth(1)
+            cls._borderBrushes = \
+                {True: cls._createGradientBrush(-500, QColor(224, 224, 224),
+                                                QColor(28, 28, 28)),
+                 False: cls._createGradientBrush(500, QColor(224, 224, 224),
+                                                 QColor(28, 28, 28))}
+
+    @classmethod
+    def _getLedBrushes(cls, palette: LedPalette) -> dict:
+        """
+        Get the LED brushes of a palette, shared by the indicators of the
+        same color and created on first use. Only the brushes of the most
+        recently used palettes are kept, so drawing LEDs of arbitrary colors
+        does not grow the cache without bound.
+
+        Params:
+            palette:        The indicator palette.
+
+        Return
+            The LED brush by checked state.
+        """
+        paletteKey = palette.getKey()
+        ledBrushes = cls._ledBrushCache.get(paletteKey)
+        if ledBrushes is None:
+            ledBrushes = \
+                {True: cls._createGradientBrush(-500,
+                                                *palette.getOnColors()),
+                 False: cls._createGradientBrush(500,
+                                                 *palette.getOffColors())}
+            cls._ledBrushCache[paletteKey] = ledBrushes
+            if len(cls._ledBrushCache) > cls.ledBrushCacheSize:
+                cls._ledBrushCache.popitem(last=False)
+        else:
+            cls._ledBrushCache.move_to_end(paletteKey)
+        return ledBrushes
+
+    @classmethod
+    def _drawBorder(cls, painter: QPainter, isExternal: bool) -> None:
         """
         Draw the indicator borders.
 
@@ -66,49 +132,288 @@ class LedIndicator(QAbstractButton):
             isExternal:     The external/internal border flag.
         """
         if isExternal:
-            gradPoint = -500
             ellipseSize = 500
         else:
-            gradPoint = 500
             ellipseSize = 450
-        gradient = QRadialGradient(QPointF(gradPoint, gradPoint), 1500,
-                                   QPointF(gradPoint, gradPoint))
-        gradient.setColorAt(0, QColor(224, 224, 224))
-        gradient.setColorAt(1, QColor(28, 28, 28))
-        painter.setBrush(QBrush(gradient))
-        painter.drawEllipse(QPointF(0, 0), ellipseSize, ellipseSize)
+        painter.setBrush(cls._borderBrushes[isExternal])
+        painter.drawEllipse(cls._center, ellipseSize, ellipseSize)
 
-    def _drawLed(self, painter: QPainter) -> None:
+    @classmethod
+    def _drawLed(cls, painter: QPainter, palette: LedPalette,
+                 isChecked: bool) -> None:
         """
         Draw the LED.
 
         Params:
             painter:        The Qt painter.
+            palette:        The indicator palette.
+            isChecked:      The indicator checked state.
         """
-        if self.isChecked():
-            gradPoint = -500
-            color1 = self._onColor1
-            color2 = self._onColor2
-        else:
-            gradPoint = 500
-            color1 = self._offColor1
-            color2 = self._offColor2
+        painter.setBrush(cls._getLedBrushes(palette)[isChecked])
+        painter.drawEllipse(cls._center, 400, 400)
 
-        gradient = QRadialGradient(QPointF(gradPoint, gradPoint), 1500,
-                                   QPointF(gradPoint, gradPoint))
-        gradient.setColorAt(0, color1)
-        gradient.setColorAt(1, color2)
-        painter.setBrush(gradient)
-        painter.drawEllipse(QPointF(0, 0), 400, 400)
+    @classmethod
+    def _drawIndicator(cls, painter: QPainter, palette: LedPalette,
+                       isChecked: bool, width: int, height: int) -> None:
+        """
+        Draw the whole indicator.
+
+        Params:
+            painter:        The Qt painter.
+            palette:        The indicator palette.
+            isChecked:      The indicator checked state.
+            width:          The indicator width.
+            height:         The indicator height.
+        """
+        cls._initPaintObjects()
+        realSize = min(width, height)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(width / 2, height / 2)
+        painter.scale(realSize / cls.scaledSize, realSize / cls.scaledSize)
+        painter.setPen(cls._pen)
+        cls._drawBorder(painter, True)
+        cls._drawBorder(painter, False)
+        cls._drawLed(painter, palette, isChecked)
+
+    @classmethod
+    def _renderPixmap(cls, palette: LedPalette, isChecked: bool, width: int,
+                      height: int, devicePixelRatio: float) -> QPixmap:
+        """
+        Render an indicator in a pixmap matching the device pixel ratio.
+
+        Params:
+            palette:            The indicator palette.
+            isChecked:          The indicator checked state.
+            width:              The indicator width.
+            height:             The indicator height.
+            devicePixelRatio:   The device pixel ratio.
+
+        Return
+            The rendered indicator.
+        """
+        pixmap = QPixmap(math.ceil(width * devicePixelRatio),
+                         math.ceil(height * devicePixelRatio))
+        pixmap.setDevicePixelRatio(devicePixelRatio)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        cls._drawIndicator(painter, palette, isChecked, width, height)
+        painter.end()
+        return pixmap
+
+    @staticmethod
+    def _getPixmapKey(palette: LedPalette, isChecked: bool, width: int,
+                      height: int, devicePixelRatio: float) -> tuple:
+        """
+        Get the key identifying a rendered indicator.
+
+        Params:
+            palette:            The indicator palette.
+            isChecked:          The indicator checked state.
+            width:              The indicator width.
+            height:             The indicator height.
+            devicePixelRatio:   The device pixel ratio.
+
+        Return
+            The rendered indicator key.
+        """
+        return (palette.getKey(), isChecked, width, height, devicePixelRatio)
+
+    @classmethod
+    def getRenderedPixmap(cls, color: object, isChecked: bool, width: int,
+                          height: int, devicePixelRatio: float) -> QPixmap:
+        """
+        Get a rendered indicator from the shared render cache, rendering it
+        only if no indicator nor view already did it for the same look. No
+        widget is needed, so the views drawing many LEDs use it directly.
+
+        Params:
+            color:              The indicator color, any color accepted by
+                                the constructor.
+            isChecked:          The indicator checked state.
+            width:              The indicator width.
+            height:             The indicator height.
+            devicePixelRatio:   The device pixel ratio.
+
+        Return
+            The rendered indicator.
+        """
+        palette = LedPalette.get(color)
+        pixmapKey = cls._getPixmapKey(palette, isChecked, width, height,
+                                      devicePixelRatio)
+        cache = LedRenderCache.instance()
+        pixmap = cache.get(pixmapKey)
+        if pixmap is None:
+            pixmap = cls._renderPixmap(palette, isChecked, width, height,
+                                       devicePixelRatio)
+            cache.insert(pixmapKey, pixmap)
+        return pixmap
+
+    def _getPixmap(self) -> QPixmap:
+        """
+        Get the rendered indicator in its painted state. When its size,
+        painted state or device pixel ratio changed, it is fetched from the
+        shared render cache and only rendered if no other indicator already
+        did it for the same look.
+
+        Return
+            The rendered indicator.
+        """
+        width = self.width()
+        height = self.height()
+        devicePixelRatio = self.devicePixelRatioF()
+        isChecked = self._paintedState
+        pixmapKey = self._getPixmapKey(self._palette, isChecked, width,
+                                       height, devicePixelRatio)
+        if pixmapKey != self._pixmapKey:
+            self._pixmap = self.getRenderedPixmap(self._palette, isChecked,
+                                                  width, height,
+                                                  devicePixelRatio)
+            self._pixmapKey = pixmapKey
+        return self._pixmap
+
+    def _invalidatePixmap(self) -> None:
+        """
+        Release the rendered indicator.
+        """
+        self._pixmap = None
+        self._pixmapKey = None
+
+    def _startRefreshInterval(self) -> None:
+        """
+        Start a refresh interval, during which the state changes are merged.
+        """
+        if self._refreshTimer is None:
+            self._refreshTimer = QTimer(self)
+            self._refreshTimer.setSingleShot(True)
+            self._refreshTimer.timeout.connect(self._onRefreshTimeout)
+        self._refreshTimer.start(round(1000 / self.getMaxRefreshRate()))
+
+    def _paintState(self, isChecked: bool) -> None:
+        """
+        Set the painted state and request its repaint.
+
+        Params:
+            isChecked:      The painted checked state.
+        """
+        self._paintedState = isChecked
+        self.update()
+
+    def _onRefreshTimeout(self) -> None:
+        """
+        Refresh interval end handler, paints the merged state. In the latched
+        mode, a pulse merged back to the painted state is painted first and
+        the checked state is painted at the end of the next interval.
+        """
+        isPulsed = self._isPulsed
+        self._isPulsed = False
+        if self.isChecked() != self._paintedState:
+            self._paintState(self.isChecked())
+            self._startRefreshInterval()
+        elif isPulsed and self.isLatched():
+            self._paintState(not self._paintedState)
+            self._startRefreshInterval()
+
+    def checkStateSet(self) -> None:
+        """
+        Checked state set handler, called by Qt whenever the checked state
+        is set, by a click or with the signals blocked too. Paints the
+        checked state, merging the changes made faster than the maximum
+        refresh rate.
+        """
+        isChecked = self.isChecked()
+        if isChecked == self._paintedState:
+            return
+        if self._refreshTimer is not None and self._refreshTimer.isActive():
+            self._isPulsed = True
+            return
+        self._paintState(isChecked)
+        if self.getMaxRefreshRate() > 0:
+            self._startRefreshInterval()
+
+    def getPalette(self) -> LedPalette:
+        """
+        Get the indicator palette.
+
+        Return
+            The interned palette of the indicator color.
+        """
+        return self._palette
+
+    def getMaxRefreshRate(self) -> float:
+        """
+        Get the maximum refresh rate.
+
+        Return
+            The maximum refresh rate in Hz, the class default if not set for
+            the indicator, 0 if not limited.
+        """
+        if self._maxRefreshRate is None:
+            return self.defaultMaxRefreshRate
+        return self._maxRefreshRate
+
+    def setMaxRefreshRate(self, rate: float) -> None:
+        """
+        Set the maximum refresh rate of the indicator. The checked state is
+        painted at once when the refresh rate is no longer limited.
+
+        Params:
+            rate:           The maximum refresh rate in Hz, 0 to not limit
+                            it, None to use the class default.
+        """
+        if rate is not None and rate < 0:
+            raise ValueError(f"Invalid maximum refresh rate: {rate}")
+        self._maxRefreshRate = rate
+        if self.getMaxRefreshRate() <= 0 and self._refreshTimer is not None:
+            self._refreshTimer.stop()
+            self._isPulsed = False
+            if self._paintedState != self.isChecked():
+                self._paintState(self.isChecked())
+
+    def isLatched(self) -> bool:
+        """
+        Get the latched mode.
+
+        Return
+            True if a merged pulse is shown for one interval, the class
+            default if not set for the indicator.
+        """
+        if self._isLatched is None:
+            return self.defaultLatched
+        return self._isLatched
+
+    def setLatched(self, isLatched: bool) -> None:
+        """
+        Set the latched mode of the indicator.
+
+        Params:
+            isLatched:      True to show a merged pulse for one interval,
+                            None to use the class default.
+        """
+        self._isLatched = isLatched
+
+    def event(self, event: QEvent) -> bool:
+        """
+        Event handler, invalidates the rendered indicator on a screen change.
+
+        Params:
+            event:          The Qt event.
+
+        Return
+            True if the event was recognized, false otherwise.
+        """
+        if event.type() == QEvent.ScreenChangeInternal:
+            self._invalidatePixmap()
+            self.update()
+        return QAbstractButton.event(self, event)
 
     def resizeEvent(self, event: QResizeEvent) -> None:
         """
-        Resize event handler.
+        Resize event handler. Qt repaints the resized indicator on its own.
 
         Params:
             event:          The Qt resize event.
         """
-        self.update()
+        self._invalidatePixmap()
 
     def paintEvent(self, event: QPaintEvent) -> None:
         """
@@ -117,14 +422,5 @@ class LedIndicator(QAbstractButton):
         Params:
             event:          The Qt paint event.
         """
-        realSize = min(self.width(), self.height())
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.translate(self.width() / 2, self.height() / 2)
-        painter.scale(realSize / self.scaledSize, realSize / self.scaledSize)
-        pen = QPen(Qt.black)
-        pen.setWidth(1)
-        painter.setPen(pen)
-        self._drawBorder(painter, True)
-        self._drawBorder(painter, False)
-        self._drawLed(painter)
+        painter.drawPixmap(0, 0, self._getPixmap())
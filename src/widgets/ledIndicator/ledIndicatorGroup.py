@@ -0,0 +1,120 @@
+from functools import partial
+
+from PySide2.QtCore import QObject, Signal
+
+from .ledIndicator import LedIndicator
+
+
+class LedIndicatorGroup(QObject):
+    """
+    The group of LED indicators updated in bulk.
+
+    The group keeps the states of its indicators, so a bulk update is diffed
+    against them without querying every indicator, and only the changed
+    indicators are set. Their own toggled signal is blocked during a bulk
+    update and a single statesChanged signal lists the changed indices
+    instead. Their repaints are only requested during the update and Qt
+    paints them all in the next paint pass. An indicator toggled on its own,
+    by a click for example, is reported by statesChanged too.
+    """
+    statesChanged = Signal(list)
+
+    def __init__(self, leds: list = (), parent: QObject = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            leds:           The indicators of the group.
+            parent:         The group parent.
+        """
+        super().__init__(parent)
+        self._leds = []
+        self._states = []
+        for led in leds:
+            self.addLed(led)
+
+    def _onLedToggled(self, idx: int, isChecked: bool) -> None:
+        """
+        Indicator toggled handler.
+
+        Params:
+            idx:            The indicator index in the group.
+            isChecked:      The indicator new state.
+        """
+        self._states[idx] = isChecked
+        self.statesChanged.emit([idx])
+
+    def addLed(self, led: LedIndicator) -> int:
+        """
+        Add an indicator to the group.
+
+        Params:
+            led:            The indicator to add.
+
+        Return
+            The indicator index in the group.
+        """
+        idx = len(self._leds)
+        self._leds.append(led)
+        self._states.append(led.isChecked())
+        led.toggled.connect(partial(self._onLedToggled, idx))
+        return idx
+
+    def getLeds(self) -> list:
+        """
+        Get the indicators of the group.
+
+        Return
+            The list of indicators, by index.
+        """
+        return list(self._leds)
+
+    def getLedCount(self) -> int:
+        """
+        Get the indicator count.
+
+        Return
+            The number of indicators in the group.
+        """
+        return len(self._leds)
+
+    def getStates(self) -> list:
+        """
+        Get the indicator states.
+
+        Return
+            The list of indicator states, by index.
+        """
+        return list(self._states)
+
+    def setStates(self, states: list) -> list:
+        """
+        Set every indicator state in a single pass. The unchanged indicators
+        are skipped and the changed ones do not emit their toggled signal,
+        a single statesChanged signal is emitted instead.
+
+        Params:
+            states:         The sequence or array of indicator states, by
+                            index.
+
+        Return
+            The list of changed indices.
+        """
+        if len(states) != len(self._leds):
+            raise ValueError(f"Invalid LED state count: {len(states)}, "
+                             f"expected {len(self._leds)}")
+        if hasattr(states, 'tolist'):
+            states = states.tolist()
+        changedIndices = [idx for idx, (isOn, wasOn)
+                          in enumerate(zip(states, self._states))
+                          if bool(isOn) != wasOn]
+        for idx in changedIndices:
+            isOn = not self._states[idx]
+            led = self._leds[idx]
+            wasBlocked = led.blockSignals(True)
+            led.setChecked(isOn)
+            led.blockSignals(wasBlocked)
+            self._states[idx] = isOn
+        if changedIndices:
+            self.statesChanged.emit(changedIndices)
+        return changedIndices
@@ -0,0 +1,301 @@
+from PySide2.QtCore import QPoint, QRect, QSize, Qt, Signal
+from PySide2.QtGui import QMouseEvent, QPainter, QPaintEvent, QResizeEvent
+from PySide2.QtWidgets import QWidget
+
+from .ledIndicator import LedIndicator, LedIndicatorColor
+from .ledPalette import LedPalette
+
+try:
+    import numpy as np
+except ImportError:                                 # pragma: no cover
+    np = None
+
+
+class LedMatrix(QWidget):
+    """
+    The grid of LED indicators drawn by a single widget.
+
+    The LED states are held in a NumPy uint8 array indexed by [row][column].
+    A state update is diffed against the current states in one vectorized
+    step and only the changed cells are repainted. The LEDs are rendered
+    without any widget and shared with the indicators through the LED render
+    cache, so painting a cell is a single blit. The cells are square and
+    laid out on a regular grid centered in the widget, so a position maps to
+    its cell in constant time.
+    """
+    cellClicked = Signal(int, int)
+    defaultCellSize = 24
+    minCellSize = 4
+    fullRepaintRatio = 0.25
+
+    def __init__(self, rowCount: int, columnCount: int,
+                 parent: QWidget = None,
+                 color: object = LedIndicatorColor.GRN) -> None:
+        """
+        Constructor.
+
+        Params:
+            rowCount:       The LED row count.
+            columnCount:    The LED column count.
+            parent:         The widget parent.
+            color:          The LED color, any color accepted by
+                            LedIndicator.
+        """
+        if np is None:
+            raise RuntimeError('NumPy is required by the LED matrix.')
+        if rowCount <= 0 or columnCount <= 0:
+            raise ValueError(f"Invalid LED matrix shape: {rowCount}x"
+                             f"{columnCount}")
+        super().__init__(parent)
+        self._states = np.zeros((rowCount, columnCount), dtype=np.uint8)
+        self._palette = LedPalette.get(color)
+        self._cellSize = 1
+        self._origin = QPoint(0, 0)
+        self._pixmaps = None
+        self._pixmapsKey = None
+        self._pressedCell = None
+        self.setMinimumSize(columnCount * self.minCellSize,
+                            rowCount * self.minCellSize)
+        self._updateGeometry()
+
+    def _updateGeometry(self) -> None:
+        """
+        Update the cell size and the grid origin to fit the widget.
+        """
+        rowCount, columnCount = self._states.shape
+        self._cellSize = max(1, min(self.width() // columnCount,
+                                    self.height() // rowCount))
+        self._origin = QPoint((self.width() - self._cellSize * columnCount)
+                              // 2,
+                              (self.height() - self._cellSize * rowCount)
+                              // 2)
+
+    def _getPixmaps(self) -> dict:
+        """
+        Get the rendered LEDs, fetching them again only when the cell size
+        or the device pixel ratio changed.
+
+        Return
+            The rendered LED by state.
+        """
+        devicePixelRatio = self.devicePixelRatioF()
+        pixmapsKey = (self._cellSize, devicePixelRatio)
+        if pixmapsKey != self._pixmapsKey:
+            self._pixmaps = {isOn: LedIndicator.getRenderedPixmap(
+                self._palette, isOn, self._cellSize, self._cellSize,
+                devicePixelRatio) for isOn in (False, True)}
+            self._pixmapsKey = pixmapsKey
+        return self._pixmaps
+
+    def _repaintCells(self, cells: 'np.ndarray') -> None:
+        """
+        Request the repaint of the given cells only. The whole matrix is
+        repainted when too many cells changed for a partial repaint to pay
+        off.
+
+        Params:
+            cells:          The (row, column) array of the changed cells.
+        """
+        if len(cells) == 0:
+            return
+        if len(cells) > self._states.size * self.fullRepaintRatio:
+            self.update()
+            return
+        size = self._cellSize
+        xs = cells[:, 1] * size + self._origin.x()
+        ys = cells[:, 0] * size + self._origin.y()
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            self.update(x, y, size, size)
+
+    def _getDirtyCells(self, event: QPaintEvent) -> 'np.ndarray':
+        """
+        Get the cells overlapping the repainted region.
+
+        Params:
+            event:          The Qt paint event.
+
+        Return
+            The (row, column) array of the cells to paint.
+        """
+        rowCount, columnCount = self._states.shape
+        size = self._cellSize
+        mask = np.zeros(self._states.shape, dtype=bool)
+        for rect in event.region().rects():
+            rect = rect.translated(-self._origin.x(), -self._origin.y())
+            firstRow = max(0, rect.top() // size)
+            lastRow = min(rowCount, rect.bottom() // size + 1)
+            firstColumn = max(0, rect.left() // size)
+            lastColumn = min(columnCount, rect.right() // size + 1)
+            mask[firstRow:lastRow, firstColumn:lastColumn] = True
+        return np.argwhere(mask)
+
+    def getRowCount(self) -> int:
+        """
+        Get the row count.
+
+        Return
+            The LED row count.
+        """
+        return self._states.shape[0]
+
+    def getColumnCount(self) -> int:
+        """
+        Get the column count.
+
+        Return
+            The LED column count.
+        """
+        return self._states.shape[1]
+
+    def getStates(self) -> 'np.ndarray':
+        """
+        Get the LED states.
+
+        Return
+            A copy of the uint8 states array indexed by [row][column].
+        """
+        return self._states.copy()
+
+    def setStates(self, states: 'np.ndarray') -> 'np.ndarray':
+        """
+        Set every LED state. The new states are diffed against the current
+        ones and only the changed cells are repainted.
+
+        Params:
+            states:         The states array indexed by [row][column], any
+                            non-zero value being on.
+
+        Return
+            The (row, column) array of the changed cells.
+        """
+        states = np.asarray(states)
+        if states.shape != self._states.shape:
+            raise ValueError(f"Invalid LED states shape: {states.shape}, "
+                             f"expected {self._states.shape}")
+        states = (states != 0).astype(np.uint8)
+        changedCells = np.argwhere(states != self._states)
+        self._states = states
+        self._repaintCells(changedCells)
+        return changedCells
+
+    def getState(self, row: int, column: int) -> bool:
+        """
+        Get a LED state.
+
+        Params:
+            row:            The LED row.
+            column:         The LED column.
+
+        Return
+            True if the LED is on, false otherwise.
+        """
+        return bool(self._states[row, column])
+
+    def setState(self, row: int, column: int, isOn: bool) -> None:
+        """
+        Set a LED state, repainting its cell if it changed.
+
+        Params:
+            row:            The LED row.
+            column:         The LED column.
+            isOn:           The LED state.
+        """
+        if bool(self._states[row, column]) == isOn:
+            return
+        self._states[row, column] = isOn
+        self.update(self.getCellRect(row, column))
+
+    def getCellRect(self, row: int, column: int) -> QRect:
+        """
+        Get the rectangle of a cell.
+
+        Params:
+            row:            The LED row.
+            column:         The LED column.
+
+        Return
+            The cell rectangle in widget coordinates.
+        """
+        return QRect(self._origin.x() + column * self._cellSize,
+                     self._origin.y() + row * self._cellSize,
+                     self._cellSize, self._cellSize)
+
+    def indexAt(self, pos: QPoint) -> tuple:
+        """
+        Get the cell at a position, in constant time.
+
+        Params:
+            pos:            The position in widget coordinates.
+
+        Return
+            The (row, column) of the cell, None if the position is outside
+            the grid.
+        """
+        row = (pos.y() - self._origin.y()) // self._cellSize
+        column = (pos.x() - self._origin.x()) // self._cellSize
+        rowCount, columnCount = self._states.shape
+        if 0 <= row < rowCount and 0 <= column < columnCount:
+            return row, column
+        return None
+
+    def sizeHint(self) -> QSize:
+        """
+        Get the size hint.
+
+        Return
+            The size showing every LED at the default cell size.
+        """
+        rowCount, columnCount = self._states.shape
+        return QSize(columnCount * self.defaultCellSize,
+                     rowCount * self.defaultCellSize)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """
+        Mouse press event handler.
+
+        Params:
+            event:          The Qt mouse event.
+        """
+        if event.button() == Qt.LeftButton:
+            self._pressedCell = self.indexAt(event.pos())
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """
+        Mouse release event handler, reports a click released on the cell it
+        was pressed on.
+
+        Params:
+            event:          The Qt mouse event.
+        """
+        if event.button() != Qt.LeftButton:
+            return
+        cell = self.indexAt(event.pos())
+        if cell is not None and cell == self._pressedCell:
+            self.cellClicked.emit(*cell)
+        self._pressedCell = None
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """
+        Resize event handler. Qt repaints the resized matrix on its own.
+
+        Params:
+            event:          The Qt resize event.
+        """
+        self._updateGeometry()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """
+        Paint event handler, paints the cells of the repainted region only.
+
+        Params:
+            event:          The Qt paint event.
+        """
+        pixmaps = self._getPixmaps()
+        size = self._cellSize
+        cells = self._getDirtyCells(event)
+        xs = cells[:, 1] * size + self._origin.x()
+        ys = cells[:, 0] * size + self._origin.y()
+        states = self._states[cells[:, 0], cells[:, 1]] != 0
+        painter = QPainter(self)
+        for x, y, isOn in zip(xs.tolist(), ys.tolist(), states.tolist()):
+            painter.drawPixmap(x, y, pixmaps[isOn])
@@ -0,0 +1,162 @@
+from enum import Enum
+
+from PySide2.QtGui import QColor
+
+
+class LedPalette:
+    """
+    The interned LED color palette.
+
+    A palette holds the on and off gradient colors of a LED, either given by
+    a LedIndicatorColor scheme or derived from any base RGB color with the
+    shade ratios of the built-in schemes. The palettes are interned by their
+    colors, so every LED of the same color shares one palette object, and
+    are immutable: the getters return copies of the colors. The palette of a
+    scheme or of a base color is found with a single dictionary lookup once
+    created, so constructing many LEDs costs nothing for their colors.
+    """
+    onShade2 = 192 / 255
+    offShade1 = 28 / 255
+    offShade2 = 128 / 255
+    _palettes = {}
+    _colorPalettes = {}
+    _schemePalettes = {}
+
+    def __init__(self, onColor1: QColor, onColor2: QColor,
+                 offColor1: QColor, offColor2: QColor) -> None:
+        """
+        Constructor, use the get, fromRgb or fromScheme class methods to get
+        an interned palette instead.
+
+        Params:
+            onColor1:       The on gradient center color.
+            onColor2:       The on gradient outer color.
+            offColor1:      The off gradient center color.
+            offColor2:      The off gradient outer color.
+        """
+        self._onColor1 = QColor(onColor1)
+        self._onColor2 = QColor(onColor2)
+        self._offColor1 = QColor(offColor1)
+        self._offColor2 = QColor(offColor2)
+        self._key = (self._onColor1.rgba(), self._onColor2.rgba(),
+                     self._offColor1.rgba(), self._offColor2.rgba())
+
+    @classmethod
+    def _intern(cls, onColor1: QColor, onColor2: QColor, offColor1: QColor,
+                offColor2: QColor) -> 'LedPalette':
+        """
+        Get the interned palette of the given colors, creating it on first
+        use.
+
+        Params:
+            onColor1:       The on gradient center color.
+            onColor2:       The on gradient outer color.
+            offColor1:      The off gradient center color.
+            offColor2:      The off gradient outer color.
+
+        Return
+            The interned palette.
+        """
+        key = (onColor1.rgba(), onColor2.rgba(), offColor1.rgba(),
+               offColor2.rgba())
+        palette = cls._palettes.get(key)
+        if palette is None:
+            palette = cls(onColor1, onColor2, offColor1, offColor2)
+            cls._palettes[key] = palette
+        return palette
+
+    @classmethod
+    def fromRgb(cls, red: int, green: int, blue: int) -> 'LedPalette':
+        """
+        Get the palette derived from a base color, the on gradient center
+        color, the other colors being its shades.
+
+        Params:
+            red:            The base color red component.
+            green:          The base color green component.
+            blue:           The base color blue component.
+
+        Return
+            The interned palette.
+        """
+        rgb = (red, green, blue)
+        palette = cls._colorPalettes.get(rgb)
+        if palette is None:
+            if not all(0 <= component <= 255 for component in rgb):
+                raise ValueError(f"Invalid LED base color: {rgb}")
+            shades = [QColor(*(round(component * ratio)
+                               for component in rgb))
+                      for ratio in (1, cls.onShade2, cls.offShade1,
+                                    cls.offShade2)]
+            palette = cls._intern(*shades)
+            cls._colorPalettes[rgb] = palette
+        return palette
+
+    @classmethod
+    def fromScheme(cls, scheme: Enum) -> 'LedPalette':
+        """
+        Get the palette of a LedIndicatorColor scheme.
+
+        Params:
+            scheme:         The color scheme.
+
+        Return
+            The interned palette.
+        """
+        palette = cls._schemePalettes.get(id(scheme))
+        if palette is None:
+            colors = [QColor(scheme.value[name]['r'], scheme.value[name]['g'],
+                             scheme.value[name]['b'])
+                      for name in ('onColor1', 'onColor2', 'offColor1',
+                                   'offColor2')]
+            palette = cls._intern(*colors)
+            cls._schemePalettes[id(scheme)] = palette
+        return palette
+
+    @classmethod
+    def get(cls, color: object) -> 'LedPalette':
+        """
+        Get the palette of any supported color.
+
+        Params:
+            color:          The palette itself, a LedIndicatorColor scheme,
+                            a base QColor or a base (red, green, blue)
+                            tuple.
+
+        Return
+            The interned palette.
+        """
+        if isinstance(color, LedPalette):
+            return color
+        if isinstance(color, Enum):
+            return cls.fromScheme(color)
+        if isinstance(color, QColor):
+            return cls.fromRgb(color.red(), color.green(), color.blue())
+        return cls.fromRgb(*color)
+
+    def getKey(self) -> tuple:
+        """
+        Get the key identifying the palette colors.
+
+        Return
+            The tuple of the on and off gradient colors RGBA values.
+        """
+        return self._key
+
+    def getOnColors(self) -> tuple:
+        """
+        Get the on gradient colors.
+
+        Return
+            Copies of the (center, outer) on gradient colors.
+        """
+        return QColor(self._onColor1), QColor(self._onColor2)
+
+    def getOffColors(self) -> tuple:
+        """
+        Get the off gradient colors.
+
+        Return
+            Copies of the (center, outer) off gradient colors.
+        """
+        return QColor(self._offColor1), QColor(self._offColor2)
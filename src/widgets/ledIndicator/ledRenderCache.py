@@ -0,0 +1,14 @@
+from ..common.pixmapCache import PixmapCache
+
+
+class LedRenderCache(PixmapCache):
+    """
+    The process wide cache of the rendered LED indicators.
+
+    The rendered indicators are stored by color scheme, checked state, size
+    and device pixel ratio, so every indicator with the same look shares the
+    same pixmap and painting it is a single blit. The least recently used
+    entries are evicted when the cache grows over its byte budget.
+    """
+    defaultByteBudget = 8 * 1024 * 1024
+    _instance = None
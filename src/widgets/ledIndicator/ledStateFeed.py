@@ -0,0 +1,201 @@
+import threading
+
+from PySide2.QtCore import QObject, QTimer, Signal
+
+from .ledIndicator import LedIndicator
+
+
+class LedStateFeed(QObject):
+    """
+    The thread-safe feed of LED state updates.
+
+    Any thread can push (LED ID, state) updates, they are stored under a
+    lock held just long enough to insert them, so a producer never waits on
+    the GUI. Only the latest state of each LED is kept until the next batch
+    and the older ones are counted as dropped. The batches are applied on
+    the thread owning the feed, the GUI thread, at most at the feed rate:
+    the first update of a batch wakes the feed up, which applies the batch
+    one rate interval later, so an idle feed does not tick. The updates of
+    the registered LEDs are applied to them and every batch is reported by
+    the batchApplied signal, for the LEDs the feed does not own.
+    """
+    batchApplied = Signal(dict)
+    _updatesPending = Signal()
+    defaultRate = 60.0
+
+    def __init__(self, rate: float = defaultRate,
+                 parent: QObject = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            rate:           The maximum batch rate in Hz.
+            parent:         The feed parent.
+        """
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._pendingStates = {}
+        self._leds = {}
+        self._receivedCount = 0
+        self._droppedCount = 0
+        self._appliedCount = 0
+        self._rate = rate
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._applyPending)
+        self._updatesPending.connect(self._scheduleApply)
+        self.setRate(rate)
+
+    def _scheduleApply(self) -> None:
+        """
+        Schedule the application of the pending updates, if not already
+        scheduled.
+        """
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _applyPending(self) -> None:
+        """
+        Apply the pending updates in a single batch.
+        """
+        with self._lock:
+            pendingStates = self._pendingStates
+            self._pendingStates = {}
+        if not pendingStates:
+            return
+        for ledId, isOn in pendingStates.items():
+            led = self._leds.get(ledId)
+            if led is not None:
+                led.setChecked(isOn)
+        self._appliedCount += len(pendingStates)
+        self.batchApplied.emit(pendingStates)
+
+    def addLed(self, ledId: object, led: LedIndicator) -> None:
+        """
+        Register an indicator, its updates are applied to it.
+
+        Params:
+            ledId:          The LED ID used by the updates.
+            led:            The indicator.
+        """
+        self._leds[ledId] = led
+
+    def removeLed(self, ledId: object) -> None:
+        """
+        Unregister an indicator.
+
+        Params:
+            ledId:          The LED ID used by the updates.
+        """
+        self._leds.pop(ledId, None)
+
+    def push(self, ledId: object, isOn: bool) -> None:
+        """
+        Push a LED state update, from any thread.
+
+        Params:
+            ledId:          The LED ID.
+            isOn:           The LED state.
+        """
+        with self._lock:
+            self._receivedCount += 1
+            isFirstUpdate = not self._pendingStates
+            if ledId in self._pendingStates:
+                self._droppedCount += 1
+            self._pendingStates[ledId] = bool(isOn)
+        if isFirstUpdate:
+            self._updatesPending.emit()
+
+    def pushMany(self, updates: list) -> None:
+        """
+        Push LED state updates, from any thread, taking the lock once.
+
+        Params:
+            updates:        The sequence of (LED ID, state) updates, in
+                            arrival order.
+        """
+        with self._lock:
+            isFirstUpdate = not self._pendingStates
+            for ledId, isOn in updates:
+                self._receivedCount += 1
+                if ledId in self._pendingStates:
+                    self._droppedCount += 1
+                self._pendingStates[ledId] = bool(isOn)
+            isFirstUpdate = isFirstUpdate and bool(self._pendingStates)
+        if isFirstUpdate:
+            self._updatesPending.emit()
+
+    def flush(self) -> None:
+        """
+        Apply the pending updates now, from the thread owning the feed.
+        """
+        self._timer.stop()
+        self._applyPending()
+
+    def getRate(self) -> float:
+        """
+        Get the batch rate.
+
+        Return
+            The maximum batch rate in Hz.
+        """
+        return self._rate
+
+    def setRate(self, rate: float) -> None:
+        """
+        Set the batch rate.
+
+        Params:
+            rate:           The maximum batch rate in Hz.
+        """
+        if rate <= 0:
+            raise ValueError(f"Invalid batch rate: {rate}")
+        self._rate = rate
+        self._timer.setInterval(round(1000 / rate))
+
+    def getPendingCount(self) -> int:
+        """
+        Get the pending update count.
+
+        Return
+            The number of LEDs waiting for the next batch.
+        """
+        with self._lock:
+            return len(self._pendingStates)
+
+    def getReceivedCount(self) -> int:
+        """
+        Get the received update count.
+
+        Return
+            The number of pushed updates.
+        """
+        return self._receivedCount
+
+    def getDroppedCount(self) -> int:
+        """
+        Get the dropped update count.
+
+        Return
+            The number of updates replaced by a later one of the same LED
+            before being applied.
+        """
+        return self._droppedCount
+
+    def getAppliedCount(self) -> int:
+        """
+        Get the applied update count.
+
+        Return
+            The number of updates applied in a batch.
+        """
+        return self._appliedCount
+
+    def resetCounters(self) -> None:
+        """
+        Reset the received, dropped and applied counters.
+        """
+        with self._lock:
+            self._receivedCount = 0
+            self._droppedCount = 0
+        self._appliedCount = 0
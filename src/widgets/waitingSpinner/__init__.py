@@ -1 +1,41 @@
-from .waitingSpinner import WaitingSpinner                      # noqa: F401
+from importlib import import_module
+
+_lazyAttributes = {'AnimationClock': '.animationClock',
+                   'FrameStats': '.frameStats',
+                   'SpinnerDelegate': '.spinnerDelegate',
+                   'SpinnerDrawList': '.spinnerDrawList',
+                   'SpinnerExporter': '.spinnerExporter',
+                   'SpinnerRenderCache': '.spinnerRenderCache',
+                   'WaitingSpinner': '.waitingSpinner'}
+
+__all__ = list(_lazyAttributes)
+
+
+def __getattr__(name: str) -> object:
+    """
+    Import a package attribute from its module on first access, so the
+    package import does not load Qt and only the used widgets are loaded.
+
+    Params:
+        name:           The attribute name.
+
+    Return
+        The attribute.
+    """
+    moduleName = _lazyAttributes.get(name)
+    if moduleName is None:
+        raise AttributeError(f"module {__name__!r} has no attribute "
+                             f"{name!r}")
+    attribute = getattr(import_module(moduleName, __name__), name)
+    globals()[name] = attribute
+    return attribute
+
+
+def __dir__() -> list:
+    """
+    List the package attributes, including the ones not imported yet.
+
+    Return
+        The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,125 @@
+from PySide2.QtCore import QElapsedTimer, QObject, QTimer
+from shiboken2 import isValid
+
+
+class AnimationClock(QObject):
+    """
+    The process wide animation clock.
+
+    All the registered spinners are advanced from a single timer so they
+    stay phase-locked and their repaints are requested in the same event
+    loop pass.
+    """
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> 'AnimationClock':
+        """
+        Get the process wide animation clock.
+
+        Return
+            The shared animation clock.
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent: QObject = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            parent:             The clock parent.
+        """
+        super().__init__(parent)
+        self._spinners = []
+        self._elapsedTimer = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+
+    def _tick(self) -> None:
+        """
+        Advance every registered spinner by the time elapsed since the last
+        tick and request a repaint of the ones that changed frame.
+        """
+        elapsed = self._elapsedTimer.restart()
+        self._spinners = [spinner for spinner in self._spinners
+                          if isValid(spinner)]
+        changedSpinners = [spinner for spinner in self._spinners
+                           if spinner._advance(elapsed)]
+        for spinner in changedSpinners:
+            spinner._repaintFrame()
+        if not self._spinners:
+            self._timer.stop()
+
+    def updateInterval(self) -> None:
+        """
+        Update the clock interval to match the fastest registered spinner.
+        """
+        if self._spinners:
+            self._timer.setInterval(min(spinner._getTickInterval()
+                                        for spinner in self._spinners))
+
+    def getInterval(self) -> int:
+        """
+        Get the clock interval.
+
+        Return
+            The clock tick interval in milliseconds.
+        """
+        return self._timer.interval()
+
+    def register(self, spinner: QObject) -> None:
+        """
+        Register a spinner to be advanced by the clock.
+
+        Params:
+            spinner:            The spinner to register.
+        """
+        if spinner in self._spinners:
+            return
+        self._spinners.append(spinner)
+        self.updateInterval()
+        if not self._timer.isActive():
+            self._elapsedTimer.start()
+            self._timer.start()
+
+    def unregister(self, spinner: QObject) -> None:
+        """
+        Unregister a spinner from the clock. The clock timer is left alone
+        once deleted, a spinner hidden at the interpreter shutdown being
+        unregistered after it.
+
+        Params:
+            spinner:            The spinner to unregister.
+        """
+        if spinner not in self._spinners:
+            return
+        self._spinners.remove(spinner)
+        if not isValid(self._timer):
+            return
+        if self._spinners:
+            self.updateInterval()
+        else:
+            self._timer.stop()
+
+    def isRegistered(self, spinner: QObject) -> bool:
+        """
+        Check if a spinner is registered.
+
+        Params:
+            spinner:            The spinner to check.
+
+        Return
+            True if the spinner is registered, false otherwise.
+        """
+        return spinner in self._spinners
+
+    def getSpinnerCount(self) -> int:
+        """
+        Get the registered spinner count.
+
+        Return
+            The number of spinners advanced by the clock.
+        """
+        return len(self._spinners)
@@ -0,0 +1,157 @@
+import math
+
+from PySide2.QtCore import QObject, QRunnable, Qt, QThreadPool, Signal
+from PySide2.QtGui import QImage, QPainter
+
+from .spinnerDrawList import SpinnerDrawList
+
+
+class _FrameAtlasTask(QRunnable):
+    """
+    The thread pool task running a frame atlas build.
+    """
+    def __init__(self, builder: 'FrameAtlasBuilder') -> None:
+        """
+        Constructor.
+
+        Params:
+            builder:            The builder to run.
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self._builder = builder
+
+    def run(self) -> None:
+        """
+        The task entry point.
+        """
+        self._builder._build()
+
+
+class FrameAtlasBuilder(QObject):
+    """
+    The background builder of a spinner frame atlas.
+
+    The frames of a spinner draw list copy are painted into a QImage strip
+    on the global thread pool. The builder stays
+    referenced until its task ends so a cancelled build never outlives its
+    objects, and only the builds that were not cancelled report their atlas,
+    a null one when the painting failed.
+    """
+    built = Signal(object, QImage)
+    _taskEnded = Signal()
+    _activeBuilders = set()
+
+    def __init__(self, styleKey: tuple, frameSize: int,
+                 devicePixelRatio: float, drawList: SpinnerDrawList) -> None:
+        """
+        Constructor.
+
+        Params:
+            styleKey:           The style key of the built frames.
+            frameSize:          The frame size.
+            devicePixelRatio:   The device pixel ratio of the built frames.
+            drawList:           The draw list copy of the built frames,
+                                owned by the builder.
+        """
+        super().__init__()
+        self._styleKey = styleKey
+        self._frameSize = frameSize
+        self._devicePixelRatio = devicePixelRatio
+        self._drawList = drawList
+        self._isCancelled = False
+        self._frameAtlas = None
+        self._task = _FrameAtlasTask(self)
+        self._taskEnded.connect(self._onTaskEnded)
+
+    def _paintFrameAtlas(self) -> QImage:
+        """
+        Paint the frame atlas. The frames are aligned on device pixels so
+        each one can be blitted at any device pixel ratio. The painting
+        stops at the next frame when the build is cancelled.
+
+        Return
+            The frame atlas.
+        """
+        deviceFrameSize = math.ceil(self._frameSize * self._devicePixelRatio)
+        frameCount = self._drawList.getFrameCount()
+        frameAtlas = QImage(deviceFrameSize * frameCount,
+                            deviceFrameSize,
+                            QImage.Format_ARGB32_Premultiplied)
+        frameAtlas.setDevicePixelRatio(self._devicePixelRatio)
+        frameAtlas.fill(Qt.transparent)
+        painter = QPainter(frameAtlas)
+        try:
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.setPen(Qt.NoPen)
+            for frame in range(frameCount):
+                if self._isCancelled:
+                    break
+                painter.save()
+                painter.translate(
+                    frame * deviceFrameSize / self._devicePixelRatio, 0)
+                self._drawList.paintFrame(painter, frame)
+                painter.restore()
+        finally:
+            painter.end()
+        return frameAtlas
+
+    def _build(self) -> None:
+        """
+        Build the frame atlas, on a thread pool thread. The end of the task
+        is always reported, a failed build reporting a null frame atlas, so
+        the spinner never waits for a build which will not end.
+        """
+        try:
+            frameAtlas = self._paintFrameAtlas()
+            if not self._isCancelled:
+                self._frameAtlas = frameAtlas
+        finally:
+            self._taskEnded.emit()
+
+    def _onTaskEnded(self) -> None:
+        """
+        Release the ended build and report its frame atlas if it was not
+        cancelled, a null frame atlas if the build failed.
+        """
+        self._activeBuilders.discard(self)
+        if self._isCancelled:
+            return
+        if self._frameAtlas is None:
+            self.built.emit(self._styleKey, QImage())
+        else:
+            self.built.emit(self._styleKey, self._frameAtlas)
+
+    def start(self) -> None:
+        """
+        Start the build on the global thread pool.
+        """
+        self._activeBuilders.add(self)
+        QThreadPool.globalInstance().start(self._task)
+
+    def cancel(self) -> None:
+        """
+        Cancel the build. A build still waiting in the thread pool is removed
+        from it, a running one stops at its next frame.
+        """
+        self._isCancelled = True
+        if QThreadPool.globalInstance().tryTake(self._task):
+            self._activeBuilders.discard(self)
+
+    def isCancelled(self) -> bool:
+        """
+        Check if the build is cancelled.
+
+        Return
+            True if the build is cancelled, false otherwise.
+        """
+        return self._isCancelled
+
+    def getStyleKey(self) -> tuple:
+        """
+        Get the style key of the built frames.
+
+        Return
+            The built style key.
+        """
+        return self._styleKey
@@ -0,0 +1,137 @@
+import math
+from collections import deque
+
+from PySide2.QtCore import QElapsedTimer
+
+
+class FrameStats:
+    """
+    The frame statistics of a spinner.
+
+    The statistics are gathered over a window started at construction or at
+    the last reset. They tell apart the stutters caused by the spinner paint
+    cost, seen in the paint durations, from the ones caused by a blocked
+    event loop, seen in the late and coalesced ticks.
+    """
+    durationSampleCount = 1000
+    lateTickRatio = 1.5
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._windowTimer = QElapsedTimer()
+        self._tickTimer = QElapsedTimer()
+        self._paintDurations = deque(maxlen=self.durationSampleCount)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the statistics and start a new window.
+        """
+        self._paintedFrameCount = 0
+        self._advancedFrameCount = 0
+        self._tickCount = 0
+        self._lateTickCount = 0
+        self._coalescedTickCount = 0
+        self._paintDurations.clear()
+        self._windowTimer.start()
+
+    def restartTicks(self) -> None:
+        """
+        Restart the tick measurement, the next timer tick is not checked for
+        lateness. Used when the animation (re)starts.
+        """
+        self._tickTimer.invalidate()
+
+    def recordTick(self, elapsed: int, interval: int) -> None:
+        """
+        Record an animation tick. The tick is late when it fired well after
+        its interval and the ticks skipped meanwhile are counted as
+        coalesced.
+
+        Params:
+            elapsed:            The time elapsed since the last tick in
+                                milliseconds.
+            interval:           The expected tick interval in milliseconds.
+        """
+        self._tickCount += 1
+        if elapsed > interval * self.lateTickRatio:
+            self._lateTickCount += 1
+            self._coalescedTickCount += max(0, round(elapsed / interval) - 1)
+
+    def recordTimerTick(self, interval: int) -> None:
+        """
+        Record a tick of the spinner own timer, measuring the time elapsed
+        since the previous one.
+
+        Params:
+            interval:           The timer interval in milliseconds.
+        """
+        if not self._tickTimer.isValid():
+            self._tickTimer.start()
+            self._tickCount += 1
+            return
+        self.recordTick(self._tickTimer.restart(), interval)
+
+    def recordFrames(self, frameCount: int) -> None:
+        """
+        Record the frames the animation advanced by.
+
+        Params:
+            frameCount:         The number of advanced frames.
+        """
+        self._advancedFrameCount += frameCount
+
+    def recordPaint(self, duration: int) -> None:
+        """
+        Record a painted frame.
+
+        Params:
+            duration:           The paint duration in nanoseconds.
+        """
+        self._paintedFrameCount += 1
+        self._paintDurations.append(duration)
+
+    def getStats(self, lineCount: int, revsPerSecond: float) -> dict:
+        """
+        Get the statistics of the current window.
+
+        Params:
+            lineCount:          The spinner line count.
+            revsPerSecond:      The spinner expected revolutions per second.
+
+        Return
+            The statistics, durations in milliseconds:
+                paintedFrames:          The painted frame count.
+                ticks:                  The animation tick count.
+                lateTicks:              The late tick count.
+                coalescedTicks:         The skipped tick count.
+                avgPaintDuration:       The average paint duration.
+                p99PaintDuration:       The 99th percentile paint duration.
+                revsPerSecond:          The expected revolutions per second.
+                effectiveRevsPerSecond: The measured revolutions per second.
+                duration:               The window duration.
+        """
+        durations = sorted(self._paintDurations)
+        if durations:
+            avgDuration = sum(durations) / len(durations) / 1e6
+            p99Idx = math.ceil(len(durations) * 0.99) - 1
+            p99Duration = durations[p99Idx] / 1e6
+        else:
+            avgDuration = 0.0
+            p99Duration = 0.0
+        windowDuration = self._windowTimer.elapsed()
+        effectiveRps = 0.0
+        if windowDuration > 0:
+            effectiveRps = self._advancedFrameCount / lineCount * 1000 / \
+                windowDuration
+        return {'paintedFrames': self._paintedFrameCount,
+                'ticks': self._tickCount,
+                'lateTicks': self._lateTickCount,
+                'coalescedTicks': self._coalescedTickCount,
+                'avgPaintDuration': avgDuration,
+                'p99PaintDuration': p99Duration,
+                'revsPerSecond': revsPerSecond,
+                'effectiveRevsPerSecond': effectiveRps,
+                'duration': windowDuration}
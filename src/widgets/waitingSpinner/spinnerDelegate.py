@@ -0,0 +1,193 @@
+from PySide2.QtCore import QModelIndex, QPersistentModelIndex, Qt
+from PySide2.QtGui import QIcon, QPainter
+from PySide2.QtWidgets import QAbstractItemView, QApplication, QStyle, \
+    QStyledItemDelegate, QStyleOptionViewItem
+
+from .animationClock import AnimationClock
+from .waitingSpinner import WaitingSpinner
+
+
+class SpinnerDelegate(QStyledItemDelegate):
+    """
+    The item view delegate painting a spinner in the busy cells.
+
+    A cell is busy when its busy role data is true. The spinner frames are
+    painted by a template spinner which is never shown nor started, so no
+    widget nor timer is created per cell. All the busy cells are advanced
+    by the shared animation clock, phase-locked with the spinner widgets
+    using it. The busy cells found while painting are the visible ones, so
+    only them are repainted on a frame change, and the delegate leaves the
+    clock when no busy cell is visible anymore.
+    """
+    def __init__(self, view: QAbstractItemView,
+                 busyRole: int = Qt.UserRole) -> None:
+        """
+        Constructor.
+
+        Params:
+            view:               The item view the delegate paints for.
+            busyRole:           The model role holding the busy state.
+        """
+        super().__init__(view)
+        self._view = view
+        self._busyRole = busyRole
+        self._spinner = WaitingSpinner(None, isCentered=False)
+        self._counter = 0
+        self._tickElapsed = 0
+        self._busyIndexes = set()
+
+    def _isBusy(self, index: QModelIndex) -> bool:
+        """
+        Check if a cell is busy.
+
+        Params:
+            index:              The cell index.
+
+        Return
+            True if the cell is busy, false otherwise.
+        """
+        return bool(index.data(self._busyRole))
+
+    def _getTickInterval(self) -> int:
+        """
+        Get the interval between two frames.
+
+        Return
+            The frame interval in milliseconds.
+        """
+        return self._spinner._getTickInterval()
+
+    def _advance(self, elapsed: int) -> bool:
+        """
+        Advance the busy cells by the time elapsed on the shared animation
+        clock.
+
+        Params:
+            elapsed:            The elapsed time in milliseconds.
+
+        Return
+            True if the busy cells changed frame, false otherwise.
+        """
+        self._tickElapsed += elapsed
+        interval = self._getTickInterval()
+        steps = self._tickElapsed // interval
+        if steps == 0:
+            return False
+        self._tickElapsed -= steps * interval
+        self._counter = (self._counter + steps) % \
+            self._spinner.getLineCount()
+        return True
+
+    def _repaintFrame(self) -> None:
+        """
+        Request the repaint of the busy cells painted since the last frame.
+        The cells still visible and busy are found again while painting,
+        the animation stops when there are none.
+        """
+        busyIndexes = self._busyIndexes
+        self._busyIndexes = set()
+        for index in busyIndexes:
+            if index.isValid():
+                self._view.update(QModelIndex(index))
+        if not busyIndexes:
+            AnimationClock.instance().unregister(self)
+
+    def _trackBusyCell(self, index: QModelIndex) -> None:
+        """
+        Track a painted busy cell and start the animation if needed.
+
+        Params:
+            index:              The cell index.
+        """
+        self._busyIndexes.add(QPersistentModelIndex(index))
+        clock = AnimationClock.instance()
+        if not clock.isRegistered(self):
+            self._tickElapsed = 0
+            clock.register(self)
+
+    def _drawSpinner(self, painter: QPainter,
+                     option: QStyleOptionViewItem) -> None:
+        """
+        Draw the current spinner frame centered in the cell, scaled down to
+        fit it.
+
+        Params:
+            painter:            The painter, its state is restored.
+            option:             The cell style options.
+        """
+        rect = option.rect
+        frameSize = self._spinner.width()
+        scale = min(1.0, min(rect.width(), rect.height()) / frameSize)
+        frame = self._counter % self._spinner.getLineCount()
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        painter.translate(rect.x() + (rect.width() - frameSize * scale) / 2,
+                          rect.y() + (rect.height() - frameSize * scale) / 2)
+        painter.scale(scale, scale)
+        self._spinner.paintFrame(painter, frame)
+        painter.restore()
+
+    def getSpinner(self) -> WaitingSpinner:
+        """
+        Get the template spinner. Its style setters and configure method
+        change the spinner painted in the busy cells.
+
+        Return
+            The template spinner.
+        """
+        return self._spinner
+
+    def getBusyRole(self) -> int:
+        """
+        Get the busy role.
+
+        Return
+            The model role holding the busy state.
+        """
+        return self._busyRole
+
+    def setBusyRole(self, busyRole: int) -> None:
+        """
+        Set the busy role.
+
+        Params:
+            busyRole:           The model role holding the busy state.
+        """
+        self._busyRole = busyRole
+        self._view.viewport().update()
+
+    def isAnimating(self) -> bool:
+        """
+        Check if visible busy cells are being animated.
+
+        Return
+            True if the delegate is advanced by the animation clock, false
+            otherwise.
+        """
+        return AnimationClock.instance().isRegistered(self)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem,
+              index: QModelIndex) -> None:
+        """
+        Paint a cell. A busy cell shows its background and the spinner
+        instead of its content.
+
+        Params:
+            painter:            The painter.
+            option:             The cell style options.
+            index:              The cell index.
+        """
+        if not self._isBusy(index):
+            super().paint(painter, option, index)
+            return
+        cellOption = QStyleOptionViewItem(option)
+        self.initStyleOption(cellOption, index)
+        cellOption.text = ''
+        cellOption.icon = QIcon()
+        widget = cellOption.widget
+        style = widget.style() if widget is not None else \
+            QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, cellOption, painter, widget)
+        self._drawSpinner(painter, option)
+        self._trackBusyCell(index)
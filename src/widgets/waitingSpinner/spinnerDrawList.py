@@ -0,0 +1,89 @@
+from PySide2.QtCore import QRectF, Qt
+from PySide2.QtGui import QBrush, QPainter, QTransform
+
+
+class SpinnerDrawList:
+    """
+    The draw list of a spinner revolution.
+
+    Every frame is the first one with its alphas shifted by one line, so the
+    draw list holds the transform of every line in the spinner and the brush
+    of every line of the first frame, the lines sharing the same alpha
+    sharing the same brush. A frame draws the lines in order with the calls
+    of a per-line loop, the brush only being set when it changes, so the
+    painted pixels are the same. A draw list is never modified once
+    created, the spinner creating a new one on a style change, and only the
+    painter is used to paint it, so a copy can be painted from any thread.
+    """
+    def __init__(self, lineRect: QRectF, roundness: float,
+                 lineTransforms: list, lineBrushes: list) -> None:
+        """
+        Constructor.
+
+        Params:
+            lineRect:           The line rectangle in the line coordinates.
+            roundness:          The line roundness, relative to its size.
+            lineTransforms:     The transform of every line in the spinner.
+            lineBrushes:        The brush of every line of the first frame.
+        """
+        self._lineRect = lineRect
+        self._roundness = roundness
+        self._lineTransforms = lineTransforms
+        self._lineBrushes = lineBrushes
+
+    def copy(self) -> 'SpinnerDrawList':
+        """
+        Copy the draw list, to paint it from another thread. The lines
+        sharing a brush keep sharing its copy.
+
+        Return
+            The draw list copy.
+        """
+        brushes = {}
+        for brush in self._lineBrushes:
+            if id(brush) not in brushes:
+                brushes[id(brush)] = QBrush(brush)
+        return SpinnerDrawList(QRectF(self._lineRect), self._roundness,
+                               [QTransform(transform)
+                                for transform in self._lineTransforms],
+                               [brushes[id(brush)]
+                                for brush in self._lineBrushes])
+
+    def getLineBrushes(self) -> list:
+        """
+        Get the brush of every line of the first frame.
+
+        Return
+            The line brushes.
+        """
+        return self._lineBrushes
+
+    def getFrameCount(self) -> int:
+        """
+        Get the frame count.
+
+        Return
+            The number of frames of a spinner revolution.
+        """
+        return len(self._lineTransforms)
+
+    def paintFrame(self, painter: QPainter, frame: int) -> None:
+        """
+        Paint a frame. Only the painter transform is created so the steady
+        state painting does not allocate.
+
+        Params:
+            painter:            The painter, its brush is modified.
+            frame:              The frame index.
+        """
+        transform = painter.worldTransform()
+        brush = None
+        for line, lineTransform in enumerate(self._lineTransforms):
+            lineBrush = self._lineBrushes[line - frame]
+            if lineBrush is not brush:
+                brush = lineBrush
+                painter.setBrush(brush)
+            painter.setWorldTransform(lineTransform, True)
+            painter.drawRoundedRect(self._lineRect, self._roundness,
+                                    self._roundness, Qt.RelativeSize)
+            painter.setWorldTransform(transform)
@@ -0,0 +1,235 @@
+import os
+
+from PySide2.QtCore import QObject, Qt, QThread, Signal
+from PySide2.QtGui import QColor, QImage, QPainter
+
+from .waitingSpinner import WaitingSpinner
+
+try:
+    from PIL import Image
+except ImportError:                                 # pragma: no cover
+    Image = None
+
+
+class SpinnerExporter(QThread):
+    """
+    The offscreen exporter of a spinner animation.
+
+    The spinner draw list is copied at construction, on the GUI thread, and
+    the frames are then painted on the exporter thread with the same draw
+    list the widget paints with, so the exported frames match the screen.
+    The animated GIF and APNG are written with Pillow, the other exports
+    only need Qt.
+    """
+    framesRendered = Signal(list)
+    exportFinished = Signal(str)
+    exportFailed = Signal(str)
+
+    def __init__(self, spinner: WaitingSpinner, scale: float = 1.0,
+                 background: QColor = Qt.transparent,
+                 parent: QObject = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            spinner:            The spinner to export.
+            scale:              The exported frames scale factor.
+            background:         The exported frames background color.
+            parent:             The exporter parent.
+        """
+        super().__init__(parent)
+        self._frameSize = spinner.width()
+        self._frameDuration = 1000 / (spinner.getLineCount() *
+                                      spinner.getRevsPerSecond())
+        self._drawList = spinner.getDrawList()
+        self._scale = scale
+        self._background = QColor(background)
+        self._job = None
+
+    def _writeFrame(self, frame: QImage, path: str) -> None:
+        """
+        Write a frame as a PNG image.
+
+        Params:
+            frame:              The frame to write.
+            path:               The image path.
+        """
+        if not frame.save(path, 'PNG'):
+            raise OSError(f"Failed to write the frame {path}")
+
+    def _convertFrame(self, frame: QImage) -> 'Image.Image':
+        """
+        Convert a frame to a Pillow image.
+
+        Params:
+            frame:              The frame to convert.
+
+        Return
+            The RGBA Pillow image.
+        """
+        frame = frame.convertToFormat(QImage.Format_RGBA8888)
+        return Image.frombuffer('RGBA', (frame.width(), frame.height()),
+                                bytes(frame.constBits()), 'raw', 'RGBA',
+                                frame.bytesPerLine(), 1)
+
+    def _getAnimationFormat(self, path: str) -> tuple:
+        """
+        Get the animated image format matching the file extension: GIF for
+        .gif, APNG for .png and .apng.
+
+        Params:
+            path:               The animated image path.
+
+        Return
+            The Pillow format name and its saving parameters.
+        """
+        if Image is None:
+            raise RuntimeError('Pillow is required to write animated images.')
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.gif':
+            return 'GIF', {'disposal': 2}
+        if extension in ('.png', '.apng'):
+            return 'PNG', {'disposal': 1}
+        raise ValueError(f"Unsupported animated image extension: "
+                         f"{extension}")
+
+    def _start(self, job: tuple) -> None:
+        """
+        Start an export on the exporter thread.
+
+        Params:
+            job:                The writing method and its arguments, None
+                                to only render the frames.
+        """
+        if self.isRunning():
+            raise RuntimeError('An export is already running.')
+        self._job = job
+        self.start()
+
+    def getFrameCount(self) -> int:
+        """
+        Get the exported frame count.
+
+        Return
+            The number of frames of a spinner revolution.
+        """
+        return self._drawList.getFrameCount()
+
+    def getFrameDuration(self) -> float:
+        """
+        Get the exported frame duration.
+
+        Return
+            The duration of a frame in milliseconds.
+        """
+        return self._frameDuration
+
+    def renderFrames(self) -> list:
+        """
+        Render the frames of a spinner revolution. Only QImage painting is
+        used, so this can run on any thread.
+
+        Return
+            The list of rendered QImage frames.
+        """
+        imageSize = round(self._frameSize * self._scale)
+        frames = []
+        for frameIdx in range(self._drawList.getFrameCount()):
+            frame = QImage(imageSize, imageSize,
+                           QImage.Format_ARGB32_Premultiplied)
+            frame.fill(self._background)
+            painter = QPainter(frame)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.setPen(Qt.NoPen)
+            painter.scale(self._scale, self._scale)
+            self._drawList.paintFrame(painter, frameIdx)
+            painter.end()
+            frames.append(frame)
+        return frames
+
+    def writePngSequence(self, frames: list, directory: str,
+                         baseName: str = 'frame') -> list:
+        """
+        Write the frames as a numbered PNG sequence.
+
+        Params:
+            frames:             The frames to write.
+            directory:          The output directory, created if needed.
+            baseName:           The image file base name.
+
+        Return
+            The list of written image paths.
+        """
+        os.makedirs(directory, exist_ok=True)
+        digitCount = len(str(len(frames) - 1))
+        paths = []
+        for idx, frame in enumerate(frames):
+            path = os.path.join(directory,
+                                f"{baseName}_{idx:0{digitCount}d}.png")
+            self._writeFrame(frame, path)
+            paths.append(path)
+        return paths
+
+    def writeAnimation(self, frames: list, path: str) -> None:
+        """
+        Write the frames as a looping animated image. The format is picked
+        from the file extension, the GIF format only supports a binary
+        transparency.
+
+        Params:
+            frames:             The frames to write.
+            path:               The animated image path.
+        """
+        imageFormat, formatParams = self._getAnimationFormat(path)
+        images = [self._convertFrame(frame) for frame in frames]
+        images[0].save(path, imageFormat, save_all=True,
+                       append_images=images[1:], loop=0,
+                       duration=round(self._frameDuration), **formatParams)
+
+    def exportFrames(self) -> None:
+        """
+        Render the frames on the exporter thread. The frames are delivered
+        with the framesRendered signal.
+        """
+        self._start(None)
+
+    def exportPngSequence(self, directory: str,
+                          baseName: str = 'frame') -> None:
+        """
+        Render and write the frames as a numbered PNG sequence on the
+        exporter thread. The exportFinished signal carries the directory.
+
+        Params:
+            directory:          The output directory, created if needed.
+            baseName:           The image file base name.
+        """
+        self._start((self.writePngSequence, directory, baseName))
+
+    def exportAnimation(self, path: str) -> None:
+        """
+        Render and write the frames as a looping animated GIF or APNG on the
+        exporter thread. The exportFinished signal carries the image path.
+
+        Params:
+            path:               The animated image path.
+        """
+        self._getAnimationFormat(path)
+        self._start((self.writeAnimation, path))
+
+    def run(self) -> None:
+        """
+        The exporter thread entry point. Any rendering or writing error is
+        reported by the exportFailed signal, since it cannot be raised to
+        the caller.
+        """
+        try:
+            frames = self.renderFrames()
+            self.framesRendered.emit(frames)
+            if self._job is None:
+                return
+            writeMethod, target, *args = self._job
+            writeMethod(frames, target, *args)
+        except Exception as error:
+            self.exportFailed.emit(str(error))
+            return
+        self.exportFinished.emit(target)
@@ -0,0 +1,13 @@
+from ..common.pixmapCache import PixmapCache
+
+
+class SpinnerRenderCache(PixmapCache):
+    """
+    The process wide cache of the rendered spinner frames.
+
+    The frames are stored by spinner style key so every spinner sharing the
+    same style shares the same rendered frames. The least recently used
+    entries are evicted when the cache grows over its byte budget.
+    """
+    defaultByteBudget = 32 * 1024 * 1024
+    _instance = None
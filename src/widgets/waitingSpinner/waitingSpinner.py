@@ -26,13 +26,39 @@ SOFTWARE.
 """
 
 import math
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Iterator
 
-from PySide2.QtCore import QRect, Qt, QTimer
-from PySide2.QtGui import QColor, QPainter, QPaintEvent
-from PySide2.QtWidgets import QWidget
+from PySide2.QtCore import QElapsedTimer, QEvent, QRectF, Qt, QTimer, Signal
+from PySide2.QtGui import QBrush, QColor, QHideEvent, QImage, QPainter, \
+    QPainterPath, QPaintEvent, QPixmap, QRegion, QShowEvent, QTransform
+from PySide2.QtWidgets import QApplication, QWidget
+
+from .animationClock import AnimationClock
+from .frameAtlasBuilder import FrameAtlasBuilder
+from .frameStats import FrameStats
+from .spinnerDrawList import SpinnerDrawList
+from .spinnerRenderCache import SpinnerRenderCache
+
+try:
+    import numpy as np
+except ImportError:                                 # pragma: no cover
+    np = None
 
 
 class WaitingSpinner(QWidget):
+    frameStatsUpdated = Signal(dict)
+    _configSetters = {'color': 'setColor',
+                      'roundness': 'setRoundness',
+                      'minTrailOpacity': 'setMinTrailOpacity',
+                      'trailFadePct': 'setTrailFadePct',
+                      'revsPerSecond': 'setRevsPerSecond',
+                      'lineCount': 'setLineCount',
+                      'lineLength': 'setLineLength',
+                      'lineWidth': 'setLineWidth',
+                      'innerRadius': 'setInnerRadius'}
+
     def __init__(self, parent: QWidget, isCentered: bool = True,
                  isParentDisabled: bool = False,
                  color: Qt.GlobalColor = Qt.black,
@@ -75,13 +101,78 @@ class WaitingSpinner(QWidget):
         self._innerRadius = 10
         self._counter = 0
         self._isSpinning = False
+        self._isFrameAtlasEnabled = False
+        self._frameAtlas = None
+        self._atlasBuilder = None
+        self._devicePixelRatio = 1.0
+        self._isSharedClockEnabled = False
+        self._tickElapsed = 0
+        self._isTimeBasedEnabled = False
+        self._maxFps = 60.0
+        self._phaseOrigin = 0.0
+        self._isAutoSuspendEnabled = True
+        self._isSuspended = False
+        self._lastFrame = 0
+        self._isRepaintRateEnabled = False
+        self._repaintedPixelCount = 0
+        self._repaintedPixelRate = 0.0
+        self._batchDepth = 0
+        self._frameStats = None
+        self._pendingUpdates = set()
+        self._updateAlphaTable()
+        self._updateLineGeometry()
+        self._updateDrawList()
+
+    def _deferUpdate(self, update: str) -> bool:
+        """
+        Defer the given update to the end of the ongoing batch update.
+
+        Params:
+            update:             The update name.
+
+        Return
+            True if the update is deferred, false if it must run now.
+        """
+        if self._batchDepth == 0:
+            return False
+        self._pendingUpdates.add(update)
+        return True
+
+    def _flushUpdates(self) -> None:
+        """
+        Run each update deferred during the batch update once.
+        """
+        updates = (('alphaTable', self._updateAlphaTable),
+                   ('size', self._updateSize),
+                   ('timer', self._updateTimer),
+                   ('rendering', self._updateRendering))
+        pendingUpdates = self._pendingUpdates
+        self._pendingUpdates = set()
+        for update, updateMethod in updates:
+            if update in pendingUpdates:
+                updateMethod()
 
     def _updateTimer(self) -> None:
         """
         Update the internal timer.
         """
+        if self._deferUpdate('timer'):
+            return
         timeout = int(1000 / (self._lineCount * self._revsPerSecond))
+        if self._isTimeBasedEnabled:
+            timeout = max(timeout, int(1000 / self._maxFps))
         self._timer.setInterval(timeout)
+        if self._isSharedClockEnabled and self._isSpinning:
+            AnimationClock.instance().updateInterval()
+
+    def _getTickInterval(self) -> int:
+        """
+        Get the interval between two frames.
+
+        Return
+            The frame interval in milliseconds.
+        """
+        return max(1, self._timer.interval())
 
     def _initTimer(self) -> None:
         """
@@ -89,15 +180,106 @@ class WaitingSpinner(QWidget):
         """
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._rotate)
+        self._elapsedTimer = QElapsedTimer()
+        self._repaintRateTimer = QElapsedTimer()
+        self._repaintRateTimer.start()
+        self._frameStatsTimer = QTimer(self)
+        self._frameStatsTimer.setInterval(1000)
+        self._frameStatsTimer.timeout.connect(self._reportFrameStats)
         self._updateTimer()
 
     def _updateSize(self) -> None:
         """
         Update the spinner size.
         """
+        if self._deferUpdate('size'):
+            return
         size = int((self._innerRadius + self._lineLength) * 2)
         self.setFixedSize(size, size)
 
+    def _getStyleKey(self) -> tuple:
+        """
+        Get the style key identifying the rendered spinner frames.
+
+        Return
+            The spinner style key.
+        """
+        return (self._color.rgba(), self._roundness, self._lineCount,
+                self._lineLength, self._lineWidth, self._innerRadius,
+                self._trailFadePct, self._minTrailOpacity,
+                self._devicePixelRatio)
+
+    def _startFrameAtlasBuild(self, styleKey: tuple) -> None:
+        """
+        Start building the frame atlas of the given style on the thread pool.
+
+        Params:
+            styleKey:           The style key of the frame atlas.
+        """
+        frameSize = int((self._innerRadius + self._lineLength) * 2)
+        self._atlasBuilder = FrameAtlasBuilder(styleKey, frameSize,
+                                               self._devicePixelRatio,
+                                               self.getDrawList())
+        self._atlasBuilder.built.connect(self._onFrameAtlasBuilt)
+        self._atlasBuilder.start()
+
+    def _cancelFrameAtlasBuild(self) -> None:
+        """
+        Cancel the pending frame atlas build, if any.
+        """
+        if self._atlasBuilder is not None:
+            self._atlasBuilder.cancel()
+            self._atlasBuilder = None
+
+    def _onFrameAtlasBuilt(self, styleKey: tuple, frameAtlas: QImage) -> None:
+        """
+        Install a built frame atlas and share it in the render cache. The
+        frame atlas is dropped if the style changed since its build started,
+        and the lines are still drawn directly when its build failed.
+
+        Params:
+            styleKey:           The style key of the frame atlas.
+            frameAtlas:         The built frame atlas.
+        """
+        if not self._isFrameAtlasEnabled or styleKey != self._getStyleKey():
+            return
+        self._atlasBuilder = None
+        if frameAtlas.isNull():
+            return
+        self._frameAtlas = QPixmap.fromImage(frameAtlas)
+        SpinnerRenderCache.instance().insert(styleKey, self._frameAtlas)
+        self.update()
+
+    def _updateFrameAtlas(self) -> None:
+        """
+        Update the frame atlas.
+
+        When the frame atlas is enabled, it is fetched from the shared render
+        cache and only built if no other spinner already did it for the same
+        style and device pixel ratio. The build runs on the thread pool and
+        the lines are drawn directly until it is done, any older build being
+        cancelled. When disabled, the frame atlas is released.
+        """
+        self._cancelFrameAtlasBuild()
+        if not self._isFrameAtlasEnabled:
+            self._frameAtlas = None
+            return
+        self._devicePixelRatio = self.devicePixelRatioF()
+        styleKey = self._getStyleKey()
+        self._frameAtlas = SpinnerRenderCache.instance().get(styleKey)
+        if self._frameAtlas is None:
+            self._startFrameAtlasBuild(styleKey)
+
+    def _updateDevicePixelRatio(self) -> None:
+        """
+        Update the frame atlas when the spinner moved to a screen with a
+        different device pixel ratio.
+        """
+        if self._isFrameAtlasEnabled and \
+                self.devicePixelRatioF() != self._devicePixelRatio:
+            self._updateFrameAtlas()
+            self.update()
+
     def _initDisplayState(self, modality: Qt.WindowModality) -> None:
         """
         Initialize the display state.
@@ -109,15 +291,232 @@ class WaitingSpinner(QWidget):
         self.setWindowModality(modality)
         self.setAttribute(Qt.WA_TranslucentBackground)
         self.hide()
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged \
+                .connect(self._onApplicationStateChanged)
 
-    def _rotate(self) -> None:
+    def _getPhase(self) -> float:
+        """
+        Get the spinner phase from the monotonic elapsed time.
+
+        Return
+            The fraction of revolution done, between 0 and 1.
+        """
+        revs = self._elapsedTimer.elapsed() * self._revsPerSecond / 1000
+        return (self._phaseOrigin + revs) % 1.0
+
+    def _rebasePhase(self, phase: float) -> None:
+        """
+        Restart the elapsed time from the given phase.
+
+        Params:
+            phase:              The phase to restart from.
+        """
+        self._phaseOrigin = phase
+        self._elapsedTimer.start()
+
+    def _calcActiveIdx(self) -> int:
+        """
+        Calculate the index of the active line from the spinner phase.
+
+        Return
+            The index in the spinner of the active line.
         """
-        Rotate the spinner by incrementing the counter.
+        return int(self._getPhase() * self._lineCount) % self._lineCount
+
+    def _rotate(self) -> None:
         """
+        Rotate the spinner by incrementing the counter or, in time based
+        mode, by deriving it from the elapsed time.
+        """
+        if self._frameStats is not None:
+            self._frameStats.recordTimerTick(self._timer.interval())
+        if self._isTimeBasedEnabled:
+            counter = self._calcActiveIdx()
+            if counter != self._counter:
+                self._recordFrames((counter - self._counter) %
+                                   self._lineCount)
+                self._counter = counter
+                self._repaintFrame()
+            return
+        self._recordFrames(1)
         self._counter += 1
         if self._counter >= self._lineCount:
             self._counter = 0
-        self.update()
+        self._repaintFrame()
+
+    def _getFrameRegion(self, frame: int) -> QRegion:
+        """
+        Get the region of the lines changing alpha when stepping to a frame,
+        building it on first use. Every frame is the first one rotated, so
+        the changed lines are the ones of the first frame shifted.
+
+        Params:
+            frame:              The frame stepped to.
+
+        Return
+            The region of the changed lines.
+        """
+        region = self._frameRegions[frame]
+        if region is None:
+            region = QRegion()
+            for line in self._changedLines:
+                region = region.united(
+                    self._lineRects[(line + frame) % self._lineCount])
+            self._frameRegions[frame] = region
+        return region
+
+    def _repaintFrame(self) -> None:
+        """
+        Request the repaint of the lines that changed since the last
+        requested frame only.
+        """
+        if self._lastFrame >= self._lineCount:
+            self._lastFrame = self._counter
+            self.update()
+            return
+        stepCount = (self._counter - self._lastFrame) % self._lineCount
+        region = QRegion()
+        for step in range(1, stepCount + 1):
+            region = region.united(self._getFrameRegion(
+                (self._lastFrame + step) % self._lineCount))
+        self._lastFrame = self._counter
+        self.update(region)
+
+    def _countRepaintedPixels(self, region: QRegion) -> None:
+        """
+        Count the repainted pixels and update the repainted pixel rate every
+        second.
+
+        Params:
+            region:             The repainted region.
+        """
+        for rect in region.rects():
+            self._repaintedPixelCount += rect.width() * rect.height()
+        elapsed = self._repaintRateTimer.elapsed()
+        if elapsed >= 1000:
+            self._repaintedPixelRate = \
+                self._repaintedPixelCount * 1000 / elapsed
+            self._repaintedPixelCount = 0
+            self._repaintRateTimer.restart()
+
+    def _advance(self, elapsed: int) -> bool:
+        """
+        Advance the spinner by the time elapsed on the shared animation
+        clock.
+
+        Params:
+            elapsed:            The elapsed time in milliseconds.
+
+        Return
+            True if the spinner changed frame, false otherwise.
+        """
+        if self._frameStats is not None:
+            clockInterval = AnimationClock.instance().getInterval()
+            self._frameStats.recordTick(elapsed, clockInterval)
+        if self._isTimeBasedEnabled:
+            counter = self._calcActiveIdx()
+            isChanged = counter != self._counter
+            self._recordFrames((counter - self._counter) % self._lineCount)
+            self._counter = counter
+            return isChanged
+        self._tickElapsed += elapsed
+        interval = self._getTickInterval()
+        steps = self._tickElapsed // interval
+        if steps == 0:
+            return False
+        self._tickElapsed -= steps * interval
+        self._recordFrames(steps)
+        self._counter = (self._counter + steps) % self._lineCount
+        return True
+
+    def _recordFrames(self, frameCount: int) -> None:
+        """
+        Record the frames the animation advanced by in the frame statistics,
+        if enabled.
+
+        Params:
+            frameCount:         The number of advanced frames.
+        """
+        if self._frameStats is not None:
+            self._frameStats.recordFrames(frameCount)
+
+    def _reportFrameStats(self) -> None:
+        """
+        Report the frame statistics of the ending window and start a new one.
+        """
+        stats = self.getFrameStats()
+        self._frameStats.reset()
+        self.frameStatsUpdated.emit(stats)
+
+    def _startTimer(self) -> None:
+        """
+        Start the animation, either with the internal timer or with the
+        shared animation clock, and the frame statistics report.
+        """
+        if self._frameStats is not None:
+            self._frameStats.restartTicks()
+            self._frameStatsTimer.start()
+        if self._isSharedClockEnabled:
+            self._tickElapsed = 0
+            AnimationClock.instance().register(self)
+        else:
+            self._timer.start()
+
+    def _stopTimer(self) -> None:
+        """
+        Stop the animation, either from the internal timer or from the
+        shared animation clock, and the frame statistics report.
+        """
+        self._frameStatsTimer.stop()
+        if self._isSharedClockEnabled:
+            AnimationClock.instance().unregister(self)
+        else:
+            self._timer.stop()
+
+    def _suspend(self) -> None:
+        """
+        Suspend the animation of a spinning spinner.
+        """
+        if self._isSpinning and not self._isSuspended:
+            self._stopTimer()
+            self._isSuspended = True
+
+    def _resume(self) -> None:
+        """
+        Resume the animation of a suspended spinner from the frame it was
+        suspended at.
+        """
+        if self._isSuspended:
+            self._isSuspended = False
+            self._rebasePhase(self._counter / self._lineCount)
+            self._startTimer()
+
+    def _updateSuspension(self) -> None:
+        """
+        Suspend the animation when the spinner is not displayed, hidden in
+        an inactive tab for example, its window is minimized or the
+        application is not active, resume it otherwise.
+        """
+        isDisplayed = self.isVisible() and not self.window().isMinimized()
+        isActive = \
+            QApplication.applicationState() == Qt.ApplicationActive
+        if self._isAutoSuspendEnabled and \
+                not (isDisplayed and isActive):
+            self._suspend()
+        else:
+            self._resume()
+
+    def _onApplicationStateChanged(self, state: Qt.ApplicationState) \
+            -> None:
+        """
+        Application state changed handler.
+
+        Params:
+            state:              The new application state.
+        """
+        self._updateSuspension()
 
     def _centerInParent(self) -> None:
         """
@@ -182,32 +581,212 @@ class WaitingSpinner(QWidget):
             lineAlpha = maxAlpha - gradient * trailPos
             return min(maxAlpha, max(minAlpha, lineAlpha))
 
-    def _drawLine(self, painter: QPainter, line: int) -> None:
-        """
-        Draw the requested line.
-
-        Params:
-            painter:            The painter.
-            line:               The line ID to draw.
-        """
-        painter.save()
-        painter.translate(self._innerRadius + self._lineLength,
-                          self._innerRadius + self._lineLength)
-        rotateAngle = 360 * line / self._lineCount
-        painter.rotate(rotateAngle)
-        painter.translate(self._innerRadius, 0)
-        trailPos = self._calcLineTrailPos(line, self._counter, self._lineCount)
-        alpha = self._calcLineAlpha(trailPos, self._lineCount,
-                                    self._trailFadePct,
-                                    self._minTrailOpacity)
-        color = QColor(self._color)
-        color.setAlphaF(alpha)
-        painter.setBrush(color)
-        rect = QRect(0, int(-self._lineWidth / 2), self._lineLength,
-                     self._lineWidth)
-        painter.drawRoundedRect(rect, self._roundness,
-                                self._roundness, Qt.RelativeSize)
-        painter.restore()
+    def _calcAlphaTable(self, lineCount: int, fadePct: float,
+                        minOpacity: float) -> list:
+        """
+        Calculate the alpha value of every line for every frame.
+
+        The table is computed in a single vectorized step when NumPy is
+        available and falls back on _calcLineAlpha otherwise.
+
+        Params:
+            lineCount:          The total line count in the spinner.
+            fadePct:            The trail fade percentage.
+            minOpacity:         The minimum opacity.
+
+        Return
+            The alpha table indexed by [frame][line].
+        """
+        if np is None:
+            return [[self._calcLineAlpha(self._calcLineTrailPos(line, frame,
+                                                                lineCount),
+                                         lineCount, fadePct, minOpacity)
+                     for line in range(lineCount)]
+                    for frame in range(lineCount)]
+        maxAlpha = 1.0
+        minAlpha = minOpacity / 100.0
+        posThreshold = math.ceil((lineCount - 1) * fadePct / 100)
+        gradient = (maxAlpha - minAlpha) / (posThreshold + 1)
+        indexes = np.arange(lineCount)
+        trailPos = (indexes[:, np.newaxis] - indexes) % lineCount
+        lineAlphas = np.minimum(maxAlpha,
+                                np.maximum(minAlpha,
+                                           maxAlpha - gradient * trailPos))
+        alphas = np.where(trailPos > posThreshold, minAlpha, lineAlphas)
+        alphas[trailPos == 0] = maxAlpha
+        return alphas.tolist()
+
+    def _updateAlphaTable(self) -> None:
+        """
+        Update the line alpha table.
+        """
+        if self._deferUpdate('alphaTable'):
+            return
+        self._alphaTable = self._calcAlphaTable(self._lineCount,
+                                                self._trailFadePct,
+                                                self._minTrailOpacity)
+
+    def _calcLinePath(self, line: int) -> QPainterPath:
+        """
+        Calculate the outline of the given line around the spinner center.
+
+        Params:
+            line:               The line ID.
+
+        Return
+            The line outline.
+        """
+        transform = QTransform()
+        transform.rotate(360 * line / self._lineCount)
+        transform.translate(self._innerRadius, 0)
+        path = QPainterPath()
+        path.addRoundedRect(QRectF(0, int(-self._lineWidth / 2),
+                                   self._lineLength, self._lineWidth),
+                            self._roundness, self._roundness,
+                            Qt.RelativeSize)
+        return transform.map(path)
+
+    def _updateLineGeometry(self) -> None:
+        """
+        Update the outline of every line and its bounding rectangle in the
+        spinner, including the antialiasing margin, and reset the repaint
+        regions of the frames. The lines changing alpha when stepping to
+        the first frame are found once, the ones of the other frames being
+        the same lines rotated.
+        """
+        center = self._innerRadius + self._lineLength
+        self._linePaths = [self._calcLinePath(line)
+                           for line in range(self._lineCount)]
+        self._lineRects = [linePath.boundingRect()
+                           .translated(center, center).toAlignedRect()
+                           .adjusted(-1, -1, 1, 1)
+                           for linePath in self._linePaths]
+        self._changedLines = [line for line, (lastAlpha, alpha)
+                              in enumerate(zip(self._alphaTable[-1],
+                                               self._alphaTable[0]))
+                              if lastAlpha != alpha]
+        self._frameRegions = [None] * self._lineCount
+
+    def _updateDrawList(self) -> None:
+        """
+        Update the draw list.
+
+        Every frame is the first one with its alphas shifted by one line, so
+        only the transform of every line and the brush of every line of the
+        first frame are created, one brush per alpha. The line transforms
+        are built as the painter builds them when drawing a line, so the
+        frames match the lines drawn one by one.
+        """
+        center = self._innerRadius + self._lineLength
+        lineTransforms = []
+        for line in range(self._lineCount):
+            transform = QTransform()
+            transform.translate(center, center)
+            transform.rotate(360 * line / self._lineCount)
+            transform.translate(self._innerRadius, 0)
+            lineTransforms.append(transform)
+        brushes = {}
+        for alpha in self._alphaTable[0]:
+            if alpha not in brushes:
+                color = QColor(self._color)
+                color.setAlphaF(alpha)
+                brushes[alpha] = QBrush(color)
+        lineRect = QRectF(0, int(-self._lineWidth / 2), self._lineLength,
+                          self._lineWidth)
+        self._drawList = SpinnerDrawList(lineRect, self._roundness,
+                                         lineTransforms,
+                                         [brushes[alpha] for alpha
+                                          in self._alphaTable[0]])
+
+    def _updateRendering(self) -> None:
+        """
+        Update the rendering caches after a style change and request the
+        repaint of the whole spinner.
+        """
+        if self._deferUpdate('rendering'):
+            return
+        self._updateLineGeometry()
+        self._updateDrawList()
+        self._updateFrameAtlas()
+        self._lastFrame = self._counter
+        self.update()
+
+    def _paint(self, event: QPaintEvent) -> None:
+        """
+        Paint the current frame.
+
+        Params:
+            event:              The Qt paint event.
+        """
+        if self._isRepaintRateEnabled:
+            self._countRepaintedPixels(event.region())
+        painter = QPainter(self)
+        if self._frameAtlas is not None:
+            frameSize = self._frameAtlas.height()
+            painter.drawPixmap(0, 0, self._frameAtlas,
+                               self._counter * frameSize, 0,
+                               frameSize, frameSize)
+            return
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+        self._drawList.paintFrame(painter, self._counter)
+
+    @contextmanager
+    def batchUpdate(self) -> Iterator['WaitingSpinner']:
+        """
+        Batch the settings changes. The size, timer and rendering updates
+        are deferred and run only once when the outermost batch ends.
+
+        Return
+            The spinner, as the context manager value.
+        """
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._flushUpdates()
+
+    def getDrawList(self) -> SpinnerDrawList:
+        """
+        Get a copy of the draw list the spinner paints its frames with, to
+        paint them outside of the widget, from any thread.
+
+        Return
+            The draw list copy.
+        """
+        return self._drawList.copy()
+
+    def paintFrame(self, painter: QPainter, frame: int) -> None:
+        """
+        Paint a frame of the spinner, as the widget paints it, with the
+        painter origin at the spinner top left corner. The painter needs
+        antialiasing and no pen to match the widget.
+
+        Params:
+            painter:            The painter, its transform is modified.
+            frame:              The frame index.
+        """
+        self._drawList.paintFrame(painter, frame)
+
+    def configure(self, **params) -> None:
+        """
+        Apply several settings at once in a single batch update.
+
+        Params:
+            params:             The settings by name (color, roundness,
+                                minTrailOpacity, trailFadePct,
+                                revsPerSecond, lineCount, lineLength,
+                                lineWidth and innerRadius).
+        """
+        for name in params:
+            if name not in self._configSetters:
+                raise TypeError(f"configure() got an unexpected keyword "
+                                f"argument '{name}'")
+        with self.batchUpdate():
+            for name, value in params.items():
+                getattr(self, self._configSetters[name])(value)
 
     def getLineCount(self) -> int:
         """
@@ -228,6 +807,8 @@ class WaitingSpinner(QWidget):
         self._lineCount = lineCount
         self._counter = 0
         self._updateTimer()
+        self._updateAlphaTable()
+        self._updateRendering()
 
     def getLineLength(self) -> int:
         """
@@ -247,6 +828,7 @@ class WaitingSpinner(QWidget):
         """
         self._lineLength = length
         self._updateSize()
+        self._updateRendering()
 
     def getLineWidth(self) -> int:
         """
@@ -266,6 +848,7 @@ class WaitingSpinner(QWidget):
         """
         self._lineWidth = width
         self._updateSize()
+        self._updateRendering()
 
     def getRoundness(self) -> float:
         """
@@ -284,6 +867,7 @@ class WaitingSpinner(QWidget):
             roundness:          The new line roundness.
         """
         self._roundness = max(0.0, min(100.0, roundness))
+        self._updateRendering()
 
     def getInnerRadius(self) -> int:
         """
@@ -303,6 +887,7 @@ class WaitingSpinner(QWidget):
         """
         self._innerRadius = radius
         self._updateSize()
+        self._updateRendering()
 
     def getColor(self) -> QColor:
         """
@@ -321,6 +906,7 @@ class WaitingSpinner(QWidget):
             color:              The new color.
         """
         self._color = QColor(color)
+        self._updateRendering()
 
     def getMinTrailOpacity(self) -> float:
         """
@@ -339,6 +925,8 @@ class WaitingSpinner(QWidget):
             minTrailOpacity:    The new minimum trail opacity.
         """
         self._minTrailOpacity = minTrailOpacity
+        self._updateAlphaTable()
+        self._updateRendering()
 
     def getTrailFadePct(self) -> float:
         """
@@ -357,6 +945,8 @@ class WaitingSpinner(QWidget):
             fadePct:            The new trail fade percentage.
         """
         self._trailFadePct = fadePct
+        self._updateAlphaTable()
+        self._updateRendering()
 
     def getRevsPerSecond(self) -> float:
         """
@@ -374,9 +964,246 @@ class WaitingSpinner(QWidget):
         Params:
             revsPerSecond:      The new revolutions per second.
         """
+        if self._isTimeBasedEnabled and self._isSpinning:
+            self._rebasePhase(self._getPhase())
         self._revsPerSecond = revsPerSecond
         self._updateTimer()
 
+    def isFrameAtlasEnabled(self) -> bool:
+        """
+        Check if the frame atlas is enabled.
+
+        Return
+            True if the frame atlas is enabled, false otherwise.
+        """
+        return self._isFrameAtlasEnabled
+
+    def setFrameAtlasEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the frame atlas. When enabled, the spinner frames
+        are pre-rendered in the background and, once ready, each paint is
+        reduced to a single blit.
+
+        Params:
+            isEnabled:          The frame atlas enable flag.
+        """
+        self._isFrameAtlasEnabled = isEnabled
+        self._updateRendering()
+
+    def isSharedClockEnabled(self) -> bool:
+        """
+        Check if the shared animation clock is enabled.
+
+        Return
+            True if the shared animation clock is enabled, false otherwise.
+        """
+        return self._isSharedClockEnabled
+
+    def setSharedClockEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the shared animation clock. When enabled, the
+        spinner is advanced by the process wide animation clock instead of
+        its own timer.
+
+        Params:
+            isEnabled:          The shared animation clock enable flag.
+        """
+        isRunning = self._isSpinning and not self._isSuspended
+        if isRunning:
+            self._stopTimer()
+        self._isSharedClockEnabled = isEnabled
+        if isRunning:
+            self._startTimer()
+
+    def isTimeBasedEnabled(self) -> bool:
+        """
+        Check if the time based animation is enabled.
+
+        Return
+            True if the time based animation is enabled, false otherwise.
+        """
+        return self._isTimeBasedEnabled
+
+    def setTimeBasedEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the time based animation. When enabled, the active
+        line is derived from a monotonic clock and the repaint rate is capped
+        to the maximum FPS, no matter the line count.
+
+        Params:
+            isEnabled:          The time based animation enable flag.
+        """
+        if isEnabled and not self._isTimeBasedEnabled:
+            self._rebasePhase(self._counter / self._lineCount)
+        self._isTimeBasedEnabled = isEnabled
+        self._updateTimer()
+
+    def getMaxFps(self) -> float:
+        """
+        Get the maximum FPS of the time based animation.
+
+        Return
+            The spinner maximum frames per second.
+        """
+        return self._maxFps
+
+    def setMaxFps(self, maxFps: float) -> None:
+        """
+        Set the maximum FPS of the time based animation.
+
+        Params:
+            maxFps:             The new maximum frames per second.
+        """
+        self._maxFps = maxFps
+        self._updateTimer()
+
+    def getTimerType(self) -> Qt.TimerType:
+        """
+        Get the internal timer type.
+
+        Return
+            The spinner timer type.
+        """
+        return self._timer.timerType()
+
+    def setTimerType(self, timerType: Qt.TimerType) -> None:
+        """
+        Set the internal timer type.
+
+        Params:
+            timerType:          The new timer type (precise, coarse or
+                                very coarse).
+        """
+        self._timer.setTimerType(timerType)
+
+    def isAutoSuspendEnabled(self) -> bool:
+        """
+        Check if the automatic suspension is enabled.
+
+        Return
+            True if the automatic suspension is enabled, false otherwise.
+        """
+        return self._isAutoSuspendEnabled
+
+    def setAutoSuspendEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the automatic suspension. When enabled, the
+        animation is suspended while the spinner is hidden, its window is
+        minimized or the application is inactive.
+
+        Params:
+            isEnabled:          The automatic suspension enable flag.
+        """
+        self._isAutoSuspendEnabled = isEnabled
+        self._updateSuspension()
+
+    def isSuspended(self) -> bool:
+        """
+        Check if the spinner animation is suspended.
+
+        Return
+            True if the spinner animation is suspended, false otherwise.
+        """
+        return self._isSuspended
+
+    def isFrameStatsEnabled(self) -> bool:
+        """
+        Check if the frame statistics are enabled.
+
+        Return
+            True if the frame statistics are gathered, false otherwise.
+        """
+        return self._frameStats is not None
+
+    def setFrameStatsEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the frame statistics. When enabled, the statistics
+        are reported with the frameStatsUpdated signal at every statistics
+        interval while the spinner is animated, then reset.
+
+        Params:
+            isEnabled:          The frame statistics enable flag.
+        """
+        if isEnabled == self.isFrameStatsEnabled():
+            return
+        if isEnabled:
+            self._frameStats = FrameStats()
+            if self._isSpinning and not self._isSuspended:
+                self._frameStatsTimer.start()
+        else:
+            self._frameStatsTimer.stop()
+            self._frameStats = None
+
+    def getFrameStatsInterval(self) -> int:
+        """
+        Get the frame statistics report interval.
+
+        Return
+            The frame statistics report interval in milliseconds.
+        """
+        return self._frameStatsTimer.interval()
+
+    def setFrameStatsInterval(self, interval: int) -> None:
+        """
+        Set the frame statistics report interval.
+
+        Params:
+            interval:           The new report interval in milliseconds.
+        """
+        self._frameStatsTimer.setInterval(interval)
+
+    def getFrameStats(self) -> dict:
+        """
+        Get the frame statistics gathered since the last report.
+
+        Return
+            The frame statistics, as described by FrameStats.getStats, None
+            if they are disabled.
+        """
+        if self._frameStats is None:
+            return None
+        return self._frameStats.getStats(self._lineCount,
+                                         self._revsPerSecond)
+
+    def resetFrameStats(self) -> None:
+        """
+        Reset the frame statistics, if enabled.
+        """
+        if self._frameStats is not None:
+            self._frameStats.reset()
+
+    def isRepaintRateEnabled(self) -> bool:
+        """
+        Check if the repainted pixel rate measurement is enabled.
+
+        Return
+            True if the repainted pixel rate is measured, false otherwise.
+        """
+        return self._isRepaintRateEnabled
+
+    def setRepaintRateEnabled(self, isEnabled: bool) -> None:
+        """
+        Enable or disable the repainted pixel rate measurement. Counting the
+        repainted pixels costs every paint, so it is disabled by default.
+
+        Params:
+            isEnabled:          The repainted pixel rate enable flag.
+        """
+        self._isRepaintRateEnabled = isEnabled
+        self._repaintedPixelCount = 0
+        self._repaintedPixelRate = 0.0
+        self._repaintRateTimer.restart()
+
+    def getRepaintedPixelRate(self) -> float:
+        """
+        Get the repainted pixel rate, measured over the last second when
+        enabled.
+
+        Return
+            The spinner repainted pixels per second, 0 if not measured.
+        """
+        return self._repaintedPixelRate
+
     def isSpinning(self) -> bool:
         """
         Check if the spinner is spinning.
@@ -394,9 +1221,12 @@ class WaitingSpinner(QWidget):
             self._centerInParent()
             self._disableParent()
             self._counter = 0
-            self._timer.start()
+            self._lastFrame = 0
+            self._rebasePhase(0.0)
+            self._startTimer()
             self._isSpinning = True
             self.show()
+            self._updateSuspension()
 
     def stop(self) -> None:
         """
@@ -404,14 +1234,55 @@ class WaitingSpinner(QWidget):
         """
         if self._isSpinning:
             self._enableParent()
-            self._timer.stop()
+            if not self._isSuspended:
+                self._stopTimer()
+            self._isSuspended = False
             self._isSpinning = False
             self.hide()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """
+        Show event handler.
+
+        Params:
+            event:              The Qt show event.
+        """
+        self._updateDevicePixelRatio()
+        self._updateSuspension()
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """
+        Hide event handler. Also received when the window is minimized.
+
+        Params:
+            event:              The Qt hide event.
+        """
+        self._updateSuspension()
+
+    def event(self, event: QEvent) -> bool:
+        """
+        Event handler, updates the frame atlas on a screen change.
+
+        Params:
+            event:              The Qt event.
+
+        Return
+            True if the event was recognized, false otherwise.
+        """
+        if event.type() == QEvent.ScreenChangeInternal:
+            self._updateDevicePixelRatio()
+        return super().event(event)
+
     def paintEvent(self, event: QPaintEvent):
-        painter = QPainter(self)
-        painter.fillRect(self.rect(), Qt.transparent)
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.setPen(Qt.NoPen)
-        for line in range(self._lineCount):
-            self._drawLine(painter, line)
+        """
+        Paint event handler.
+
+        Params:
+            event:              The Qt paint event.
+        """
+        if self._frameStats is None:
+            self._paint(event)
+            return
+        start = perf_counter_ns()
+        self._paint(event)
+        self._frameStats.recordPaint(perf_counter_ns() - start)
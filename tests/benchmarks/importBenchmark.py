@@ -0,0 +1,281 @@
+from argparse import ArgumentParser
+
+import json
+import os
+import subprocess
+import sys
+
+
+class ImportBenchmark:
+    """
+    The cold start import time benchmark of the widgets packages.
+
+    Each case runs an import statement in a fresh interpreter with
+    `python -X importtime` and sums the cumulative time of the modules the
+    statement imported, the interpreter startup being excluded. The case is
+    repeated and the fastest run is kept to filter out the machine noise.
+    The import times are compared to the stored budgets and the lightweight
+    cases must not load the modules they are meant to avoid, Qt for the
+    package and color imports.
+    """
+    defaultBudgetsPath = os.path.join(os.path.dirname(__file__),
+                                      'importBudgets.json')
+    defaultHeadroom = 1.0
+    startMarker = '--- import benchmark start ---'
+    cases = {'ledIndicator/package': ('import widgets.ledIndicator',
+                                      ('PySide2',)),
+             'ledIndicator/color': ('from widgets.ledIndicator import '
+                                    'LedIndicatorColor', ('PySide2',)),
+             'ledIndicator/widget': ('from widgets.ledIndicator import '
+                                     'LedIndicator', ()),
+             'waitingSpinner/package': ('import widgets.waitingSpinner',
+                                        ('PySide2',)),
+             'waitingSpinner/widget': ('from widgets.waitingSpinner import '
+                                       'WaitingSpinner', ())}
+
+    @classmethod
+    def parseImportTime(cls, output: str) -> list:
+        """
+        Parse the import time report of the modules imported after the start
+        marker.
+
+        Params:
+            output:             The interpreter standard error output.
+
+        Return
+            The list of (module, self time, cumulative time, depth) entries,
+            times in microseconds.
+        """
+        entries = []
+        isStarted = False
+        for line in output.splitlines():
+            if line == cls.startMarker:
+                isStarted = True
+                continue
+            if not isStarted or not line.startswith('import time:'):
+                continue
+            fields = line[len('import time:'):].split('|')
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                continue
+            module = fields[2].rstrip()
+            name = module.lstrip()
+            depth = (len(module) - len(name) - 1) // 2
+            entries.append((name, int(fields[0]), int(fields[1]), depth))
+        return entries
+
+    @staticmethod
+    def calcImportTime(entries: list) -> int:
+        """
+        Calculate the total import time of a statement.
+
+        Params:
+            entries:            The parsed import time entries.
+
+        Return
+            The sum of the top level modules cumulative time in microseconds.
+        """
+        return sum(cumulative for name, selfTime, cumulative, depth
+                   in entries if depth == 0)
+
+    @staticmethod
+    def findForbidden(entries: list, forbiddenModules: tuple) -> list:
+        """
+        Find the imported modules that must not be loaded.
+
+        Params:
+            entries:            The parsed import time entries.
+            forbiddenModules:   The packages that must not be loaded.
+
+        Return
+            The sorted list of forbidden modules imported.
+        """
+        return sorted(name for name, selfTime, cumulative, depth in entries
+                      if any(name == module or name.startswith(f"{module}.")
+                             for module in forbiddenModules))
+
+    @staticmethod
+    def findOverBudget(results: dict, budgets: dict) -> list:
+        """
+        Find the cases whose import time exceeds their budget. The cases
+        without budget are ignored.
+
+        Params:
+            results:            The measured results by case name.
+            budgets:            The import time budgets by case name.
+
+        Return
+            The list of (case name, budget, measured) import times of the
+            cases over budget.
+        """
+        overBudget = []
+        for name, result in results.items():
+            budget = budgets.get(name)
+            if budget is not None and result['importTime'] > budget:
+                overBudget.append((name, budget, result['importTime']))
+        return overBudget
+
+    @staticmethod
+    def loadBudgets(path: str) -> dict:
+        """
+        Load the stored budgets.
+
+        Params:
+            path:               The budgets file path.
+
+        Return
+            The import time budgets by case name, empty if the file does not
+            exist.
+        """
+        if not os.path.exists(path):
+            return {}
+        with open(path) as budgetsFile:
+            return json.load(budgetsFile)
+
+    @staticmethod
+    def saveBudgets(path: str, results: dict, headroom: float) -> None:
+        """
+        Store the results with some headroom as the new budgets.
+
+        Params:
+            path:               The budgets file path.
+            results:            The measured results by case name.
+            headroom:           The relative headroom over the measured
+                                import times.
+        """
+        budgets = {name: round(result['importTime'] * (1 + headroom))
+                   for name, result in results.items()}
+        with open(path, 'w') as budgetsFile:
+            json.dump(budgets, budgetsFile, indent=2, sort_keys=True)
+            budgetsFile.write('\n')
+
+    def __init__(self, roundCount: int = 5,
+                 srcPath: str = os.path.abspath('./src')) -> None:
+        """
+        Constructor.
+
+        Params:
+            roundCount:         The number of runs per case.
+            srcPath:            The path of the widgets packages.
+        """
+        self._roundCount = roundCount
+        self._srcPath = srcPath
+
+    def _runStatement(self, statement: str) -> list:
+        """
+        Run an import statement in a fresh interpreter.
+
+        Params:
+            statement:          The import statement.
+
+        Return
+            The parsed import time entries of the statement.
+        """
+        env = dict(os.environ, PYTHONPATH=self._srcPath)
+        code = f"import sys; print({self.startMarker!r}, file=sys.stderr, " \
+            f"flush=True); {statement}"
+        process = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                                  code], env=env, capture_output=True,
+                                 text=True, check=True)
+        return self.parseImportTime(process.stderr)
+
+    def benchCase(self, statement: str, forbiddenModules: tuple) -> dict:
+        """
+        Time an import statement.
+
+        Params:
+            statement:          The import statement.
+            forbiddenModules:   The packages the statement must not load.
+
+        Return
+            The fastest import time in microseconds, the imported module
+            count and the forbidden modules imported.
+        """
+        bestEntries = None
+        bestImportTime = None
+        for roundIdx in range(self._roundCount):
+            entries = self._runStatement(statement)
+            importTime = self.calcImportTime(entries)
+            if bestImportTime is None or importTime < bestImportTime:
+                bestEntries = entries
+                bestImportTime = importTime
+        return {'importTime': bestImportTime,
+                'moduleCount': len(bestEntries),
+                'forbidden': self.findForbidden(bestEntries,
+                                                forbiddenModules)}
+
+    def runAll(self) -> dict:
+        """
+        Run every benchmark case.
+
+        Return
+            The results by case name.
+        """
+        return {name: self.benchCase(statement, forbiddenModules)
+                for name, (statement, forbiddenModules)
+                in self.cases.items()}
+
+
+def formatReport(results: dict, budgets: dict) -> str:
+    """
+    Format the benchmark report.
+
+    Params:
+        results:            The measured results by case name.
+        budgets:            The import time budgets by case name.
+
+    Return
+        The report table, times in microseconds.
+    """
+    lines = [f"{'case':<30}{'time':>10}{'modules':>10}{'budget':>10}"]
+    for name, result in results.items():
+        budget = budgets.get(name)
+        line = f"{name:<30}{result['importTime']:>10}" \
+            f"{result['moduleCount']:>10}"
+        line += f"{budget:>10}" if budget is not None else f"{'-':>10}"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    """
+    Run the benchmark suite and compare it to the stored budgets.
+
+    Return
+        The exit code, 1 if a case is over budget or loads a forbidden
+        module.
+    """
+    parser = ArgumentParser(description='Widgets packages cold start import '
+                            'time benchmark.')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='runs per case')
+    parser.add_argument('--budgets',
+                        default=ImportBenchmark.defaultBudgetsPath,
+                        help='budgets file path')
+    parser.add_argument('--headroom', type=float,
+                        default=ImportBenchmark.defaultHeadroom,
+                        help='relative headroom of the updated budgets')
+    parser.add_argument('--update-budgets', action='store_true',
+                        help='store the results as the new budgets')
+    args = parser.parse_args()
+
+    results = ImportBenchmark(args.rounds).runAll()
+    budgets = ImportBenchmark.loadBudgets(args.budgets)
+    print(formatReport(results, budgets))
+    isFailed = False
+    for name, result in results.items():
+        if result['forbidden']:
+            print(f"FORBIDDEN {name}: {', '.join(result['forbidden'])}")
+            isFailed = True
+    if args.update_budgets:
+        ImportBenchmark.saveBudgets(args.budgets, results, args.headroom)
+        print(f"Budgets stored in {args.budgets}")
+        return 1 if isFailed else 0
+    for name, budget, measured in ImportBenchmark.findOverBudget(results,
+                                                                 budgets):
+        print(f"OVER BUDGET {name}: {measured}us, budget {budget}us")
+        isFailed = True
+    return 1 if isFailed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,414 @@
+from argparse import ArgumentParser
+from time import perf_counter_ns
+
+import json
+import math
+import os
+import sys
+import tracemalloc
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.append(os.path.abspath('./src'))
+
+from PySide2.QtGui import QImage, QPainter, QPaintEvent         # noqa: E402
+from PySide2.QtWidgets import QApplication, QWidget             # noqa: E402
+
+from widgets.ledIndicator import LedIndicator, LedIndicatorColor, \
+    LedPalette                                                  # noqa: E402
+from widgets.waitingSpinner import WaitingSpinner               # noqa: E402
+
+
+class RenderBenchmark:
+    """
+    The headless rendering benchmark of the widgets.
+
+    Each case renders a real widget offscreen and times its paint event
+    handler only, frame by frame. The case is repeated and the round with
+    the lowest median is kept to filter out the machine noise. The per frame
+    percentiles are compared to the stored baselines to detect the rendering
+    regressions.
+    """
+    defaultBaselinesPath = os.path.join(os.path.dirname(__file__),
+                                        'baselines.json')
+    defaultThreshold = 0.5
+    reportedStats = ('mean', 'p50', 'p90', 'p99', 'max')
+    spinnerSizes = {'small': (5, 5, 1), 'medium': (10, 10, 2),
+                    'large': (40, 40, 6)}
+    spinnerLineCounts = (8, 20, 64)
+    spinnerFades = {'shortFade': (20.0, 10.0), 'longFade': (80.0, 3.14)}
+    ledSizes = (24, 64, 256)
+    maxDrawAllocation = 8
+
+    @staticmethod
+    def calcPercentile(samples: list, pct: float) -> float:
+        """
+        Calculate a percentile of the samples, interpolating between the
+        closest ranks.
+
+        Params:
+            samples:            The sorted samples.
+            pct:                The percentile to calculate (0 to 100).
+
+        Return
+            The samples percentile.
+        """
+        rank = (len(samples) - 1) * pct / 100
+        lowIdx = math.floor(rank)
+        highIdx = math.ceil(rank)
+        return samples[lowIdx] + \
+            (samples[highIdx] - samples[lowIdx]) * (rank - lowIdx)
+
+    @classmethod
+    def calcStats(cls, durations: list) -> dict:
+        """
+        Calculate the per frame statistics of the paint durations.
+
+        Params:
+            durations:          The paint durations in nanoseconds.
+
+        Return
+            The mean, median, 90th, 99th percentiles and maximum in
+            microseconds.
+        """
+        samples = sorted(duration / 1000 for duration in durations)
+        return {'mean': sum(samples) / len(samples),
+                'p50': cls.calcPercentile(samples, 50),
+                'p90': cls.calcPercentile(samples, 90),
+                'p99': cls.calcPercentile(samples, 99),
+                'max': samples[-1]}
+
+    @staticmethod
+    def findRegressions(results: dict, baselines: dict,
+                        threshold: float) -> list:
+        """
+        Find the cases whose median paint duration exceeds their baseline by
+        more than the threshold. The cases without baseline are ignored.
+
+        Params:
+            results:            The measured statistics by case name.
+            baselines:          The baseline statistics by case name.
+            threshold:          The allowed relative slowdown.
+
+        Return
+            The list of (case name, baseline, measured) median durations of
+            the regressed cases.
+        """
+        regressions = []
+        for name, stats in results.items():
+            baseline = baselines.get(name)
+            if baseline is None:
+                continue
+            if stats['p50'] > baseline['p50'] * (1 + threshold):
+                regressions.append((name, baseline['p50'], stats['p50']))
+        return regressions
+
+    @staticmethod
+    def loadBaselines(path: str) -> dict:
+        """
+        Load the stored baselines.
+
+        Params:
+            path:               The baselines file path.
+
+        Return
+            The baseline statistics by case name, empty if the file does not
+            exist.
+        """
+        if not os.path.exists(path):
+            return {}
+        with open(path) as baselinesFile:
+            return json.load(baselinesFile)
+
+    @staticmethod
+    def saveBaselines(path: str, results: dict) -> None:
+        """
+        Store the results as the new baselines.
+
+        Params:
+            path:               The baselines file path.
+            results:            The measured statistics by case name.
+        """
+        baselines = {name: {stat: round(value, 1)
+                            for stat, value in stats.items()}
+                     for name, stats in results.items()}
+        with open(path, 'w') as baselinesFile:
+            json.dump(baselines, baselinesFile, indent=2, sort_keys=True)
+            baselinesFile.write('\n')
+
+    def __init__(self, frameCount: int = 300, warmupCount: int = 30,
+                 roundCount: int = 5) -> None:
+        """
+        Constructor.
+
+        Params:
+            frameCount:         The number of timed frames per round.
+            warmupCount:        The number of untimed frames per case.
+            roundCount:         The number of timed rounds per case.
+        """
+        self._app = QApplication.instance() or QApplication([])
+        self._frameCount = frameCount
+        self._warmupCount = warmupCount
+        self._roundCount = roundCount
+        self._durations = []
+
+    def _createTimedWidget(self, widgetCls: type, *args) -> QWidget:
+        """
+        Create a widget whose paint event handler records its duration.
+
+        Params:
+            widgetCls:          The benchmarked widget class.
+            args:               The widget constructor arguments.
+
+        Return
+            The timed widget.
+        """
+        durations = self._durations
+
+        def paintEvent(widget: QWidget, event: QPaintEvent) -> None:
+            start = perf_counter_ns()
+            widgetCls.paintEvent(widget, event)
+            durations.append(perf_counter_ns() - start)
+
+        timedCls = type(f"Timed{widgetCls.__name__}", (widgetCls,),
+                        {'paintEvent': paintEvent})
+        return timedCls(*args)
+
+    def _timeFrames(self, widget: QWidget, nextFrame: callable) -> dict:
+        """
+        Render the widget frames offscreen and time their painting.
+
+        Params:
+            widget:             The timed widget.
+            nextFrame:          The callback preparing the next frame.
+
+        Return
+            The per frame statistics of the round with the lowest median.
+        """
+        image = QImage(widget.size(), QImage.Format_ARGB32_Premultiplied)
+        bestStats = None
+        for roundIdx in range(self._roundCount):
+            frameCount = self._frameCount
+            if roundIdx == 0:
+                frameCount += self._warmupCount
+            for frame in range(frameCount):
+                nextFrame()
+                image.fill(0)
+                widget.render(image)
+            stats = self.calcStats(self._durations[-self._frameCount:])
+            self._durations.clear()
+            if bestStats is None or stats['p50'] < bestStats['p50']:
+                bestStats = stats
+        return bestStats
+
+    def benchSpinner(self, lineCount: int, size: tuple,
+                     fade: tuple) -> dict:
+        """
+        Time the WaitingSpinner paint event handler.
+
+        Params:
+            lineCount:          The spinner line count.
+            size:               The inner radius, line length and line width.
+            fade:               The trail fade percentage and minimum trail
+                                opacity.
+
+        Return
+            The per frame statistics.
+        """
+        spinner = self._createTimedWidget(WaitingSpinner, None)
+        spinner.configure(lineCount=lineCount, innerRadius=size[0],
+                          lineLength=size[1], lineWidth=size[2],
+                          trailFadePct=fade[0], minTrailOpacity=fade[1])
+        stats = self._timeFrames(spinner, spinner._rotate)
+        spinner.deleteLater()
+        return stats
+
+    def benchLed(self, size: int, isChecked: bool) -> dict:
+        """
+        Time the LedIndicator paint event handler.
+
+        Params:
+            size:               The indicator size.
+            isChecked:          The indicator checked state.
+
+        Return
+            The per frame statistics.
+        """
+        led = self._createTimedWidget(LedIndicator)
+        led.resize(size, size)
+        led.setChecked(isChecked)
+        stats = self._timeFrames(led, lambda: None)
+        led.deleteLater()
+        return stats
+
+    def measureAllocations(self, draw: callable) -> int:
+        """
+        Measure the Python memory steady state draw calls keep allocated.
+        The calls are warmed up first, then the traced memory difference over
+        every timed call, in a single tracing window, is averaged. The
+        interpreter and tracing overhead of a call, which depends on the
+        Python version, is released when the call returns and so does not
+        add up, unlike the memory the draw calls keep allocating.
+
+        Params:
+            draw:               The draw call to measure.
+
+        Return
+            The allocated byte count per call.
+        """
+        for frame in range(self._warmupCount):
+            draw()
+        tracemalloc.start()
+        startByteCount = tracemalloc.get_traced_memory()[0]
+        for frame in range(self._frameCount):
+            draw()
+        byteCount = tracemalloc.get_traced_memory()[0] - startByteCount
+        tracemalloc.stop()
+        return max(round(byteCount / self._frameCount), 0)
+
+    def benchLedAllocations(self, size: int, isChecked: bool) -> int:
+        """
+        Measure the allocations of the LedIndicator drawing path, bypassing
+        its rendered pixmap cache.
+
+        Params:
+            size:               The indicator size.
+            isChecked:          The indicator checked state.
+
+        Return
+            The allocated byte count per draw.
+        """
+        palette = LedPalette.get(LedIndicatorColor.GRN)
+        image = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+
+        def draw() -> None:
+            painter.save()
+            LedIndicator._drawIndicator(painter, palette, isChecked, size,
+                                        size)
+            painter.restore()
+
+        byteCount = self.measureAllocations(draw)
+        painter.end()
+        return byteCount
+
+    def runAllocations(self) -> dict:
+        """
+        Run every allocation case.
+
+        Return
+            The allocated byte count per draw by case name.
+        """
+        results = {}
+        for size in self.ledSizes:
+            for isChecked in (False, True):
+                state = 'on' if isChecked else 'off'
+                results[f"led/{size}px/{state}/draw"] = \
+                    self.benchLedAllocations(size, isChecked)
+        return results
+
+    def runAll(self) -> dict:
+        """
+        Run every benchmark case.
+
+        Return
+            The per frame statistics by case name.
+        """
+        results = {}
+        for lineCount in self.spinnerLineCounts:
+            for sizeName, size in self.spinnerSizes.items():
+                for fadeName, fade in self.spinnerFades.items():
+                    name = f"spinner/{lineCount}lines/{sizeName}/{fadeName}"
+                    results[name] = self.benchSpinner(lineCount, size, fade)
+        for size in self.ledSizes:
+            for isChecked in (False, True):
+                state = 'on' if isChecked else 'off'
+                results[f"led/{size}px/{state}"] = \
+                    self.benchLed(size, isChecked)
+        return results
+
+
+def formatReport(results: dict, baselines: dict) -> str:
+    """
+    Format the benchmark report.
+
+    Params:
+        results:            The measured statistics by case name.
+        baselines:          The baseline statistics by case name.
+
+    Return
+        The report table, durations in microseconds.
+    """
+    header = f"{'case':<40}" + \
+        ''.join(f"{stat:>10}" for stat in RenderBenchmark.reportedStats) + \
+        f"{'baseline':>10}"
+    lines = [header]
+    for name, stats in results.items():
+        baseline = baselines.get(name, {}).get('p50')
+        line = f"{name:<40}" + \
+            ''.join(f"{stats[stat]:>10.1f}"
+                    for stat in RenderBenchmark.reportedStats)
+        line += f"{baseline:>10.1f}" if baseline is not None else \
+            f"{'-':>10}"
+        lines.append(line)
+    return '\n'.join(lines)
+
+
+def formatAllocationReport(allocations: dict) -> str:
+    """
+    Format the allocation report.
+
+    Params:
+        allocations:        The allocated byte count per draw by case
+                            name.
+
+    Return
+        The report table, in bytes per draw.
+    """
+    lines = [f"{'case':<40}{'bytes':>10}"]
+    for name, byteCount in allocations.items():
+        lines.append(f"{name:<40}{byteCount:>10}")
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    """
+    Run the benchmark suite and compare it to the stored baselines.
+
+    Return
+        The exit code, 1 if a case regressed over the threshold.
+    """
+    parser = ArgumentParser(description='Headless widgets rendering '
+                            'benchmark.')
+    parser.add_argument('--frames', type=int, default=300,
+                        help='timed frames per case')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='timed rounds per case')
+    parser.add_argument('--threshold', type=float,
+                        default=RenderBenchmark.defaultThreshold,
+                        help='allowed relative median slowdown')
+    parser.add_argument('--baselines',
+                        default=RenderBenchmark.defaultBaselinesPath,
+                        help='baselines file path')
+    parser.add_argument('--update-baselines', action='store_true',
+                        help='store the results as the new baselines')
+    args = parser.parse_args()
+
+    benchmark = RenderBenchmark(args.frames, roundCount=args.rounds)
+    results = benchmark.runAll()
+    baselines = RenderBenchmark.loadBaselines(args.baselines)
+    print(formatReport(results, baselines))
+    print(formatAllocationReport(benchmark.runAllocations()))
+    if args.update_baselines:
+        RenderBenchmark.saveBaselines(args.baselines, results)
+        print(f"Baselines stored in {args.baselines}")
+        return 0
+    regressions = RenderBenchmark.findRegressions(results, baselines,
+                                                  args.threshold)
+    for name, baseline, measured in regressions:
+        print(f"REGRESSION {name}: median {measured:.1f}us, baseline "
+              f"{baseline:.1f}us")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+from unittest import skipUnless, TestCase
+from unittest.mock import mock_open, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./tests/benchmarks'))
+
+from importBenchmark import ImportBenchmark                     # noqa: E402
+
+
+class TestImportBenchmark(TestCase):
+    """
+    The ImportBenchmark class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.testOutput = '\n'.join((
+            'import time: self [us] | cumulative | imported package',
+            'import time:       100 |        100 | site',
+            ImportBenchmark.startMarker,
+            'import time: self [us] | cumulative | imported package',
+            'import time:        10 |         10 |     PySide2.support',
+            'import time:        30 |         40 |   PySide2',
+            'import time:        50 |         90 | widgets.ledIndicator',
+            'import time:        20 |         20 | enum'))
+        self.testEntries = [('PySide2.support', 10, 10, 2),
+                            ('PySide2', 30, 40, 1),
+                            ('widgets.ledIndicator', 50, 90, 0),
+                            ('enum', 20, 20, 0)]
+
+    def test_parseImportTime(self) -> None:
+        """
+        The parseImportTime method must return the entries of the modules
+        imported after the start marker only.
+        """
+        result = ImportBenchmark.parseImportTime(self.testOutput)
+        self.assertEqual(result, self.testEntries, 'parseImportTime failed '
+                         'to return the statement import entries.')
+
+    def test_calcImportTime(self) -> None:
+        """
+        The calcImportTime method must sum the cumulative time of the top
+        level modules.
+        """
+        result = ImportBenchmark.calcImportTime(self.testEntries)
+        self.assertEqual(result, 110, 'calcImportTime failed to return the '
+                         'statement import time.')
+
+    def test_findForbidden(self) -> None:
+        """
+        The findForbidden method must return the forbidden packages and
+        their submodules only.
+        """
+        testEntries = self.testEntries + [('PySide2Extra', 1, 1, 0)]
+        result = ImportBenchmark.findForbidden(testEntries, ('PySide2',))
+        self.assertEqual(result, ['PySide2', 'PySide2.support'],
+                         'findForbidden failed to return the forbidden '
+                         'modules.')
+
+    def test_findOverBudget(self) -> None:
+        """
+        The findOverBudget method must return the cases whose import time
+        exceeds their budget.
+        """
+        testResults = {'fast': {'importTime': 90},
+                       'slow': {'importTime': 200},
+                       'new': {'importTime': 1000}}
+        testBudgets = {'fast': 100, 'slow': 100}
+        result = ImportBenchmark.findOverBudget(testResults, testBudgets)
+        self.assertEqual(result, [('slow', 100, 200)], 'findOverBudget '
+                         'failed to return the cases over budget.')
+
+    def test_loadBudgetsMissing(self) -> None:
+        """
+        The loadBudgets method must return no budget when the file does not
+        exist.
+        """
+        with patch('importBenchmark.os.path.exists') as mockedExists:
+            mockedExists.return_value = False
+            result = ImportBenchmark.loadBudgets('test/path.json')
+        self.assertEqual(result, {}, 'loadBudgets failed to return no '
+                         'budget.')
+
+    def test_saveBudgets(self) -> None:
+        """
+        The saveBudgets method must store the results with the headroom.
+        """
+        testResults = {'case': {'importTime': 1001}}
+        mockedOpen = mock_open()
+        with patch('builtins.open', mockedOpen), \
+                patch('importBenchmark.json.dump') as mockedDump:
+            ImportBenchmark.saveBudgets('test/path.json', testResults, 0.5)
+            mockedOpen.assert_called_once_with('test/path.json', 'w')
+            self.assertEqual(mockedDump.call_args.args[0], {'case': 1502},
+                             'saveBudgets failed to store the budgets.')
+
+    def test_runStatement(self) -> None:
+        """
+        The _runStatement method must run the statement after the start
+        marker in a fresh interpreter reporting its import times.
+        """
+        dut = ImportBenchmark(srcPath='test/src')
+        with patch('importBenchmark.subprocess.run') as mockedRun:
+            mockedRun.return_value.stderr = self.testOutput
+            result = dut._runStatement('import widgets')
+        args = mockedRun.call_args.args[0]
+        self.assertEqual(args[:4], [sys.executable, '-X', 'importtime',
+                                    '-c'], '_runStatement failed to report '
+                         'the import times.')
+        self.assertTrue(args[4].endswith(f"{ImportBenchmark.startMarker!r}, "
+                                         f"file=sys.stderr, flush=True); "
+                                         f"import widgets"),
+                        '_runStatement failed to run the statement after the '
+                        'start marker.')
+        self.assertEqual(mockedRun.call_args.kwargs['env']['PYTHONPATH'],
+                         'test/src', '_runStatement failed to set the '
+                         'widgets path.')
+        self.assertEqual(result, self.testEntries, '_runStatement failed to '
+                         'return the statement import entries.')
+
+    def test_benchCase(self) -> None:
+        """
+        The benchCase method must keep the fastest run.
+        """
+        dut = ImportBenchmark(roundCount=3)
+        testRuns = (self.testEntries, self.testEntries[2:3],
+                    self.testEntries)
+        with patch.object(dut, '_runStatement') as mockedRun:
+            mockedRun.side_effect = testRuns
+            result = dut.benchCase('import widgets', ('PySide2',))
+        self.assertEqual(result, {'importTime': 90, 'moduleCount': 1,
+                                  'forbidden': []}, 'benchCase failed to '
+                         'return the fastest run.')
+
+    def test_lazyImports(self) -> None:
+        """
+        The widgets packages and the LED colors must be imported without
+        loading Qt.
+        """
+        dut = ImportBenchmark(roundCount=1)
+        for name, (statement, forbiddenModules) in dut.cases.items():
+            if forbiddenModules:
+                result = dut.benchCase(statement, forbiddenModules)
+                self.assertEqual(result['forbidden'], [], f"The {name} "
+                                 f"import loaded forbidden modules.")
+
+    @skipUnless(os.environ.get('RUN_IMPORT_BENCHMARKS'), 'The import '
+                'benchmarks only run when RUN_IMPORT_BENCHMARKS is set.')
+    def test_importBudgets(self) -> None:
+        """
+        No import case must exceed its stored budget.
+        """
+        results = ImportBenchmark().runAll()
+        budgets = ImportBenchmark.loadBudgets(
+            ImportBenchmark.defaultBudgetsPath)
+        self.assertEqual(ImportBenchmark.findOverBudget(results, budgets),
+                         [], 'The imports exceeded their budgets.')
@@ -0,0 +1,144 @@
+from unittest import skipUnless, TestCase
+from unittest.mock import Mock, mock_open, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./tests/benchmarks'))
+
+from renderBenchmark import RenderBenchmark                     # noqa: E402
+
+
+class TestRenderBenchmark(TestCase):
+    """
+    The RenderBenchmark class test cases.
+    """
+    def test_calcPercentile(self) -> None:
+        """
+        The calcPercentile method must return the samples percentile,
+        interpolated between the closest ranks.
+        """
+        testSamples = [1.0, 2.0, 3.0, 4.0, 5.0]
+        testPcts = (0, 50, 90, 100)
+        expectedResults = (1.0, 3.0, 4.6, 5.0)
+        for testPct, expectedResult in zip(testPcts, expectedResults):
+            result = RenderBenchmark.calcPercentile(testSamples, testPct)
+            self.assertAlmostEqual(result, expectedResult, msg='calcPercentile'
+                                   ' failed to return the percentile.')
+
+    def test_calcStats(self) -> None:
+        """
+        The calcStats method must return the per frame statistics in
+        microseconds.
+        """
+        testDurations = [4000, 1000, 3000, 2000]
+        result = RenderBenchmark.calcStats(testDurations)
+        self.assertEqual(result['mean'], 2.5, 'calcStats failed to return the '
+                         'mean duration.')
+        self.assertEqual(result['p50'], 2.5, 'calcStats failed to return the '
+                         'median duration.')
+        self.assertEqual(result['max'], 4.0, 'calcStats failed to return the '
+                         'maximum duration.')
+        self.assertAlmostEqual(result['p99'], 3.97, msg='calcStats failed to '
+                               'return the 99th percentile.')
+
+    def test_findRegressions(self) -> None:
+        """
+        The findRegressions method must return the cases whose median exceeds
+        their baseline by more than the threshold.
+        """
+        testResults = {'fast': {'p50': 10.0}, 'slow': {'p50': 20.0},
+                       'new': {'p50': 100.0}}
+        testBaselines = {'fast': {'p50': 9.0}, 'slow': {'p50': 10.0}}
+        result = RenderBenchmark.findRegressions(testResults, testBaselines,
+                                                 0.5)
+        self.assertEqual(result, [('slow', 10.0, 20.0)], 'findRegressions '
+                         'failed to return the regressed cases.')
+
+    def test_loadBaselinesMissing(self) -> None:
+        """
+        The loadBaselines method must return no baseline when the file does
+        not exist.
+        """
+        with patch('renderBenchmark.os.path.exists') as mockedExists:
+            mockedExists.return_value = False
+            result = RenderBenchmark.loadBaselines('test/path.json')
+        self.assertEqual(result, {}, 'loadBaselines failed to return no '
+                         'baseline.')
+
+    def test_loadBaselines(self) -> None:
+        """
+        The loadBaselines method must return the stored baselines.
+        """
+        testContent = '{"case": {"p50": 1.5}}'
+        with patch('renderBenchmark.os.path.exists') as mockedExists, \
+                patch('builtins.open', mock_open(read_data=testContent)):
+            mockedExists.return_value = True
+            result = RenderBenchmark.loadBaselines('test/path.json')
+        self.assertEqual(result, {'case': {'p50': 1.5}}, 'loadBaselines '
+                         'failed to return the stored baselines.')
+
+    def test_saveBaselines(self) -> None:
+        """
+        The saveBaselines method must store the rounded results.
+        """
+        testResults = {'case': {'p50': 1.54321}}
+        mockedOpen = mock_open()
+        with patch('builtins.open', mockedOpen), \
+                patch('renderBenchmark.json.dump') as mockedDump:
+            RenderBenchmark.saveBaselines('test/path.json', testResults)
+            mockedOpen.assert_called_once_with('test/path.json', 'w')
+            self.assertEqual(mockedDump.call_args.args[0],
+                             {'case': {'p50': 1.5}}, 'saveBaselines failed to '
+                             'store the rounded results.')
+
+    def test_measureAllocations(self) -> None:
+        """
+        The measureAllocations method must warm up the draw call and return
+        the traced memory difference over every timed call of a single
+        tracing window, per call.
+        """
+        dut = RenderBenchmark.__new__(RenderBenchmark)
+        dut._warmupCount = 2
+        dut._frameCount = 4
+        mockedDraw = Mock()
+        with patch('renderBenchmark.tracemalloc') as mockedTracemalloc:
+            mockedTracemalloc.get_traced_memory.side_effect = \
+                ((100, 100), (140, 400))
+            result = dut.measureAllocations(mockedDraw)
+            mockedTracemalloc.start.assert_called_once()
+            mockedTracemalloc.stop.assert_called_once()
+        self.assertEqual(mockedDraw.call_count, 6, 'measureAllocations '
+                         'failed to warm up the draw call.')
+        self.assertEqual(result, 10, 'measureAllocations failed to return '
+                         'the allocation per call.')
+
+    @skipUnless(os.environ.get('RUN_RENDER_BENCHMARKS'), 'The rendering '
+                'benchmarks only run when RUN_RENDER_BENCHMARKS is set.')
+    def test_ledDrawAllocations(self) -> None:
+        """
+        The LedIndicator drawing path must not keep allocating in steady
+        state, its gradients, brushes and pen being reused.
+        """
+        allocations = RenderBenchmark().runAllocations()
+        for name, byteCount in allocations.items():
+            self.assertLessEqual(byteCount, RenderBenchmark.maxDrawAllocation,
+                                 f"The {name} drawing allocated in steady "
+                                 f"state.")
+
+    @skipUnless(os.environ.get('RUN_RENDER_BENCHMARKS'), 'The rendering '
+                'benchmarks only run when RUN_RENDER_BENCHMARKS is set.')
+    def test_noRegression(self) -> None:
+        """
+        No rendering case must regress over the threshold compared to the
+        stored baselines.
+        """
+        threshold = float(os.environ.get('RENDER_BENCHMARK_THRESHOLD',
+                                         RenderBenchmark.defaultThreshold))
+        results = RenderBenchmark().runAll()
+        baselines = RenderBenchmark.loadBaselines(
+            RenderBenchmark.defaultBaselinesPath)
+        regressions = RenderBenchmark.findRegressions(results, baselines,
+                                                      threshold)
+        self.assertEqual(regressions, [], 'The rendering regressed over the '
+                         'baselines.')
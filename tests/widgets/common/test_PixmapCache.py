@@ -0,0 +1,212 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.common import PixmapCache                          # noqa: E402
+
+
+class TestPixmapCache(TestCase):
+    """
+    The PixmapCache class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.byteBudget = 1000
+        self.dut = PixmapCache(self.byteBudget)
+
+    def _createPixmap(self, byteCount: int) -> Mock:
+        """
+        Create a mocked pixmap of the given byte count.
+        """
+        pixmap = Mock()
+        pixmap.width.return_value = byteCount
+        pixmap.height.return_value = 1
+        pixmap.depth.return_value = 8
+        return pixmap
+
+    def test_instance(self) -> None:
+        """
+        The instance method must create the shared cache once and return it
+        afterward.
+        """
+        with patch.object(PixmapCache, '_instance', None):
+            result = PixmapCache.instance()
+            self.assertIsInstance(result, PixmapCache, 'instance '
+                                  'failed to create the shared cache.')
+            self.assertIs(PixmapCache.instance(), result, 'instance '
+                          'failed to return the shared cache.')
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must initialize the cache empty with the given byte
+        budget.
+        """
+        self.assertEqual(self.dut._byteBudget, self.byteBudget, 'The '
+                         'constructor failed to set the byte budget.')
+        self.assertEqual(self.dut.getEntryCount(), 0, 'The constructor '
+                         'failed to initialize an empty cache.')
+        self.assertEqual(self.dut.getByteCount(), 0, 'The constructor '
+                         'failed to initialize an empty cache.')
+
+    def test_constructorDefaultBudget(self) -> None:
+        """
+        The constructor must use the class default byte budget when no byte
+        budget is given.
+        """
+        with patch.object(PixmapCache, 'defaultByteBudget', 123):
+            dut = PixmapCache()
+        self.assertEqual(dut.getByteBudget(), 123, 'The constructor failed '
+                         'to use the default byte budget.')
+
+    def test_calcByteCount(self) -> None:
+        """
+        The _calcByteCount method must return the pixmap byte count.
+        """
+        pixmap = Mock()
+        pixmap.width.return_value = 100
+        pixmap.height.return_value = 20
+        pixmap.depth.return_value = 32
+        result = self.dut._calcByteCount(pixmap)
+        self.assertEqual(result, 8000, '_calcByteCount failed to return the '
+                         'pixmap byte count.')
+
+    def test_getMiss(self) -> None:
+        """
+        The get method must return None and count a miss when the key is not
+        in the cache.
+        """
+        result = self.dut.get(('test', 'key'))
+        self.assertIsNone(result, 'get failed to return None on a miss.')
+        self.assertEqual(self.dut.getMissCount(), 1, 'get failed to count '
+                         'the miss.')
+        self.assertEqual(self.dut.getHitCount(), 0, 'get failed to count '
+                         'the miss.')
+
+    def test_getHit(self) -> None:
+        """
+        The get method must return the pixmap and count a hit when the key
+        is in the cache.
+        """
+        pixmap = self._createPixmap(100)
+        self.dut.insert('key', pixmap)
+        result = self.dut.get('key')
+        self.assertEqual(result, pixmap, 'get failed to return the cached '
+                         'pixmap.')
+        self.assertEqual(self.dut.getHitCount(), 1, 'get failed to count '
+                         'the hit.')
+        self.assertEqual(self.dut.getMissCount(), 0, 'get failed to count '
+                         'the hit.')
+
+    def test_insert(self) -> None:
+        """
+        The insert method must store the pixmaps and account for their
+        byte count.
+        """
+        self.dut.insert('key1', self._createPixmap(100))
+        self.dut.insert('key2', self._createPixmap(200))
+        self.assertEqual(self.dut.getEntryCount(), 2, 'insert failed to '
+                         'store the pixmaps.')
+        self.assertEqual(self.dut.getByteCount(), 300, 'insert failed to '
+                         'account for the pixmap byte count.')
+        self.dut.insert('key1', self._createPixmap(50))
+        self.assertEqual(self.dut.getEntryCount(), 2, 'insert failed to '
+                         'replace the pixmap.')
+        self.assertEqual(self.dut.getByteCount(), 250, 'insert failed to '
+                         'account for the replaced pixmap byte count.')
+
+    def test_insertTooBig(self) -> None:
+        """
+        The insert method must not store a pixmap bigger than the byte budget.
+        """
+        self.dut.insert('key', self._createPixmap(self.byteBudget + 1))
+        self.assertEqual(self.dut.getEntryCount(), 0, 'insert failed to '
+                         'reject the pixmap bigger than the budget.')
+        self.assertEqual(self.dut.getByteCount(), 0, 'insert failed to '
+                         'reject the pixmap bigger than the budget.')
+
+    def test_insertEvictLeastRecentlyUsed(self) -> None:
+        """
+        The insert method must evict the least recently used entries to fit
+        in the byte budget.
+        """
+        self.dut.insert('key1', self._createPixmap(400))
+        self.dut.insert('key2', self._createPixmap(400))
+        self.dut.get('key1')
+        self.dut.insert('key3', self._createPixmap(400))
+        self.assertIsNone(self.dut.get('key2'), 'insert failed to evict the '
+                          'least recently used entry.')
+        self.assertIsNotNone(self.dut.get('key1'), 'insert failed to keep '
+                             'the recently used entry.')
+        self.assertIsNotNone(self.dut.get('key3'), 'insert failed to store '
+                             'the new entry.')
+        self.assertEqual(self.dut.getEvictionCount(), 1, 'insert failed to '
+                         'count the eviction.')
+        self.assertEqual(self.dut.getByteCount(), 800, 'insert failed to '
+                         'account for the evicted pixmap.')
+
+    def test_remove(self) -> None:
+        """
+        The remove method must remove the entry and its byte count.
+        """
+        self.dut.insert('key', self._createPixmap(100))
+        self.dut.remove('key')
+        self.dut.remove('unknown key')
+        self.assertEqual(self.dut.getEntryCount(), 0, 'remove failed to '
+                         'remove the entry.')
+        self.assertEqual(self.dut.getByteCount(), 0, 'remove failed to '
+                         'account for the removed pixmap.')
+
+    def test_clear(self) -> None:
+        """
+        The clear method must remove every entry.
+        """
+        self.dut.insert('key1', self._createPixmap(100))
+        self.dut.insert('key2', self._createPixmap(100))
+        self.dut.clear()
+        self.assertEqual(self.dut.getEntryCount(), 0, 'clear failed to '
+                         'remove every entry.')
+        self.assertEqual(self.dut.getByteCount(), 0, 'clear failed to '
+                         'reset the byte count.')
+
+    def test_resetStats(self) -> None:
+        """
+        The resetStats method must reset the hit, miss and eviction counters.
+        """
+        self.dut._hitCount = 1
+        self.dut._missCount = 2
+        self.dut._evictionCount = 3
+        self.dut.resetStats()
+        self.assertEqual((self.dut.getHitCount(), self.dut.getMissCount(),
+                          self.dut.getEvictionCount()), (0, 0, 0),
+                         'resetStats failed to reset the counters.')
+
+    def test_getByteBudget(self) -> None:
+        """
+        The getByteBudget method must return the byte budget.
+        """
+        result = self.dut.getByteBudget()
+        self.assertEqual(result, self.byteBudget, 'getByteBudget failed to '
+                         'return the byte budget.')
+
+    def test_setByteBudget(self) -> None:
+        """
+        The setByteBudget method must set the byte budget and evict the
+        least recently used entries to fit in it.
+        """
+        self.dut.insert('key1', self._createPixmap(400))
+        self.dut.insert('key2', self._createPixmap(400))
+        self.dut.setByteBudget(500)
+        self.assertEqual(self.dut.getByteBudget(), 500, 'setByteBudget '
+                         'failed to set the byte budget.')
+        self.assertIsNone(self.dut.get('key1'), 'setByteBudget failed to '
+                          'evict the least recently used entry.')
+        self.assertEqual(self.dut.getByteCount(), 400, 'setByteBudget '
+                         'failed to fit in the new budget.')
+        self.assertEqual(self.dut.getEvictionCount(), 1, 'setByteBudget '
+                         'failed to count the eviction.')
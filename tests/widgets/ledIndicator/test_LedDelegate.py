@@ -0,0 +1,172 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from PySide2.QtCore import QPoint, QRect, Qt
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.ledIndicator import LedIndicatorColor              # noqa: E402
+from widgets.ledIndicator.ledDelegate import LedDelegate        # noqa: E402
+
+
+class TestLedDelegate(TestCase):
+    """
+    The LedDelegate class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.module = 'widgets.ledIndicator.ledDelegate'
+        self.baseCls = f"{self.module}.QStyledItemDelegate"
+        self.ledCls = f"{self.module}.LedIndicator"
+        self.optionCls = f"{self.module}.QStyleOptionViewItem"
+        self.view = Mock()
+        with patch(f"{self.baseCls}.__init__"):
+            self.dut = LedDelegate(self.view)
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must initialize the delegate with the LED role and
+        the default color.
+        """
+        with patch(f"{self.baseCls}.__init__") as mockedBaseClsConst:
+            dut = LedDelegate(self.view, Qt.UserRole + 3,
+                              LedIndicatorColor.RED)
+            mockedBaseClsConst.assert_called_once_with(self.view)
+        self.assertEqual(dut.getLedRole(), Qt.UserRole + 3, 'The '
+                         'constructor failed to set the LED role.')
+        self.assertEqual(dut.getDefaultColor(), LedIndicatorColor.RED,
+                         'The constructor failed to set the default color.')
+
+    def test_getLedState(self) -> None:
+        """
+        The _getLedState method must return the LED state and color of the
+        cell, None if the cell has no LED.
+        """
+        testData = (None, True, 0, (1, LedIndicatorColor.BLU),
+                    [False, LedIndicatorColor.YEL])
+        expectedResults = (None, (True, LedIndicatorColor.GRN),
+                           (False, LedIndicatorColor.GRN),
+                           (True, LedIndicatorColor.BLU),
+                           (False, LedIndicatorColor.YEL))
+        for data, expectedResult in zip(testData, expectedResults):
+            mockedIndex = Mock()
+            mockedIndex.data.return_value = data
+            result = self.dut._getLedState(mockedIndex)
+            mockedIndex.data.assert_called_once_with(Qt.UserRole)
+            self.assertEqual(result, expectedResult, '_getLedState failed to '
+                             'return the LED state.')
+
+    def test_setLedRole(self) -> None:
+        """
+        The setLedRole method must set the LED role and repaint the view.
+        """
+        self.dut.setLedRole(Qt.UserRole + 1)
+        self.assertEqual(self.dut.getLedRole(), Qt.UserRole + 1, 'setLedRole '
+                         'failed to set the LED role.')
+        self.view.viewport.return_value.update.assert_called_once()
+
+    def test_setDefaultColor(self) -> None:
+        """
+        The setDefaultColor method must set the default color and repaint
+        the view.
+        """
+        self.dut.setDefaultColor(LedIndicatorColor.YEL)
+        self.assertEqual(self.dut.getDefaultColor(), LedIndicatorColor.YEL,
+                         'setDefaultColor failed to set the default color.')
+        self.view.viewport.return_value.update.assert_called_once()
+
+    def test_paintNoLed(self) -> None:
+        """
+        The paint method must let the base class paint the cells without
+        LED.
+        """
+        with patch(f"{self.baseCls}.paint") as mockedBasePaint, \
+                patch.object(self.dut, '_getLedState') as mockedGetState, \
+                patch(f"{self.ledCls}.getRenderedPixmap") \
+                as mockedGetPixmap:
+            mockedGetState.return_value = None
+            self.dut.paint('painter', 'option', 'index')
+            mockedBasePaint.assert_called_once_with('painter', 'option',
+                                                    'index')
+            mockedGetPixmap.assert_not_called()
+
+    def test_paintLed(self) -> None:
+        """
+        The paint method must paint the background of a LED cell without its
+        content and the LED centered over it.
+        """
+        mockedPainter = Mock()
+        mockedPainter.device.return_value.devicePixelRatioF.return_value = 2.0
+        mockedOption = Mock()
+        mockedCellOption = Mock()
+        mockedOption.rect = QRect(10, 20, 60, 20)
+        with patch(f"{self.baseCls}.paint") as mockedBasePaint, \
+                patch(self.optionCls) as mockedOptionConst, \
+                patch(f"{self.module}.QIcon") as mockedIconConst, \
+                patch(f"{self.module}.QStyle") as mockedStyleCls, \
+                patch.object(self.dut, 'initStyleOption') as mockedInitOpt, \
+                patch.object(self.dut, '_getLedState') as mockedGetState, \
+                patch(f"{self.ledCls}.getRenderedPixmap") \
+                as mockedGetPixmap:
+            mockedGetState.return_value = (True, LedIndicatorColor.RED)
+            mockedOptionConst.return_value = mockedCellOption
+            self.dut.paint(mockedPainter, mockedOption, 'index')
+            mockedBasePaint.assert_not_called()
+            mockedInitOpt.assert_called_once_with(mockedCellOption, 'index')
+            self.assertEqual(mockedCellOption.text, '', 'paint failed to '
+                             'hide the cell text.')
+            self.assertEqual(mockedCellOption.icon,
+                             mockedIconConst.return_value, 'paint failed to '
+                             'hide the cell icon.')
+            mockedCellOption.widget.style.return_value.drawControl \
+                .assert_called_once_with(mockedStyleCls.CE_ItemViewItem,
+                                         mockedCellOption, mockedPainter,
+                                         mockedCellOption.widget)
+            mockedGetPixmap.assert_called_once_with(LedIndicatorColor.RED,
+                                                    True, 20, 20, 2.0)
+            mockedPainter.drawPixmap \
+                .assert_called_once_with(QPoint(30, 20),
+                                         mockedGetPixmap.return_value)
+
+    def test_paintManyColors(self) -> None:
+        """
+        The paint method must not keep any state per LED color, so painting
+        LEDs of arbitrary colors does not grow the delegate.
+        """
+        mockedOption = Mock()
+        mockedOption.rect = QRect(0, 0, 20, 20)
+        attributes = dict(vars(self.dut))
+        with patch(self.optionCls), patch(f"{self.module}.QStyle"), \
+                patch(f"{self.module}.QIcon"), \
+                patch.object(self.dut, 'initStyleOption'), \
+                patch.object(self.dut, '_getLedState') as mockedGetState, \
+                patch(f"{self.ledCls}.getRenderedPixmap") \
+                as mockedGetPixmap:
+            for red in range(100):
+                mockedGetState.return_value = (True, (red, 0, 0))
+                self.dut.paint(Mock(), mockedOption, 'index')
+            self.assertEqual(mockedGetPixmap.call_count, 100, 'paint failed '
+                             'to render the LEDs.')
+        self.assertEqual(vars(self.dut), attributes, 'paint failed to keep '
+                         'no state per LED color.')
+
+    def test_paintEmptyCell(self) -> None:
+        """
+        The paint method must not render a LED in an empty cell.
+        """
+        mockedOption = Mock()
+        mockedOption.rect = QRect(0, 0, 0, 20)
+        with patch(self.optionCls), patch(f"{self.module}.QStyle"), \
+                patch(f"{self.module}.QIcon"), \
+                patch.object(self.dut, 'initStyleOption'), \
+                patch.object(self.dut, '_getLedState') as mockedGetState, \
+                patch(f"{self.ledCls}.getRenderedPixmap") \
+                as mockedGetPixmap:
+            mockedGetState.return_value = (True, LedIndicatorColor.RED)
+            self.dut.paint(Mock(), mockedOption, 'index')
+            mockedGetPixmap.assert_not_called()
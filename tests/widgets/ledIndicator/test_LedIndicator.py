@@ -1,7 +1,8 @@
+from collections import OrderedDict
 from unittest import TestCase
 from unittest.mock import call, Mock, patch
 
-from PySide2.QtCore import QPointF, Qt
+from PySide2.QtCore import QEvent, QPointF, Qt
 from PySide2.QtGui import QColor
 
 import os
@@ -9,7 +10,8 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
-from widgets.ledIndicator import LedIndicator, LedIndicatorColor   # noqa: E402
+from widgets.ledIndicator import LedIndicator, LedIndicatorColor, \
+    LedPalette                                                  # noqa: E402
 
 
 class TestLedIndicator(TestCase):
@@ -25,13 +27,12 @@ class TestLedIndicator(TestCase):
         self.penCls = 'widgets.ledIndicator.ledIndicator.QPen'
         self.gradientCls = 'widgets.ledIndicator.ledIndicator.QRadialGradient'
         self.brushCls = 'widgets.ledIndicator.ledIndicator.QBrush'
-        self.colorCls = 'widgets.ledIndicator.ledIndicator.QColor'
-        self.mockedColors = (Mock(), Mock(), Mock(), Mock())
+        self.pixmapCls = 'widgets.ledIndicator.ledIndicator.QPixmap'
+        self.cacheCls = 'widgets.ledIndicator.ledIndicator.LedRenderCache'
+        self.timerCls = 'widgets.ledIndicator.ledIndicator.QTimer'
         with patch(f"{self.baseCls}.__init__"), \
                 patch(f"{self.baseCls}.setMinimumSize"), \
-                patch(f"{self.baseCls}.setCheckable"), \
-                patch(self.colorCls) as mockedColorConst:
-            mockedColorConst.side_effect = self.mockedColors
+                patch(f"{self.baseCls}.setCheckable"):
             self.dut = LedIndicator()
 
     def test_constructor(self) -> None:
@@ -80,166 +81,535 @@ class TestLedIndicator(TestCase):
                     dut = LedIndicator()
                 else:
                     dut = LedIndicator(color=testColor)
-                self.assertEqual(dut._onColor1,
-                                 expectedColors[idx]['onColor1'],
+                onColors = dut.getPalette().getOnColors()
+                offColors = dut.getPalette().getOffColors()
+                self.assertEqual(onColors,
+                                 (expectedColors[idx]['onColor1'],
+                                  expectedColors[idx]['onColor2']),
                                  'The constructor failed to initialize the '
                                  'led indicator colors.')
-                self.assertEqual(dut._onColor2,
-                                 expectedColors[idx]['onColor2'],
+                self.assertEqual(offColors,
+                                 (expectedColors[idx]['offColor1'],
+                                  expectedColors[idx]['offColor2']),
                                  'The constructor failed to initialize the '
                                  'led indicator colors.')
-                self.assertEqual(dut._offColor1,
-                                 expectedColors[idx]['offColor1'],
+                expectedColorKey = tuple(expectedColors[idx][name].rgba()
+                                         for name in ('onColor1', 'onColor2',
+                                                      'offColor1',
+                                                      'offColor2'))
+                self.assertEqual(dut.getPalette().getKey(), expectedColorKey,
                                  'The constructor failed to initialize the '
-                                 'led indicator colors.')
-                self.assertEqual(dut._offColor2,
-                                 expectedColors[idx]['offColor2'],
-                                 'The constructor failed to initialize the '
-                                 'led indicator colors.')
+                                 'color scheme key.')
 
-    def test_drawBorderExternal(self) -> None:
+    def test_constructorPalette(self) -> None:
         """
-        The _drawBorder method must draw the external border with the right
-        values when ask to drawing the external border.
+        The constructor must share the interned palette of the color, the
+        color being given by a scheme, a palette, a QColor or a tuple.
+        """
+        testColors = (LedIndicatorColor.RED, LedPalette.fromRgb(255, 0, 0),
+                      QColor(255, 0, 0), (255, 0, 0))
+        for testColor in testColors:
+            with patch(f"{self.baseCls}.__init__"), \
+                    patch(f"{self.baseCls}.setMinimumSize"), \
+                    patch(f"{self.baseCls}.setCheckable"):
+                dut = LedIndicator(color=testColor)
+            self.assertIs(dut.getPalette(),
+                          LedPalette.get(LedIndicatorColor.RED), 'The '
+                          'constructor failed to share the color palette.')
+
+    def test_createGradientBrush(self) -> None:
+        """
+        The _createGradientBrush method must create a brush of the radial
+        gradient lit from the given point.
         """
-        mockedPainter = Mock()
         mockedGradient = Mock()
-        mockedBrush = Mock()
-        setColorAtCalls = (call(0, QColor(224, 224, 224)),
-                           call(1, QColor(28, 28, 28)))
+        setColorAtCalls = (call(0, 'color1'), call(1, 'color2'))
         with patch(self.gradientCls) as mockedGradCls, \
                 patch(self.brushCls) as mockedBrushCls:
             mockedGradCls.return_value = mockedGradient
-            mockedBrushCls.return_value = mockedBrush
-            self.dut._drawBorder(mockedPainter, True)
+            result = LedIndicator._createGradientBrush(-500, 'color1',
+                                                       'color2')
             mockedGradCls.assert_called_once_with(QPointF(-500, -500), 1500,
                                                   QPointF(-500, -500))
             mockedGradient.setColorAt.assert_has_calls(setColorAtCalls)
             mockedBrushCls.assert_called_once_with(mockedGradient)
-            mockedPainter.setBrush(mockedBrush)
-            mockedPainter.drawEllipse.assert_called_once_with(QPointF(0, 0),
-                                                              500, 500)
+        self.assertEqual(result, mockedBrushCls.return_value,
+                         '_createGradientBrush failed to return the gradient '
+                         'brush.')
 
-    def test_drawBorderInternal(self) -> None:
+    def test_initPaintObjects(self) -> None:
         """
-        The _drawBorder method must draw the internal border with the right
-        values when ask to drawing the internal border.
+        The _initPaintObjects method must create the shared pen and border
+        brushes once.
         """
-        mockedPainter = Mock()
-        mockedGradient = Mock()
-        mockedBrush = Mock()
-        setColorAtCalls = (call(0, QColor(224, 224, 224)),
-                           call(1, QColor(28, 28, 28)))
-        with patch(self.gradientCls) as mockedGradCls, \
-                patch(self.brushCls) as mockedBrushCls:
-            mockedGradCls.return_value = mockedGradient
-            mockedBrushCls.return_value = mockedBrush
-            self.dut._drawBorder(mockedPainter, False)
-            mockedGradCls.assert_called_once_with(QPointF(500, 500), 1500,
-                                                  QPointF(500, 500))
-            mockedGradient.setColorAt.assert_has_calls(setColorAtCalls)
-            mockedBrushCls.assert_called_once_with(mockedGradient)
-            mockedPainter.setBrush(mockedBrush)
-            mockedPainter.drawEllipse.assert_called_once_with(QPointF(0, 0),
-                                                              450, 450)
+        mockedPen = Mock()
+        createBrushCalls = (call(-500, QColor(224, 224, 224),
+                                 QColor(28, 28, 28)),
+                            call(500, QColor(224, 224, 224),
+                                 QColor(28, 28, 28)))
+        with patch.object(LedIndicator, '_pen', None), \
+                patch.object(LedIndicator, '_borderBrushes', None), \
+                patch.object(LedIndicator, '_createGradientBrush') \
+                as mockedCreateBrush, \
+                patch(self.penCls) as mockedPenCls:
+            mockedPenCls.return_value = mockedPen
+            mockedCreateBrush.side_effect = ('external', 'internal')
+            LedIndicator._initPaintObjects()
+            self.dut._initPaintObjects()
+            mockedPenCls.assert_called_once_with(Qt.black)
+            mockedPen.setWidth.assert_called_once_with(1)
+            mockedCreateBrush.assert_has_calls(createBrushCalls)
+            self.assertEqual(mockedCreateBrush.call_count, 2,
+                             '_initPaintObjects failed to create the '
+                             'brushes once.')
+            self.assertEqual(LedIndicator._pen, mockedPen, '_initPaintObjects '
+                             'failed to share the pen.')
+            self.assertEqual(LedIndicator._borderBrushes,
+                             {True: 'external', False: 'internal'},
+                             '_initPaintObjects failed to share the border '
+                             'brushes.')
+
+    def test_getLedBrushes(self) -> None:
+        """
+        The _getLedBrushes method must create the LED brushes once per
+        palette.
+        """
+        createBrushCalls = (call(-500, QColor(0, 255, 0), QColor(0, 192, 0)),
+                            call(500, QColor(0, 28, 0), QColor(0, 128, 0)))
+        palette = LedPalette.get(LedIndicatorColor.GRN)
+        with patch.object(LedIndicator, '_ledBrushCache', OrderedDict()), \
+                patch.object(LedIndicator, '_createGradientBrush') \
+                as mockedCreateBrush:
+            mockedCreateBrush.side_effect = ('on', 'off')
+            result = LedIndicator._getLedBrushes(palette)
+            self.assertIs(LedIndicator._getLedBrushes(palette), result,
+                          '_getLedBrushes failed to share the LED brushes of '
+                          'the palette.')
+            mockedCreateBrush.assert_has_calls(createBrushCalls)
+            self.assertEqual(mockedCreateBrush.call_count, 2,
+                             '_getLedBrushes failed to create the brushes '
+                             'once.')
+        self.assertEqual(result, {True: 'on', False: 'off'}, '_getLedBrushes '
+                         'failed to return the LED brushes.')
 
-    def test_drawLedOn(self) -> None:
+    def test_getLedBrushesEvict(self) -> None:
         """
-        The _drawLed method must draw the LED with the on color when the
-        widget is checked.
+        The _getLedBrushes method must evict the brushes of the least
+        recently used palette when the cache is full.
+        """
+        palettes = [LedPalette.fromRgb(red, 0, 0) for red in range(3)]
+        with patch.object(LedIndicator, '_ledBrushCache', OrderedDict()), \
+                patch.object(LedIndicator, 'ledBrushCacheSize', 2), \
+                patch.object(LedIndicator, '_createGradientBrush'):
+            LedIndicator._getLedBrushes(palettes[0])
+            LedIndicator._getLedBrushes(palettes[1])
+            LedIndicator._getLedBrushes(palettes[0])
+            LedIndicator._getLedBrushes(palettes[2])
+            self.assertEqual(list(LedIndicator._ledBrushCache),
+                             [palettes[0].getKey(), palettes[2].getKey()],
+                             '_getLedBrushes failed to evict the least '
+                             'recently used palette.')
+
+    def test_drawBorderExternal(self) -> None:
+        """
+        The _drawBorder method must draw the external border with its
+        precomputed brush when ask to drawing the external border.
         """
         mockedPainter = Mock()
-        mockedGradient = Mock()
-        setColorAtCalls = (call(0, self.dut._onColor1),
-                           call(1, self.dut._onColor2))
-        with patch.object(self.dut, 'isChecked') as mockedIsChecked, \
-                patch(self.gradientCls) as mockedGradCls:
-            mockedIsChecked.return_value = True
-            mockedGradCls.return_value = mockedGradient
-            self.dut._drawLed(mockedPainter)
-            mockedGradCls.assert_called_once_with(QPointF(-500, -500), 1500,
-                                                  QPointF(-500, -500))
-            mockedGradient.setColorAt.assert_has_calls(setColorAtCalls)
-            mockedPainter.setBrush(mockedGradient)
+        with patch.object(LedIndicator, '_borderBrushes',
+                          {True: 'external', False: 'internal'}), \
+                patch(self.gradientCls) as mockedGradCls, \
+                patch(self.brushCls) as mockedBrushCls:
+            self.dut._drawBorder(mockedPainter, True)
+            mockedGradCls.assert_not_called()
+            mockedBrushCls.assert_not_called()
+            mockedPainter.setBrush.assert_called_once_with('external')
             mockedPainter.drawEllipse.assert_called_once_with(QPointF(0, 0),
-                                                              400, 400)
+                                                              500, 500)
 
-    def test_drawLedOff(self) -> None:
+    def test_drawBorderInternal(self) -> None:
         """
-        The _drawLed method must draw the LED with the off color when the
-        widget is checked.
+        The _drawBorder method must draw the internal border with its
+        precomputed brush when ask to drawing the internal border.
         """
         mockedPainter = Mock()
-        mockedGradient = Mock()
-        setColorAtCalls = (call(0, self.dut._offColor1),
-                           call(1, self.dut._offColor2))
-        with patch.object(self.dut, 'isChecked') as mockedIsChecked, \
-                patch(self.gradientCls) as mockedGradCls:
-            mockedIsChecked.return_value = False
-            mockedGradCls.return_value = mockedGradient
-            self.dut._drawLed(mockedPainter)
-            mockedGradCls.assert_called_once_with(QPointF(500, 500), 1500,
-                                                  QPointF(500, 500))
-            mockedGradient.setColorAt.assert_has_calls(setColorAtCalls)
-            mockedPainter.setBrush(mockedGradient)
+        with patch.object(LedIndicator, '_borderBrushes',
+                          {True: 'external', False: 'internal'}), \
+                patch(self.gradientCls) as mockedGradCls, \
+                patch(self.brushCls) as mockedBrushCls:
+            self.dut._drawBorder(mockedPainter, False)
+            mockedGradCls.assert_not_called()
+            mockedBrushCls.assert_not_called()
+            mockedPainter.setBrush.assert_called_once_with('internal')
             mockedPainter.drawEllipse.assert_called_once_with(QPointF(0, 0),
-                                                              400, 400)
+                                                              450, 450)
 
-    def test_resizeEventUpdate(self) -> None:
+    def test_drawLed(self) -> None:
         """
-        The resizeEvent method must update the widget.
+        The _drawLed method must draw the LED with the brush of the palette
+        and checked state.
         """
-        with patch.object(self.dut, 'update') as mockedUpdate:
-            self.dut.resizeEvent(None)
-            mockedUpdate.assert_called_once()
+        for isChecked in (True, False):
+            mockedPainter = Mock()
+            with patch.object(LedIndicator, '_getLedBrushes') \
+                    as mockedGetBrushes, \
+                    patch(self.gradientCls) as mockedGradCls:
+                mockedGetBrushes.return_value = {True: 'on', False: 'off'}
+                LedIndicator._drawLed(mockedPainter, 'palette', isChecked)
+                mockedGetBrushes.assert_called_once_with('palette')
+                mockedGradCls.assert_not_called()
+                mockedPainter.setBrush \
+                    .assert_called_once_with('on' if isChecked else 'off')
+                mockedPainter.drawEllipse \
+                    .assert_called_once_with(QPointF(0, 0), 400, 400)
 
-    def test_paintEventInitPainterAndPen(self) -> None:
+    def test_drawIndicatorInitPainterAndPen(self) -> None:
         """
-        The paintEvent method must initialize the painter and the pen.
+        The _drawIndicator method must initialize the painter with the shared
+        pen.
         """
         realSize = 10
         mockedPainter = Mock()
-        mockedPen = Mock()
-        with patch.object(self.dut, 'width') as mockedWidth, \
-                patch.object(self.dut, 'height') as mockedHeight, \
-                patch(self.painterCls) as mockedPainterCls, \
-                patch.object(self.dut, '_drawBorder'), \
-                patch.object(self.dut, '_drawLed'), \
+        with patch(self.painterCls) as mockedPainterCls, \
+                patch.object(LedIndicator, '_initPaintObjects') \
+                as mockedInit, \
+                patch.object(LedIndicator, '_drawBorder'), \
+                patch.object(LedIndicator, '_drawLed'), \
+                patch.object(LedIndicator, '_pen', 'pen'), \
                 patch(self.penCls) as mockedPenCls:
-            mockedWidth.side_effect = (realSize, realSize)
-            mockedHeight.side_effect = (realSize, realSize)
-            mockedPainterCls.return_value = mockedPainter
-            mockedPenCls.return_value = mockedPen
-            self.dut.paintEvent(None)
-            mockedPainterCls.assert_called_once_with(self.dut)
+            LedIndicator._drawIndicator(mockedPainter, 'palette', True,
+                                        realSize, realSize + 4)
+            mockedInit.assert_called_once()
             mockedPainter.setRenderHint \
                 .assert_called_once_with(mockedPainterCls.Antialiasing)
             mockedPainter.translate.assert_called_once_with(realSize / 2,
-                                                            realSize / 2)
+                                                            realSize / 2 + 2)
             mockedPainter.scale.assert_called_once_with(realSize / 1000,
                                                         realSize / 1000)
-            mockedPenCls.assert_called_once_with(Qt.black)
-            mockedPen.setWidth.assert_called_once_with(1)
-            mockedPainter.setPen.assert_called_once_with(mockedPen)
+            mockedPenCls.assert_not_called()
+            mockedPainter.setPen.assert_called_once_with('pen')
 
-    def test_paintEventDraw(self) -> None:
+    def test_drawIndicatorDraw(self) -> None:
         """
-        The paintEvent method must draw the external and internal borders and
-        the LED.
+        The _drawIndicator method must draw the external and internal borders
+        and the LED.
         """
-        realSize = 10
         mockedPainter = Mock()
         drawBorderCalls = (call(mockedPainter, True),
                            call(mockedPainter, False))
+        with patch.object(LedIndicator, '_drawBorder') as mockedDrawBorder, \
+                patch.object(LedIndicator, '_drawLed') as mockedDrawLed, \
+                patch.object(LedIndicator, '_initPaintObjects'):
+            LedIndicator._drawIndicator(mockedPainter, 'palette', False, 10,
+                                        10)
+            mockedDrawBorder.assert_has_calls(drawBorderCalls)
+            mockedDrawLed.assert_called_once_with(mockedPainter, 'palette',
+                                                  False)
+
+    def test_renderPixmap(self) -> None:
+        """
+        The _renderPixmap method must draw the indicator of the palette and
+        checked state in a transparent pixmap matching the device pixel
+        ratio.
+        """
+        mockedPixmap = Mock()
+        mockedPainter = Mock()
+        with patch(self.pixmapCls) as mockedPixmapCls, \
+                patch(self.painterCls) as mockedPainterCls, \
+                patch.object(LedIndicator, '_drawIndicator') as mockedDraw:
+            mockedPixmapCls.return_value = mockedPixmap
+            mockedPainterCls.return_value = mockedPainter
+            result = LedIndicator._renderPixmap('palette', True, 25, 30, 1.5)
+            mockedPixmapCls.assert_called_once_with(38, 45)
+            mockedPixmap.setDevicePixelRatio.assert_called_once_with(1.5)
+            mockedPixmap.fill.assert_called_once_with(Qt.transparent)
+            mockedPainterCls.assert_called_once_with(mockedPixmap)
+            mockedDraw.assert_called_once_with(mockedPainter, 'palette', True,
+                                               25, 30)
+            mockedPainter.end.assert_called_once()
+            self.assertEqual(result, mockedPixmap, '_renderPixmap failed to '
+                             'return the rendered indicator.')
+
+    def test_getPixmapKey(self) -> None:
+        """
+        The _getPixmapKey method must return the key of the rendered
+        indicator of the palette.
+        """
+        mockedPalette = Mock()
+        mockedPalette.getKey.return_value = (1, 2, 3, 4)
+        result = LedIndicator._getPixmapKey(mockedPalette, True, 10, 12, 2.0)
+        self.assertEqual(result, ((1, 2, 3, 4), True, 10, 12, 2.0),
+                         '_getPixmapKey failed to return the rendered '
+                         'indicator key.')
+
+    def test_getRenderedPixmap(self) -> None:
+        """
+        The getRenderedPixmap method must render the indicator of the color
+        without any widget and share it in the render cache on a cache miss
+        only.
+        """
+        palette = LedPalette.get(LedIndicatorColor.RED)
+        pixmapKey = (palette.getKey(), True, 10, 12, 2.0)
+        testCachedPixmaps = (None, 'cached')
+        for cachedPixmap in testCachedPixmaps:
+            with patch(f"{self.baseCls}.__init__") as mockedBaseClsConst, \
+                    patch.object(LedIndicator, '_renderPixmap') \
+                    as mockedRender, \
+                    patch(self.cacheCls) as mockedCacheCls:
+                mockedCache = mockedCacheCls.instance.return_value
+                mockedCache.get.return_value = cachedPixmap
+                result = LedIndicator.getRenderedPixmap(LedIndicatorColor.RED,
+                                                        True, 10, 12, 2.0)
+                mockedBaseClsConst.assert_not_called()
+                mockedCache.get.assert_called_once_with(pixmapKey)
+            if cachedPixmap is None:
+                mockedRender.assert_called_once_with(palette, True, 10, 12,
+                                                     2.0)
+                mockedCache.insert.assert_called_once_with(
+                    pixmapKey, mockedRender.return_value)
+                self.assertEqual(result, mockedRender.return_value,
+                                 'getRenderedPixmap failed to return the '
+                                 'rendered indicator.')
+            else:
+                mockedRender.assert_not_called()
+                mockedCache.insert.assert_not_called()
+                self.assertEqual(result, cachedPixmap, 'getRenderedPixmap '
+                                 'failed to return the cached indicator.')
+
+    def test_getPixmap(self) -> None:
+        """
+        The _getPixmap method must fetch the rendered indicator again only
+        when its size, painted state or device pixel ratio changed.
+        """
+        testStates = ((10, 10, False, 1.0), (10, 10, False, 1.0),
+                      (10, 12, False, 1.0), (10, 12, True, 1.0),
+                      (10, 12, True, 2.0))
+        expectedFetchCounts = (1, 1, 2, 3, 4)
         with patch.object(self.dut, 'width') as mockedWidth, \
                 patch.object(self.dut, 'height') as mockedHeight, \
-                patch(self.painterCls) as mockedPainterCls, \
-                patch.object(self.dut, '_drawBorder') as mockedDrawBorder, \
-                patch.object(self.dut, '_drawLed') as mockedDrawLed, \
-                patch(self.penCls):
-            mockedWidth.side_effect = (realSize, realSize)
-            mockedHeight.side_effect = (realSize, realSize)
+                patch.object(self.dut, 'devicePixelRatioF') as mockedGetDpr, \
+                patch.object(LedIndicator, 'getRenderedPixmap') \
+                as mockedGetRendered:
+            for idx, state in enumerate(testStates):
+                mockedWidth.return_value = state[0]
+                mockedHeight.return_value = state[1]
+                self.dut._paintedState = state[2]
+                mockedGetDpr.return_value = state[3]
+                result = self.dut._getPixmap()
+                self.assertEqual(mockedGetRendered.call_count,
+                                 expectedFetchCounts[idx], '_getPixmap '
+                                 'failed to fetch the indicator only on a '
+                                 'change.')
+                self.assertEqual(result, mockedGetRendered.return_value,
+                                 '_getPixmap failed to return the rendered '
+                                 'indicator.')
+            mockedGetRendered.assert_called_with(self.dut._palette, True, 10,
+                                                 12, 2.0)
+
+    def test_invalidatePixmap(self) -> None:
+        """
+        The _invalidatePixmap method must release the rendered indicator.
+        """
+        self.dut._pixmap = Mock()
+        self.dut._pixmapKey = (10, 10, False, 1.0)
+        self.dut._invalidatePixmap()
+        self.assertIsNone(self.dut._pixmap, '_invalidatePixmap failed to '
+                          'release the rendered indicator.')
+        self.assertIsNone(self.dut._pixmapKey, '_invalidatePixmap failed to '
+                          'reset the rendered indicator key.')
+
+    def test_startRefreshInterval(self) -> None:
+        """
+        The _startRefreshInterval method must create the refresh timer on
+        first use and start it for one refresh interval.
+        """
+        self.dut._maxRefreshRate = 30
+        with patch(self.timerCls) as mockedTimerCls:
+            self.dut._startRefreshInterval()
+            self.dut._startRefreshInterval()
+            mockedTimerCls.assert_called_once_with(self.dut)
+        mockedTimer = mockedTimerCls.return_value
+        mockedTimer.setSingleShot.assert_called_once_with(True)
+        mockedTimer.timeout.connect \
+            .assert_called_once_with(self.dut._onRefreshTimeout)
+        mockedTimer.start.assert_has_calls((call(33), call(33)))
+
+    def test_paintState(self) -> None:
+        """
+        The _paintState method must set the painted state and request its
+        repaint.
+        """
+        with patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._paintState(True)
+            mockedUpdate.assert_called_once()
+        self.assertTrue(self.dut._paintedState, '_paintState failed to set '
+                        'the painted state.')
+
+    def test_onRefreshTimeout(self) -> None:
+        """
+        The _onRefreshTimeout method must paint the merged checked state, and
+        in the latched mode a merged pulse, starting a new interval if the
+        painted state changed.
+        """
+        testStates = ((False, False, False), (True, False, False),
+                      (False, True, False), (False, True, True))
+        expectedStates = (None, True, None, True)
+        for (isChecked, isPulsed, isLatched), expectedState in \
+                zip(testStates, expectedStates):
+            self.dut._paintedState = False
+            self.dut._isPulsed = isPulsed
+            self.dut._isLatched = isLatched
+            with patch(f"{self.baseCls}.isChecked") as mockedIsChecked, \
+                    patch.object(self.dut, '_paintState') as mockedPaint, \
+                    patch.object(self.dut, '_startRefreshInterval') \
+                    as mockedStart:
+                mockedIsChecked.return_value = isChecked
+                self.dut._onRefreshTimeout()
+                if expectedState is None:
+                    mockedPaint.assert_not_called()
+                    mockedStart.assert_not_called()
+                else:
+                    mockedPaint.assert_called_once_with(expectedState)
+                    mockedStart.assert_called_once()
+            self.assertFalse(self.dut._isPulsed, '_onRefreshTimeout failed '
+                             'to reset the pulse flag.')
+
+    def test_checkStateSetUnlimited(self) -> None:
+        """
+        The checkStateSet method must paint a changed state at once when the
+        refresh rate is not limited.
+        """
+        with patch(f"{self.baseCls}.isChecked") as mockedIsChecked, \
+                patch.object(self.dut, '_paintState') as mockedPaint, \
+                patch.object(self.dut, '_startRefreshInterval') \
+                as mockedStart:
+            mockedIsChecked.return_value = False
+            self.dut.checkStateSet()
+            mockedPaint.assert_not_called()
+            mockedIsChecked.return_value = True
+            self.dut.checkStateSet()
+            mockedPaint.assert_called_once_with(True)
+            mockedStart.assert_not_called()
+
+    def test_checkStateSetLimited(self) -> None:
+        """
+        The checkStateSet method must paint the first change at once and
+        merge the changes made during the refresh interval.
+        """
+        self.dut._maxRefreshRate = 30
+        self.dut._refreshTimer = Mock()
+        self.dut._refreshTimer.isActive.return_value = False
+        with patch(f"{self.baseCls}.isChecked") as mockedIsChecked, \
+                patch.object(self.dut, 'update'), \
+                patch.object(self.dut, '_startRefreshInterval') \
+                as mockedStart:
+            mockedIsChecked.return_value = True
+            self.dut.checkStateSet()
+            mockedStart.assert_called_once()
+            self.dut._refreshTimer.isActive.return_value = True
+            for isChecked in (False, True):
+                mockedIsChecked.return_value = isChecked
+                self.dut.checkStateSet()
+            mockedStart.assert_called_once()
+        self.assertTrue(self.dut._paintedState, 'checkStateSet failed to '
+                        'paint the first change at once.')
+        self.assertTrue(self.dut._isPulsed, 'checkStateSet failed to record '
+                        'the merged pulse.')
+
+    def test_getMaxRefreshRate(self) -> None:
+        """
+        The getMaxRefreshRate method must return the indicator refresh rate,
+        the class default if not set.
+        """
+        self.assertEqual(self.dut.getMaxRefreshRate(), 0, 'getMaxRefreshRate '
+                         'failed to return the class default.')
+        with patch.object(LedIndicator, 'defaultMaxRefreshRate', 20):
+            self.assertEqual(self.dut.getMaxRefreshRate(), 20,
+                             'getMaxRefreshRate failed to return the class '
+                             'default.')
+            self.dut._maxRefreshRate = 0
+            self.assertEqual(self.dut.getMaxRefreshRate(), 0,
+                             'getMaxRefreshRate failed to return the '
+                             'indicator refresh rate.')
+
+    def test_setMaxRefreshRate(self) -> None:
+        """
+        The setMaxRefreshRate method must set the indicator refresh rate and
+        paint the checked state at once when it is no longer limited.
+        """
+        self.dut.setMaxRefreshRate(30)
+        self.assertEqual(self.dut.getMaxRefreshRate(), 30,
+                         'setMaxRefreshRate failed to set the refresh rate.')
+        self.dut._refreshTimer = Mock()
+        self.dut._isPulsed = True
+        with patch(f"{self.baseCls}.isChecked") as mockedIsChecked, \
+                patch.object(self.dut, '_paintState') as mockedPaint:
+            mockedIsChecked.return_value = True
+            self.dut.setMaxRefreshRate(0)
+            mockedPaint.assert_called_once_with(True)
+        self.dut._refreshTimer.stop.assert_called_once()
+        self.assertFalse(self.dut._isPulsed, 'setMaxRefreshRate failed to '
+                         'reset the pulse flag.')
+        with self.assertRaises(ValueError):
+            self.dut.setMaxRefreshRate(-1)
+
+    def test_setLatched(self) -> None:
+        """
+        The setLatched method must set the indicator latched mode, the class
+        default being used if not set.
+        """
+        self.assertFalse(self.dut.isLatched(), 'isLatched failed to return '
+                         'the class default.')
+        self.dut.setLatched(True)
+        self.assertTrue(self.dut.isLatched(), 'setLatched failed to set the '
+                        'latched mode.')
+
+    def test_eventScreenChange(self) -> None:
+        """
+        The event method must invalidate the rendered indicator on a screen
+        change only and forward every event to the base class.
+        """
+        eventTypes = (QEvent.ScreenChangeInternal, QEvent.Resize)
+        for eventType in eventTypes:
+            mockedEvent = Mock()
+            mockedEvent.type.return_value = eventType
+            with patch(f"{self.baseCls}.event") as mockedBaseEvent, \
+                    patch.object(self.dut, '_invalidatePixmap') \
+                    as mockedInvalidate, \
+                    patch.object(self.dut, 'update') as mockedUpdate:
+                mockedBaseEvent.return_value = True
+                result = self.dut.event(mockedEvent)
+                mockedBaseEvent.assert_called_once_with(self.dut, mockedEvent)
+                self.assertTrue(result, 'event failed to return the base '
+                                'class result.')
+                isScreenChange = eventType == QEvent.ScreenChangeInternal
+                self.assertEqual(mockedInvalidate.called, isScreenChange,
+                                 'event failed to invalidate the rendered '
+                                 'indicator on a screen change.')
+                self.assertEqual(mockedUpdate.called, isScreenChange,
+                                 'event failed to repaint on a screen '
+                                 'change.')
+
+    def test_resizeEvent(self) -> None:
+        """
+        The resizeEvent method must invalidate the rendered indicator and
+        leave the repaint to Qt.
+        """
+        with patch.object(self.dut, '_invalidatePixmap') as mockedInvalidate, \
+                patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut.resizeEvent(None)
+            mockedInvalidate.assert_called_once()
+            mockedUpdate.assert_not_called()
+
+    def test_paintEvent(self) -> None:
+        """
+        The paintEvent method must draw the rendered indicator.
+        """
+        mockedPainter = Mock()
+        with patch(self.painterCls) as mockedPainterCls, \
+                patch.object(self.dut, '_getPixmap') as mockedGetPixmap:
             mockedPainterCls.return_value = mockedPainter
             self.dut.paintEvent(None)
-            mockedDrawBorder.assert_has_calls(drawBorderCalls)
-            mockedDrawLed.assert_called_once_with(mockedPainter)
+            mockedPainterCls.assert_called_once_with(self.dut)
+            mockedPainter.drawPixmap \
+                .assert_called_once_with(0, 0, mockedGetPixmap.return_value)
@@ -0,0 +1,187 @@
+from unittest import TestCase
+from unittest.mock import call, Mock, patch
+
+import numpy as np
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.ledIndicator.ledIndicator import LedIndicator    # noqa: E402
+from widgets.ledIndicator.ledIndicatorGroup import \
+    LedIndicatorGroup                                           # noqa: E402
+
+
+class TestLedIndicatorGroup(TestCase):
+    """
+    The LedIndicatorGroup class test cases.
+    """
+    def _createLed(self, isChecked: bool) -> Mock:
+        """
+        Create a mocked indicator in the given state.
+        """
+        led = Mock()
+        led.isChecked.return_value = isChecked
+        led.blockSignals.return_value = False
+        return led
+
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.leds = [self._createLed(isChecked)
+                     for isChecked in (False, True, False, True)]
+        self.dut = LedIndicatorGroup(self.leds)
+        self.mockedSlot = Mock()
+        self.dut.statesChanged.connect(self.mockedSlot)
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must add every indicator to the group.
+        """
+        with patch.object(LedIndicatorGroup, 'addLed') as mockedAddLed:
+            LedIndicatorGroup(self.leds)
+            mockedAddLed.assert_has_calls([call(led) for led in self.leds])
+
+    def test_addLed(self) -> None:
+        """
+        The addLed method must store the indicator and its state and track
+        its toggling.
+        """
+        led = self._createLed(True)
+        result = self.dut.addLed(led)
+        self.assertEqual(result, 4, 'addLed failed to return the indicator '
+                         'index.')
+        self.assertEqual(self.dut.getLedCount(), 5, 'addLed failed to add '
+                         'the indicator.')
+        self.assertEqual(self.dut.getLeds()[4], led, 'addLed failed to add '
+                         'the indicator.')
+        self.assertEqual(self.dut.getStates()[4], True, 'addLed failed to '
+                         'store the indicator state.')
+        led.toggled.connect.assert_called_once()
+
+    def test_onLedToggled(self) -> None:
+        """
+        The _onLedToggled method must update the indicator state and report
+        it.
+        """
+        slot = self.leds[2].toggled.connect.call_args.args[0]
+        slot(True)
+        self.assertEqual(self.dut.getStates(), [False, True, True, True],
+                         '_onLedToggled failed to update the indicator '
+                         'state.')
+        self.mockedSlot.assert_called_once_with([2])
+
+    def test_rateLimitedLed(self) -> None:
+        """
+        The group must follow the checked state of a rate limited indicator
+        at once, reporting every change once, while the indicator merges
+        the painted changes.
+        """
+        baseCls = 'widgets.ledIndicator.ledIndicator.QAbstractButton'
+        timerCls = 'widgets.ledIndicator.ledIndicator.QTimer'
+        with patch(f"{baseCls}.__init__"), \
+                patch(f"{baseCls}.setMinimumSize"), \
+                patch(f"{baseCls}.setCheckable"):
+            led = LedIndicator()
+        led.setMaxRefreshRate(10)
+        led.setLatched(True)
+        led.toggled = Mock()
+        ledState = {'isChecked': False, 'isBlocked': False}
+
+        def setChecked(isChecked: bool) -> None:
+            isChanged = isChecked != ledState['isChecked']
+            ledState['isChecked'] = isChecked
+            led.checkStateSet()
+            if isChanged and not ledState['isBlocked']:
+                slot(isChecked)
+
+        def blockSignals(isBlocked: bool) -> bool:
+            wasBlocked = ledState['isBlocked']
+            ledState['isBlocked'] = isBlocked
+            return wasBlocked
+
+        led.isChecked = lambda: ledState['isChecked']
+        led.setChecked = setChecked
+        led.blockSignals = blockSignals
+        dut = LedIndicatorGroup([led])
+        slot = led.toggled.connect.call_args.args[0]
+        mockedSlot = Mock()
+        dut.statesChanged.connect(mockedSlot)
+        with patch.object(led, 'update'), patch(timerCls) as mockedTimerCls:
+            mockedTimerCls.return_value.isActive.return_value = True
+            for isOn in (True, False, True):
+                dut.setStates([isOn])
+                self.assertEqual(led.isChecked(), isOn, 'The indicator '
+                                 'failed to set its checked state at once.')
+            self.assertTrue(led._paintedState, 'The indicator failed to '
+                            'paint its first change at once.')
+            led._onRefreshTimeout()
+            self.assertFalse(led._paintedState, 'The indicator failed to '
+                             'paint the latched pulse.')
+            led._onRefreshTimeout()
+            self.assertTrue(led._paintedState, 'The indicator failed to '
+                            'paint the checked state after the pulse.')
+            setChecked(False)
+            self.assertTrue(led._paintedState, 'The indicator failed to '
+                            'merge the change made during the interval.')
+            led._onRefreshTimeout()
+        self.assertEqual(mockedSlot.call_args_list, [call([0])] * 4,
+                         'The group failed to report every change once.')
+        self.assertEqual(dut.getStates(), [False], 'The group failed to '
+                         'follow the checked state.')
+        self.assertFalse(led._paintedState, 'The indicator failed to paint '
+                         'the final state.')
+
+    def test_getStates(self) -> None:
+        """
+        The getStates method must return a copy of the indicator states.
+        """
+        result = self.dut.getStates()
+        result[0] = True
+        self.assertEqual(self.dut.getStates(), [False, True, False, True],
+                         'getStates failed to return a copy of the states.')
+
+    def test_setStates(self) -> None:
+        """
+        The setStates method must set the changed indicators only with their
+        signals blocked and report the changed indices once.
+        """
+        testStates = ([True, True, False, False],
+                      np.array([1, 1, 0, 0], dtype=np.uint8))
+        expectedResults = ([0, 3], [])
+        for states, expectedResult in zip(testStates, expectedResults):
+            self.mockedSlot.reset_mock()
+            result = self.dut.setStates(states)
+            self.assertEqual(result, expectedResult, 'setStates failed to '
+                             'return the changed indices.')
+            self.assertEqual(self.dut.getStates(),
+                             [True, True, False, False], 'setStates failed '
+                             'to store the indicator states.')
+            if expectedResult:
+                self.mockedSlot.assert_called_once_with(expectedResult)
+            else:
+                self.mockedSlot.assert_not_called()
+        self.leds[0].setChecked.assert_called_once_with(True)
+        self.leds[3].setChecked.assert_called_once_with(False)
+        for led in (self.leds[1], self.leds[2]):
+            led.setChecked.assert_not_called()
+        self.leds[0].blockSignals.assert_has_calls((call(True),
+                                                    call(False)))
+
+    def test_setStatesKeepBlocked(self) -> None:
+        """
+        The setStates method must restore the blocked state of an indicator
+        whose signals were already blocked.
+        """
+        self.leds[0].blockSignals.return_value = True
+        self.dut.setStates([True, True, False, True])
+        self.leds[0].blockSignals.assert_has_calls((call(True), call(True)))
+
+    def test_setStatesInvalidCount(self) -> None:
+        """
+        The setStates method must reject a state count not matching the
+        indicator count.
+        """
+        with self.assertRaises(ValueError):
+            self.dut.setStates([True, False])
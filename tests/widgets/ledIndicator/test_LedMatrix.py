@@ -0,0 +1,310 @@
+from unittest import TestCase
+from unittest.mock import call, Mock, patch
+
+from PySide2.QtCore import QPoint, QRect, QSize, Qt
+
+import numpy as np
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.ledIndicator import LedIndicatorColor, LedPalette  # noqa: E402
+from widgets.ledIndicator.ledMatrix import LedMatrix            # noqa: E402
+
+
+class TestLedMatrix(TestCase):
+    """
+    The LedMatrix class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.module = 'widgets.ledIndicator.ledMatrix'
+        self.widgetCls = f"{self.module}.QWidget"
+        self.ledCls = f"{self.module}.LedIndicator"
+        self.painterCls = f"{self.module}.QPainter"
+        with patch(f"{self.widgetCls}.__init__"), \
+                patch(f"{self.widgetCls}.setMinimumSize"), \
+                patch.object(LedMatrix, '_updateGeometry'):
+            self.dut = LedMatrix(3, 4)
+        self.dut._cellSize = 10
+        self.dut._origin = QPoint(5, 2)
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must initialize the states off, get the LED palette
+        without creating any indicator and fit the grid in the widget.
+        """
+        with patch(f"{self.widgetCls}.__init__") as mockedBaseClsConst, \
+                patch(f"{self.widgetCls}.setMinimumSize") as mockedMinSize, \
+                patch(self.ledCls) as mockedLedCls, \
+                patch.object(LedMatrix, '_updateGeometry') as mockedUpdate:
+            dut = LedMatrix(3, 4, 'parent', LedIndicatorColor.RED)
+            mockedBaseClsConst.assert_called_once_with('parent')
+            mockedLedCls.assert_not_called()
+            mockedMinSize.assert_called_once_with(16, 12)
+            mockedUpdate.assert_called_once()
+        self.assertIs(dut._palette, LedPalette.get(LedIndicatorColor.RED),
+                      'The constructor failed to get the LED palette.')
+        np.testing.assert_array_equal(dut.getStates(), np.zeros((3, 4)))
+        self.assertEqual(dut.getStates().dtype, np.uint8, 'The constructor '
+                         'failed to initialize uint8 states.')
+
+    def test_constructorInvalidShape(self) -> None:
+        """
+        The constructor must reject an empty matrix.
+        """
+        for shape in ((0, 4), (3, -1)):
+            with self.assertRaises(ValueError):
+                LedMatrix(*shape)
+
+    def test_constructorWithoutNumpy(self) -> None:
+        """
+        The constructor must require NumPy.
+        """
+        with patch(f"{self.module}.np", None):
+            with self.assertRaises(RuntimeError):
+                LedMatrix(3, 4)
+
+    def test_updateGeometry(self) -> None:
+        """
+        The _updateGeometry method must fit the largest square cells in the
+        widget and center the grid.
+        """
+        testSizes = ((45, 40), (100, 32), (2, 2))
+        expectedCellSizes = (11, 10, 1)
+        expectedOrigins = (QPoint(0, 3), QPoint(30, 1), QPoint(-1, -1))
+        for testSize, expectedCellSize, expectedOrigin in \
+                zip(testSizes, expectedCellSizes, expectedOrigins):
+            with patch.object(self.dut, 'width') as mockedWidth, \
+                    patch.object(self.dut, 'height') as mockedHeight:
+                mockedWidth.return_value = testSize[0]
+                mockedHeight.return_value = testSize[1]
+                self.dut._updateGeometry()
+            self.assertEqual(self.dut._cellSize, expectedCellSize,
+                             '_updateGeometry failed to fit the cells.')
+            self.assertEqual(self.dut._origin, expectedOrigin,
+                             '_updateGeometry failed to center the grid.')
+
+    def test_getPixmaps(self) -> None:
+        """
+        The _getPixmaps method must fetch the rendered LEDs again only when
+        the cell size or the device pixel ratio changed.
+        """
+        testStates = ((10, 1.0), (10, 1.0), (12, 1.0), (12, 2.0))
+        expectedFetchCounts = (2, 2, 4, 6)
+        with patch.object(self.dut, 'devicePixelRatioF') as mockedGetDpr, \
+                patch(f"{self.ledCls}.getRenderedPixmap") as mockedGetPixmap:
+            mockedGetPixmap.side_effect = \
+                lambda color, isOn, width, height, dpr: \
+                (color, isOn, width, height, dpr)
+            for state, expectedFetchCount in zip(testStates,
+                                                 expectedFetchCounts):
+                self.dut._cellSize = state[0]
+                mockedGetDpr.return_value = state[1]
+                result = self.dut._getPixmaps()
+                self.assertEqual(mockedGetPixmap.call_count,
+                                 expectedFetchCount, '_getPixmaps failed to '
+                                 'fetch the LEDs only on a change.')
+        palette = self.dut._palette
+        self.assertEqual(result, {False: (palette, False, 12, 12, 2.0),
+                                  True: (palette, True, 12, 12, 2.0)},
+                         '_getPixmaps failed to return the rendered LEDs by '
+                         'state.')
+
+    def test_repaintCells(self) -> None:
+        """
+        The _repaintCells method must request the repaint of the changed
+        cells only.
+        """
+        cells = np.array([[0, 0], [2, 3]])
+        with patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._repaintCells(cells)
+            mockedUpdate.assert_has_calls((call(5, 2, 10, 10),
+                                           call(35, 22, 10, 10)))
+            self.assertEqual(mockedUpdate.call_count, 2, '_repaintCells '
+                             'failed to repaint the changed cells only.')
+
+    def test_repaintCellsNone(self) -> None:
+        """
+        The _repaintCells method must not repaint anything when no cell
+        changed.
+        """
+        with patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._repaintCells(np.empty((0, 2), dtype=int))
+            mockedUpdate.assert_not_called()
+
+    def test_repaintCellsMany(self) -> None:
+        """
+        The _repaintCells method must repaint the whole matrix when too many
+        cells changed.
+        """
+        cells = np.argwhere(np.ones((3, 4)))[:4]
+        with patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._repaintCells(cells)
+            mockedUpdate.assert_called_once_with()
+
+    def test_getDirtyCells(self) -> None:
+        """
+        The _getDirtyCells method must return every cell overlapping the
+        repainted region once.
+        """
+        mockedEvent = Mock()
+        mockedEvent.region.return_value.rects.return_value = \
+            [QRect(0, 0, 12, 5), QRect(10, 5, 10, 5), QRect(30, 20, 100, 100)]
+        result = self.dut._getDirtyCells(mockedEvent)
+        self.assertEqual(result.tolist(), [[0, 0], [0, 1], [1, 2], [1, 3],
+                                           [2, 2], [2, 3]], '_getDirtyCells '
+                         'failed to return the repainted cells.')
+
+    def test_getShape(self) -> None:
+        """
+        The getRowCount and getColumnCount methods must return the matrix
+        shape.
+        """
+        self.assertEqual(self.dut.getRowCount(), 3, 'getRowCount failed to '
+                         'return the row count.')
+        self.assertEqual(self.dut.getColumnCount(), 4, 'getColumnCount '
+                         'failed to return the column count.')
+
+    def test_getStates(self) -> None:
+        """
+        The getStates method must return a copy of the states.
+        """
+        result = self.dut.getStates()
+        result[0, 0] = 1
+        self.assertFalse(self.dut.getState(0, 0), 'getStates failed to '
+                         'return a copy of the states.')
+
+    def test_setStates(self) -> None:
+        """
+        The setStates method must store the states as on/off values and
+        repaint the changed cells only.
+        """
+        self.dut._states[1, 1] = 1
+        testStates = [[0, 0, 0, 0], [0, 1, 0, 0], [7, 0, 0, True]]
+        with patch.object(self.dut, '_repaintCells') as mockedRepaint:
+            result = self.dut.setStates(testStates)
+            self.assertEqual(mockedRepaint.call_args.args[0].tolist(),
+                             [[2, 0], [2, 3]], 'setStates failed to repaint '
+                             'the changed cells.')
+        self.assertEqual(result.tolist(), [[2, 0], [2, 3]], 'setStates '
+                         'failed to return the changed cells.')
+        np.testing.assert_array_equal(self.dut.getStates(),
+                                      [[0, 0, 0, 0], [0, 1, 0, 0],
+                                       [1, 0, 0, 1]])
+
+    def test_setStatesInvalidShape(self) -> None:
+        """
+        The setStates method must reject states of another shape.
+        """
+        with self.assertRaises(ValueError):
+            self.dut.setStates(np.zeros((4, 3)))
+
+    def test_setState(self) -> None:
+        """
+        The setState method must set the LED state and repaint its cell only
+        when it changed.
+        """
+        testStates = (True, True, False)
+        expectedUpdateCounts = (1, 1, 2)
+        with patch.object(self.dut, 'update') as mockedUpdate:
+            for isOn, expectedUpdateCount in zip(testStates,
+                                                 expectedUpdateCounts):
+                self.dut.setState(1, 2, isOn)
+                self.assertEqual(self.dut.getState(1, 2), isOn, 'setState '
+                                 'failed to set the LED state.')
+                self.assertEqual(mockedUpdate.call_count,
+                                 expectedUpdateCount, 'setState failed to '
+                                 'repaint only on a change.')
+            mockedUpdate.assert_called_with(QRect(25, 12, 10, 10))
+
+    def test_getCellRect(self) -> None:
+        """
+        The getCellRect method must return the cell rectangle.
+        """
+        result = self.dut.getCellRect(2, 1)
+        self.assertEqual(result, QRect(15, 22, 10, 10), 'getCellRect failed '
+                         'to return the cell rectangle.')
+
+    def test_indexAt(self) -> None:
+        """
+        The indexAt method must return the cell at the position, None outside
+        the grid.
+        """
+        testPositions = (QPoint(5, 2), QPoint(44, 31), QPoint(20, 15),
+                         QPoint(4, 10), QPoint(45, 10), QPoint(10, 32))
+        expectedResults = ((0, 0), (2, 3), (1, 1), None, None, None)
+        for pos, expectedResult in zip(testPositions, expectedResults):
+            result = self.dut.indexAt(pos)
+            self.assertEqual(result, expectedResult, 'indexAt failed to '
+                             'return the cell at the position.')
+
+    def test_sizeHint(self) -> None:
+        """
+        The sizeHint method must return the size of the matrix at the
+        default cell size.
+        """
+        self.assertEqual(self.dut.sizeHint(), QSize(96, 72), 'sizeHint '
+                         'failed to return the default matrix size.')
+
+    def test_mouseClick(self) -> None:
+        """
+        The mouse event handlers must report a left click released on the
+        cell it was pressed on.
+        """
+        testClicks = ((Qt.LeftButton, QPoint(20, 15), QPoint(24, 18)),
+                      (Qt.LeftButton, QPoint(20, 15), QPoint(30, 15)),
+                      (Qt.RightButton, QPoint(20, 15), QPoint(20, 15)),
+                      (Qt.LeftButton, QPoint(0, 0), QPoint(0, 0)))
+        expectedClicks = ((1, 1), None, None, None)
+        for testClick, expectedClick in zip(testClicks, expectedClicks):
+            button, pressPos, releasePos = testClick
+            pressEvent = Mock()
+            pressEvent.button.return_value = button
+            pressEvent.pos.return_value = pressPos
+            releaseEvent = Mock()
+            releaseEvent.button.return_value = button
+            releaseEvent.pos.return_value = releasePos
+            with patch.object(LedMatrix, 'cellClicked') as mockedSignal:
+                self.dut.mousePressEvent(pressEvent)
+                self.dut.mouseReleaseEvent(releaseEvent)
+                if expectedClick is None:
+                    mockedSignal.emit.assert_not_called()
+                else:
+                    mockedSignal.emit.assert_called_once_with(*expectedClick)
+
+    def test_resizeEvent(self) -> None:
+        """
+        The resizeEvent method must fit the grid, leaving the repaint to Qt.
+        """
+        with patch.object(self.dut, '_updateGeometry') as mockedUpdateGeo, \
+                patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut.resizeEvent(None)
+            mockedUpdateGeo.assert_called_once()
+            mockedUpdate.assert_not_called()
+
+    def test_paintEvent(self) -> None:
+        """
+        The paintEvent method must blit the rendered LED of every repainted
+        cell.
+        """
+        mockedPainter = Mock()
+        self.dut._states[2, 3] = 1
+        pixmaps = {False: 'off', True: 'on'}
+        with patch(self.painterCls) as mockedPainterCls, \
+                patch.object(self.dut, '_getPixmaps') as mockedGetPixmaps, \
+                patch.object(self.dut, '_getDirtyCells') as mockedGetCells:
+            mockedPainterCls.return_value = mockedPainter
+            mockedGetPixmaps.return_value = pixmaps
+            mockedGetCells.return_value = np.array([[0, 1], [2, 3]])
+            self.dut.paintEvent('event')
+            mockedGetCells.assert_called_once_with('event')
+            mockedPainterCls.assert_called_once_with(self.dut)
+            mockedPainter.drawPixmap.assert_has_calls((call(15, 2, 'off'),
+                                                       call(35, 22, 'on')))
+            self.assertEqual(mockedPainter.drawPixmap.call_count, 2,
+                             'paintEvent failed to paint the repainted cells '
+                             'only.')
@@ -0,0 +1,118 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from PySide2.QtGui import QColor
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.ledIndicator import LedIndicatorColor              # noqa: E402
+from widgets.ledIndicator.ledPalette import LedPalette          # noqa: E402
+
+
+class TestLedPalette(TestCase):
+    """
+    The LedPalette class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.registries = [patch.object(LedPalette, name, {})
+                           for name in ('_palettes', '_colorPalettes',
+                                        '_schemePalettes')]
+        for registry in self.registries:
+            registry.start()
+
+    def tearDown(self) -> None:
+        """
+        Test cases teardown.
+        """
+        for registry in self.registries:
+            registry.stop()
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must copy the colors and compute the palette key.
+        """
+        colors = (QColor(1, 2, 3), QColor(4, 5, 6), QColor(7, 8, 9),
+                  QColor(10, 11, 12))
+        palette = LedPalette(*colors)
+        colors[0].setRed(100)
+        self.assertEqual(palette.getOnColors(), (QColor(1, 2, 3), colors[1]),
+                         'LedPalette failed to copy the on colors.')
+        self.assertEqual(palette.getOffColors(), colors[2:], 'LedPalette '
+                         'failed to set the off colors.')
+        self.assertEqual(palette.getKey(),
+                         (QColor(1, 2, 3).rgba(), colors[1].rgba(),
+                          colors[2].rgba(), colors[3].rgba()), 'LedPalette '
+                         'failed to compute the palette key.')
+
+    def test_fromRgb(self) -> None:
+        """
+        The fromRgb method must derive the shades of the base color, with
+        the built-in scheme ratios, and intern the palette.
+        """
+        palette = LedPalette.fromRgb(255, 128, 0)
+        self.assertEqual(palette.getOnColors(),
+                         (QColor(255, 128, 0), QColor(192, 96, 0)),
+                         'fromRgb failed to derive the on colors.')
+        self.assertEqual(palette.getOffColors(),
+                         (QColor(28, 14, 0), QColor(128, 64, 0)),
+                         'fromRgb failed to derive the off colors.')
+        with patch.object(LedPalette, '_intern') as mockedIntern:
+            self.assertIs(LedPalette.fromRgb(255, 128, 0), palette,
+                          'fromRgb failed to intern the palette.')
+            mockedIntern.assert_not_called()
+        for rgb in ((256, 0, 0), (0, -1, 0)):
+            with self.assertRaises(ValueError):
+                LedPalette.fromRgb(*rgb)
+
+    def test_fromScheme(self) -> None:
+        """
+        The fromScheme method must use the scheme colors and share the
+        palette derived from the same base color.
+        """
+        for scheme in LedIndicatorColor:
+            palette = LedPalette.fromScheme(scheme)
+            onColor1 = scheme.value['onColor1']
+            self.assertIs(palette, LedPalette.fromRgb(onColor1['r'],
+                                                      onColor1['g'],
+                                                      onColor1['b']),
+                          'fromScheme failed to share the derived palette.')
+            self.assertIs(LedPalette.fromScheme(scheme), palette,
+                          'fromScheme failed to intern the palette.')
+            expectedColors = tuple(QColor(scheme.value[name]['r'],
+                                          scheme.value[name]['g'],
+                                          scheme.value[name]['b'])
+                                   for name in ('onColor1', 'onColor2',
+                                                'offColor1', 'offColor2'))
+            self.assertEqual(palette.getOnColors() + palette.getOffColors(),
+                             expectedColors, 'fromScheme failed to use the '
+                             'scheme colors.')
+
+    def test_get(self) -> None:
+        """
+        The get method must return the interned palette of any supported
+        color.
+        """
+        palette = LedPalette.fromRgb(0, 0, 255)
+        testColors = (palette, LedIndicatorColor.BLU, QColor(0, 0, 255),
+                      (0, 0, 255))
+        for testColor in testColors:
+            self.assertIs(LedPalette.get(testColor), palette, 'get failed to '
+                          'return the interned palette.')
+
+    def test_getColorsCopy(self) -> None:
+        """
+        The color getters must return copies, keeping the palette immutable.
+        """
+        palette = LedPalette.fromRgb(0, 255, 0)
+        palette.getOnColors()[0].setRed(255)
+        palette.getOffColors()[1].setRed(255)
+        self.assertEqual(palette.getOnColors()[0], QColor(0, 255, 0),
+                         'getOnColors failed to return a copy.')
+        self.assertEqual(palette.getOffColors()[1], QColor(0, 128, 0),
+                         'getOffColors failed to return a copy.')
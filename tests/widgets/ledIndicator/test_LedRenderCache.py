@@ -0,0 +1,42 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.common import PixmapCache                          # noqa: E402
+from widgets.ledIndicator import LedRenderCache                 # noqa: E402
+from widgets.waitingSpinner import SpinnerRenderCache           # noqa: E402
+
+
+class TestLedRenderCache(TestCase):
+    """
+    The LedRenderCache class test cases.
+    """
+    def test_constructor(self) -> None:
+        """
+        The constructor must initialize a pixmap cache with the LED default
+        byte budget.
+        """
+        dut = LedRenderCache()
+        self.assertIsInstance(dut, PixmapCache, 'The constructor failed to '
+                              'create a pixmap cache.')
+        self.assertEqual(dut.getByteBudget(), 8 * 1024 * 1024, 'The '
+                         'constructor failed to set the default byte budget.')
+
+    def test_instance(self) -> None:
+        """
+        The instance method must create the shared cache once, distinct from
+        the other widgets cache, and return it afterward.
+        """
+        with patch.object(LedRenderCache, '_instance', None), \
+                patch.object(SpinnerRenderCache, '_instance', None):
+            result = LedRenderCache.instance()
+            self.assertIsInstance(result, LedRenderCache, 'instance '
+                                  'failed to create the shared cache.')
+            self.assertIs(LedRenderCache.instance(), result, 'instance '
+                          'failed to return the shared cache.')
+            self.assertIsNot(SpinnerRenderCache.instance(), result,
+                             'instance failed to keep one cache per widget.')
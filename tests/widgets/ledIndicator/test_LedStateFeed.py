@@ -0,0 +1,167 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.ledIndicator.ledStateFeed import LedStateFeed      # noqa: E402
+
+
+class TestLedStateFeed(TestCase):
+    """
+    The LedStateFeed class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.dut = LedStateFeed(rate=50)
+        self.dut._timer = Mock()
+        self.dut._timer.isActive.return_value = False
+        self.leds = {ledId: Mock() for ledId in ('a', 'b')}
+        for ledId, led in self.leds.items():
+            self.dut.addLed(ledId, led)
+        self.mockedSlot = Mock()
+        self.dut.batchApplied.connect(self.mockedSlot)
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must set the batch rate and reset the counters.
+        """
+        dut = LedStateFeed(rate=25)
+        self.assertEqual(dut.getRate(), 25, 'LedStateFeed failed to set the '
+                         'batch rate.')
+        self.assertEqual(dut._timer.interval(), 40, 'LedStateFeed failed to '
+                         'set the batch interval.')
+        self.assertTrue(dut._timer.isSingleShot(), 'LedStateFeed failed to '
+                        'set a single shot timer.')
+        for count in (dut.getReceivedCount(), dut.getDroppedCount(),
+                      dut.getAppliedCount(), dut.getPendingCount()):
+            self.assertEqual(count, 0, 'LedStateFeed failed to reset the '
+                             'counters.')
+
+    def test_push(self) -> None:
+        """
+        The push method must keep the latest state of each LED, count the
+        collapsed updates and schedule a batch on the first update only.
+        """
+        self.dut.push('a', 1)
+        self.dut._timer.start.assert_called_once_with()
+        self.dut._timer.isActive.return_value = True
+        self.dut.push('a', 0)
+        self.dut.push('b', True)
+        self.dut._timer.start.assert_called_once_with()
+        self.assertEqual(self.dut._pendingStates, {'a': False, 'b': True},
+                         'push failed to keep the latest states.')
+        self.assertEqual(self.dut.getReceivedCount(), 3, 'push failed to '
+                         'count the received updates.')
+        self.assertEqual(self.dut.getDroppedCount(), 1, 'push failed to '
+                         'count the dropped updates.')
+        self.assertEqual(self.dut.getPendingCount(), 2, 'push failed to '
+                         'store the pending updates.')
+
+    def test_pushMany(self) -> None:
+        """
+        The pushMany method must keep the latest state of each LED and
+        schedule a batch if the feed was idle.
+        """
+        self.dut.pushMany([])
+        self.dut._timer.start.assert_not_called()
+        self.dut.pushMany([('a', True), ('b', True), ('a', False)])
+        self.dut._timer.start.assert_called_once_with()
+        self.assertEqual(self.dut._pendingStates, {'a': False, 'b': True},
+                         'pushMany failed to keep the latest states.')
+        self.assertEqual(self.dut.getReceivedCount(), 3, 'pushMany failed '
+                         'to count the received updates.')
+        self.assertEqual(self.dut.getDroppedCount(), 1, 'pushMany failed to '
+                         'count the dropped updates.')
+
+    def test_pushThreads(self) -> None:
+        """
+        The push method must not lose any update pushed concurrently.
+        """
+        def produce(ledId: int) -> None:
+            for idx in range(1000):
+                self.dut.push(ledId, idx % 2)
+
+        threads = [threading.Thread(target=produce, args=(ledId,))
+                   for ledId in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.dut.getReceivedCount(), 4000, 'push failed to '
+                         'count the concurrent updates.')
+        self.assertEqual(self.dut.getDroppedCount(), 3996, 'push failed to '
+                         'count the collapsed updates.')
+        self.assertEqual(self.dut._pendingStates,
+                         {ledId: True for ledId in range(4)}, 'push failed '
+                         'to keep the latest states.')
+
+    def test_applyPending(self) -> None:
+        """
+        The _applyPending method must apply the pending updates to the
+        registered LEDs in a single batch and report it.
+        """
+        self.dut.pushMany([('a', True), ('c', False), ('a', True)])
+        self.dut._applyPending()
+        self.leds['a'].setChecked.assert_called_once_with(True)
+        self.leds['b'].setChecked.assert_not_called()
+        self.mockedSlot.assert_called_once_with({'a': True, 'c': False})
+        self.assertEqual(self.dut.getAppliedCount(), 2, '_applyPending '
+                         'failed to count the applied updates.')
+        self.assertEqual(self.dut.getPendingCount(), 0, '_applyPending '
+                         'failed to clear the pending updates.')
+        self.mockedSlot.reset_mock()
+        self.dut._applyPending()
+        self.mockedSlot.assert_not_called()
+
+    def test_removeLed(self) -> None:
+        """
+        The removeLed method must stop applying the updates to the LED.
+        """
+        self.dut.removeLed('a')
+        self.dut.removeLed('z')
+        self.dut.push('a', True)
+        self.dut._applyPending()
+        self.leds['a'].setChecked.assert_not_called()
+        self.mockedSlot.assert_called_once_with({'a': True})
+
+    def test_flush(self) -> None:
+        """
+        The flush method must cancel the scheduled batch and apply the
+        pending updates at once.
+        """
+        self.dut.push('b', True)
+        self.dut.flush()
+        self.dut._timer.stop.assert_called_once_with()
+        self.leds['b'].setChecked.assert_called_once_with(True)
+
+    def test_setRate(self) -> None:
+        """
+        The setRate method must set the batch interval and reject a rate
+        that is not positive.
+        """
+        self.dut.setRate(60)
+        self.assertEqual(self.dut.getRate(), 60, 'setRate failed to set the '
+                         'batch rate.')
+        self.dut._timer.setInterval.assert_called_once_with(17)
+        for rate in (0, -1):
+            with self.assertRaises(ValueError):
+                self.dut.setRate(rate)
+
+    def test_resetCounters(self) -> None:
+        """
+        The resetCounters method must reset the update counters.
+        """
+        self.dut.pushMany([('a', True), ('a', False)])
+        self.dut._applyPending()
+        self.dut.resetCounters()
+        for count in (self.dut.getReceivedCount(),
+                      self.dut.getDroppedCount(),
+                      self.dut.getAppliedCount()):
+            self.assertEqual(count, 0, 'resetCounters failed to reset the '
+                             'counters.')
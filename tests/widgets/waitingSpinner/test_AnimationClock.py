@@ -0,0 +1,202 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.waitingSpinner import AnimationClock               # noqa: E402
+
+
+class TestAnimationClock(TestCase):
+    """
+    The AnimationClock class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.objectCls = 'widgets.waitingSpinner.animationClock.QObject'
+        self.timerCls = 'widgets.waitingSpinner.animationClock.QTimer'
+        self.elapsedTimerCls = \
+            'widgets.waitingSpinner.animationClock.QElapsedTimer'
+        self.isValidFct = 'widgets.waitingSpinner.animationClock.isValid'
+        with patch(f"{self.objectCls}.__init__"), \
+                patch(self.timerCls), \
+                patch(self.elapsedTimerCls):
+            self.dut = AnimationClock()
+
+    def _createSpinner(self, interval: int = 50) -> Mock:
+        """
+        Create a mocked spinner with the given frame interval.
+        """
+        spinner = Mock()
+        spinner._getTickInterval.return_value = interval
+        return spinner
+
+    def test_instance(self) -> None:
+        """
+        The instance method must create the shared clock once and return it
+        afterward.
+        """
+        with patch.object(AnimationClock, '_instance', None), \
+                patch(f"{self.objectCls}.__init__"), \
+                patch(self.timerCls), \
+                patch(self.elapsedTimerCls):
+            result = AnimationClock.instance()
+            self.assertIsInstance(result, AnimationClock, 'instance failed '
+                                  'to create the shared clock.')
+            self.assertIs(AnimationClock.instance(), result, 'instance '
+                          'failed to return the shared clock.')
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must create the clock timer and connect its timeout
+        to the tick handler.
+        """
+        testParent = 'test parent'
+        with patch(f"{self.objectCls}.__init__") as mockedBaseClsConst, \
+                patch(self.timerCls) as mockedTimerCls, \
+                patch(self.elapsedTimerCls):
+            dut = AnimationClock(testParent)
+            mockedBaseClsConst.assert_called_once_with(testParent)
+            mockedTimerCls.assert_called_once_with(dut)
+            mockedTimerCls.return_value.timeout.connect \
+                .assert_called_once_with(dut._tick)
+            self.assertEqual(dut._spinners, [], 'The constructor failed to '
+                             'initialize the spinner list.')
+
+    def test_tick(self) -> None:
+        """
+        The _tick method must advance every spinner by the elapsed time and
+        repaint only the ones that changed frame.
+        """
+        testElapsed = 20
+        spinners = (self._createSpinner(), self._createSpinner(),
+                    self._createSpinner())
+        spinners[0]._advance.return_value = True
+        spinners[1]._advance.return_value = False
+        spinners[2]._advance.return_value = True
+        self.dut._spinners = list(spinners)
+        self.dut._elapsedTimer.restart.return_value = testElapsed
+        with patch(self.isValidFct) as mockedIsValid:
+            mockedIsValid.return_value = True
+            self.dut._tick()
+        for spinner in spinners:
+            spinner._advance.assert_called_once_with(testElapsed)
+        spinners[0]._repaintFrame.assert_called_once()
+        spinners[1]._repaintFrame.assert_not_called()
+        spinners[2]._repaintFrame.assert_called_once()
+
+    def test_tickDropDestroyedSpinner(self) -> None:
+        """
+        The _tick method must drop the spinners that were destroyed and stop
+        the timer when none are left.
+        """
+        spinner = self._createSpinner()
+        self.dut._spinners = [spinner]
+        self.dut._elapsedTimer.restart.return_value = 20
+        with patch(self.isValidFct) as mockedIsValid:
+            mockedIsValid.return_value = False
+            self.dut._tick()
+        spinner._advance.assert_not_called()
+        self.assertEqual(self.dut._spinners, [], '_tick failed to drop the '
+                         'destroyed spinner.')
+        self.dut._timer.stop.assert_called_once()
+
+    def test_updateInterval(self) -> None:
+        """
+        The updateInterval method must set the timer interval to the fastest
+        spinner interval.
+        """
+        self.dut.updateInterval()
+        self.dut._timer.setInterval.assert_not_called()
+        self.dut._spinners = [self._createSpinner(50),
+                              self._createSpinner(20),
+                              self._createSpinner(30)]
+        self.dut.updateInterval()
+        self.dut._timer.setInterval.assert_called_once_with(20)
+
+    def test_getInterval(self) -> None:
+        """
+        The getInterval method must return the clock interval.
+        """
+        self.dut._timer.interval.return_value = 25
+        result = self.dut.getInterval()
+        self.assertEqual(result, 25, 'getInterval failed to return the clock '
+                         'interval.')
+
+    def test_register(self) -> None:
+        """
+        The register method must add the spinner once, update the interval
+        and start the timer if it is not active.
+        """
+        spinner = self._createSpinner()
+        self.dut._timer.isActive.return_value = False
+        with patch.object(self.dut, 'updateInterval') as mockedUpdateInt:
+            self.dut.register(spinner)
+            self.dut._timer.isActive.return_value = True
+            self.dut.register(spinner)
+            mockedUpdateInt.assert_called_once()
+        self.assertEqual(self.dut._spinners, [spinner], 'register failed to '
+                         'add the spinner.')
+        self.dut._elapsedTimer.start.assert_called_once()
+        self.dut._timer.start.assert_called_once()
+
+    def test_unregister(self) -> None:
+        """
+        The unregister method must remove the spinner and stop the timer when
+        no spinners are left.
+        """
+        spinners = [self._createSpinner(), self._createSpinner()]
+        self.dut._spinners = list(spinners)
+        with patch.object(self.dut, 'updateInterval') as mockedUpdateInt, \
+                patch(self.isValidFct) as mockedIsValid:
+            mockedIsValid.return_value = True
+            self.dut.unregister(spinners[0])
+            mockedUpdateInt.assert_called_once()
+            self.dut._timer.stop.assert_not_called()
+            self.dut.unregister(spinners[0])
+            self.dut.unregister(spinners[1])
+        self.assertEqual(self.dut._spinners, [], 'unregister failed to '
+                         'remove the spinners.')
+        self.dut._timer.stop.assert_called_once()
+
+    def test_unregisterDeletedTimer(self) -> None:
+        """
+        The unregister method must remove the spinner without touching the
+        clock timer once it was deleted.
+        """
+        spinner = self._createSpinner()
+        self.dut._spinners = [spinner]
+        with patch.object(self.dut, 'updateInterval') as mockedUpdateInt, \
+                patch(self.isValidFct) as mockedIsValid:
+            mockedIsValid.return_value = False
+            self.dut.unregister(spinner)
+            mockedIsValid.assert_called_once_with(self.dut._timer)
+            mockedUpdateInt.assert_not_called()
+        self.assertEqual(self.dut._spinners, [], 'unregister failed to '
+                         'remove the spinner.')
+        self.dut._timer.stop.assert_not_called()
+
+    def test_isRegistered(self) -> None:
+        """
+        The isRegistered method must return True if the spinner is
+        registered and False otherwise.
+        """
+        spinner = self._createSpinner()
+        self.assertFalse(self.dut.isRegistered(spinner), 'isRegistered '
+                         'failed to report an unregistered spinner.')
+        self.dut._spinners = [spinner]
+        self.assertTrue(self.dut.isRegistered(spinner), 'isRegistered '
+                        'failed to report a registered spinner.')
+
+    def test_getSpinnerCount(self) -> None:
+        """
+        The getSpinnerCount method must return the registered spinner count.
+        """
+        self.dut._spinners = [self._createSpinner(), self._createSpinner()]
+        result = self.dut.getSpinnerCount()
+        self.assertEqual(result, 2, 'getSpinnerCount failed to return the '
+                         'registered spinner count.')
@@ -0,0 +1,180 @@
+from unittest import TestCase
+from unittest.mock import call, Mock, patch
+
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QImage
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.waitingSpinner.frameAtlasBuilder import \
+    FrameAtlasBuilder                                           # noqa: E402
+
+
+class TestFrameAtlasBuilder(TestCase):
+    """
+    The FrameAtlasBuilder class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.module = 'widgets.waitingSpinner.frameAtlasBuilder'
+        self.imageCls = f"{self.module}.QImage"
+        self.painterCls = f"{self.module}.QPainter"
+        self.threadPoolCls = f"{self.module}.QThreadPool"
+        self.styleKey = ('test', 'key')
+        self.drawList = Mock()
+        self.drawList.getFrameCount.return_value = 2
+        self.dut = FrameAtlasBuilder(self.styleKey, 40, 1.5, self.drawList)
+
+    def tearDown(self) -> None:
+        """
+        Test cases teardown.
+        """
+        FrameAtlasBuilder._activeBuilders.clear()
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must keep the draw list and create its task.
+        """
+        with patch(f"{self.module}._FrameAtlasTask") as mockedTaskCls:
+            dut = FrameAtlasBuilder(self.styleKey, 40, 2.0, self.drawList)
+            mockedTaskCls.assert_called_once_with(dut)
+        self.assertIs(dut._drawList, self.drawList, 'The constructor failed '
+                      'to keep the draw list.')
+        self.assertEqual(dut.getStyleKey(), self.styleKey, 'The constructor '
+                         'failed to set the style key.')
+        self.assertFalse(dut.isCancelled(), 'The constructor failed to '
+                         'initialize the build as not cancelled.')
+
+    def test_build(self) -> None:
+        """
+        The _build method must paint every frame side by side, aligned on
+        device pixels, in an image strip matching the device pixel ratio and
+        report the end of the task.
+        """
+        mockedImage = Mock()
+        mockedPainter = Mock()
+        mockedSlot = Mock()
+        self.dut._taskEnded.connect(mockedSlot)
+        with patch(self.imageCls) as mockedImageConst, \
+                patch(self.painterCls) as mockedPainterConst:
+            mockedImageConst.return_value = mockedImage
+            mockedPainterConst.return_value = mockedPainter
+            self.dut._build()
+            mockedImageConst.assert_called_once_with(
+                120, 60, mockedImageConst.Format_ARGB32_Premultiplied)
+            mockedImage.setDevicePixelRatio.assert_called_once_with(1.5)
+            mockedImage.fill.assert_called_once_with(Qt.transparent)
+            mockedPainter.translate.assert_has_calls((call(0, 0),
+                                                      call(40, 0)))
+            self.drawList.paintFrame.assert_has_calls(
+                (call(mockedPainter, 0), call(mockedPainter, 1)))
+            mockedPainter.end.assert_called_once()
+            mockedSlot.assert_called_once()
+        self.assertEqual(self.dut._frameAtlas, mockedImage, '_build failed '
+                         'to keep the frame atlas.')
+
+    def test_buildCancelled(self) -> None:
+        """
+        The _build method must stop painting and drop the frame atlas when
+        cancelled.
+        """
+        self.dut._isCancelled = True
+        mockedSlot = Mock()
+        self.dut._taskEnded.connect(mockedSlot)
+        with patch(self.imageCls), patch(self.painterCls):
+            self.dut._build()
+            self.drawList.paintFrame.assert_not_called()
+            mockedSlot.assert_called_once()
+        self.assertIsNone(self.dut._frameAtlas, '_build failed to drop the '
+                          'frame atlas.')
+
+    def test_buildFailed(self) -> None:
+        """
+        The _build method must report the end of the task when the painting
+        fails, without keeping a frame atlas.
+        """
+        self.drawList.paintFrame.side_effect = RuntimeError('test error')
+        mockedSlot = Mock()
+        self.dut._taskEnded.connect(mockedSlot)
+        with patch(self.imageCls), patch(self.painterCls) \
+                as mockedPainterConst:
+            with self.assertRaises(RuntimeError):
+                self.dut._build()
+            mockedPainterConst.return_value.end.assert_called_once()
+            mockedSlot.assert_called_once()
+        self.assertIsNone(self.dut._frameAtlas, '_build failed to drop the '
+                          'frame atlas.')
+
+    def test_onTaskEndedFailed(self) -> None:
+        """
+        The _onTaskEnded method must release the builder and report a null
+        frame atlas when the build failed.
+        """
+        mockedSlot = Mock()
+        self.dut.built.connect(mockedSlot)
+        FrameAtlasBuilder._activeBuilders.add(self.dut)
+        self.dut._onTaskEnded()
+        mockedSlot.assert_called_once()
+        self.assertEqual(mockedSlot.call_args.args[0], self.styleKey,
+                         '_onTaskEnded failed to report the style key.')
+        self.assertTrue(mockedSlot.call_args.args[1].isNull(), '_onTaskEnded '
+                        'failed to report a null frame atlas.')
+        self.assertNotIn(self.dut, FrameAtlasBuilder._activeBuilders,
+                         '_onTaskEnded failed to release the builder.')
+
+    def test_onTaskEnded(self) -> None:
+        """
+        The _onTaskEnded method must release the builder and report the
+        frame atlas only when the build was not cancelled.
+        """
+        mockedSlot = Mock()
+        self.dut.built.connect(mockedSlot)
+        testAtlas = QImage(8, 4, QImage.Format_ARGB32_Premultiplied)
+        for isCancelled in (True, False):
+            self.dut._isCancelled = isCancelled
+            self.dut._frameAtlas = testAtlas
+            FrameAtlasBuilder._activeBuilders.add(self.dut)
+            self.dut._onTaskEnded()
+            if isCancelled:
+                mockedSlot.assert_not_called()
+            else:
+                mockedSlot.assert_called_once_with(self.styleKey, testAtlas)
+            self.assertNotIn(self.dut, FrameAtlasBuilder._activeBuilders,
+                             '_onTaskEnded failed to release the builder.')
+
+    def test_start(self) -> None:
+        """
+        The start method must keep the builder referenced and start its task
+        on the global thread pool.
+        """
+        with patch(self.threadPoolCls) as mockedThreadPoolCls:
+            self.dut.start()
+            mockedThreadPoolCls.globalInstance.return_value.start \
+                .assert_called_once_with(self.dut._task)
+        self.assertIn(self.dut, FrameAtlasBuilder._activeBuilders, 'start '
+                      'failed to keep the builder referenced.')
+
+    def test_cancel(self) -> None:
+        """
+        The cancel method must flag the build as cancelled and release it
+        only when its task was removed from the thread pool.
+        """
+        for isTaken in (False, True):
+            self.dut._isCancelled = False
+            FrameAtlasBuilder._activeBuilders.add(self.dut)
+            with patch(self.threadPoolCls) as mockedThreadPoolCls:
+                mockedThreadPool = mockedThreadPoolCls.globalInstance()
+                mockedThreadPool.tryTake.return_value = isTaken
+                self.dut.cancel()
+                mockedThreadPool.tryTake.assert_called_once_with(
+                    self.dut._task)
+            self.assertTrue(self.dut.isCancelled(), 'cancel failed to flag '
+                            'the build as cancelled.')
+            self.assertEqual(self.dut in FrameAtlasBuilder._activeBuilders,
+                             not isTaken, 'cancel failed to release the '
+                             'removed build.')
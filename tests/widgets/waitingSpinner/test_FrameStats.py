@@ -0,0 +1,174 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.waitingSpinner import FrameStats                   # noqa: E402
+
+
+class TestFrameStats(TestCase):
+    """
+    The FrameStats class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.elapsedTimerCls = \
+            'widgets.waitingSpinner.frameStats.QElapsedTimer'
+        with patch(self.elapsedTimerCls) as mockedElapsedTimerCls:
+            mockedElapsedTimerCls.side_effect = (Mock(), Mock())
+            self.dut = FrameStats()
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must initialize empty statistics and start the
+        window.
+        """
+        self.assertEqual((self.dut._paintedFrameCount,
+                          self.dut._advancedFrameCount, self.dut._tickCount,
+                          self.dut._lateTickCount,
+                          self.dut._coalescedTickCount), (0, 0, 0, 0, 0),
+                         'The constructor failed to initialize empty '
+                         'statistics.')
+        self.assertEqual(len(self.dut._paintDurations), 0, 'The constructor '
+                         'failed to initialize empty statistics.')
+        self.dut._windowTimer.start.assert_called_once()
+
+    def test_reset(self) -> None:
+        """
+        The reset method must clear the statistics and restart the window.
+        """
+        self.dut._paintedFrameCount = 1
+        self.dut._advancedFrameCount = 2
+        self.dut._tickCount = 3
+        self.dut._lateTickCount = 4
+        self.dut._coalescedTickCount = 5
+        self.dut._paintDurations.append(6)
+        self.dut._windowTimer.reset_mock()
+        self.dut.reset()
+        self.assertEqual((self.dut._paintedFrameCount,
+                          self.dut._advancedFrameCount, self.dut._tickCount,
+                          self.dut._lateTickCount,
+                          self.dut._coalescedTickCount), (0, 0, 0, 0, 0),
+                         'reset failed to clear the statistics.')
+        self.assertEqual(len(self.dut._paintDurations), 0, 'reset failed to '
+                         'clear the paint durations.')
+        self.dut._windowTimer.start.assert_called_once()
+
+    def test_restartTicks(self) -> None:
+        """
+        The restartTicks method must invalidate the tick measurement.
+        """
+        self.dut.restartTicks()
+        self.dut._tickTimer.invalidate.assert_called_once()
+
+    def test_recordTick(self) -> None:
+        """
+        The recordTick method must count the ticks and the late and
+        coalesced ones.
+        """
+        testElapsed = (20, 30, 31, 60, 100)
+        expectedLateCounts = (0, 0, 1, 2, 3)
+        expectedCoalescedCounts = (0, 0, 1, 3, 7)
+        for idx, elapsed in enumerate(testElapsed):
+            self.dut.recordTick(elapsed, 20)
+            self.assertEqual(self.dut._tickCount, idx + 1, 'recordTick '
+                             'failed to count the tick.')
+            self.assertEqual(self.dut._lateTickCount, expectedLateCounts[idx],
+                             'recordTick failed to count the late tick.')
+            self.assertEqual(self.dut._coalescedTickCount,
+                             expectedCoalescedCounts[idx], 'recordTick failed '
+                             'to count the coalesced ticks.')
+
+    def test_recordTimerTickFirst(self) -> None:
+        """
+        The recordTimerTick method must start the tick measurement on the
+        first tick.
+        """
+        self.dut._tickTimer.isValid.return_value = False
+        with patch.object(self.dut, 'recordTick') as mockedRecordTick:
+            self.dut.recordTimerTick(20)
+            mockedRecordTick.assert_not_called()
+        self.dut._tickTimer.start.assert_called_once()
+        self.assertEqual(self.dut._tickCount, 1, 'recordTimerTick failed to '
+                         'count the tick.')
+
+    def test_recordTimerTick(self) -> None:
+        """
+        The recordTimerTick method must record the tick with the time elapsed
+        since the previous one.
+        """
+        self.dut._tickTimer.isValid.return_value = True
+        self.dut._tickTimer.restart.return_value = 45
+        with patch.object(self.dut, 'recordTick') as mockedRecordTick:
+            self.dut.recordTimerTick(20)
+            mockedRecordTick.assert_called_once_with(45, 20)
+
+    def test_recordFrames(self) -> None:
+        """
+        The recordFrames method must count the advanced frames.
+        """
+        self.dut.recordFrames(1)
+        self.dut.recordFrames(3)
+        self.assertEqual(self.dut._advancedFrameCount, 4, 'recordFrames '
+                         'failed to count the advanced frames.')
+
+    def test_recordPaint(self) -> None:
+        """
+        The recordPaint method must count the painted frame and keep its
+        duration.
+        """
+        self.dut.recordPaint(1000)
+        self.dut.recordPaint(2000)
+        self.assertEqual(self.dut._paintedFrameCount, 2, 'recordPaint failed '
+                         'to count the painted frames.')
+        self.assertEqual(list(self.dut._paintDurations), [1000, 2000],
+                         'recordPaint failed to keep the paint durations.')
+
+    def test_getStatsEmpty(self) -> None:
+        """
+        The getStats method must return zeroed statistics when nothing was
+        recorded.
+        """
+        self.dut._windowTimer.elapsed.return_value = 0
+        result = self.dut.getStats(20, 1.5)
+        self.assertEqual(result, {'paintedFrames': 0, 'ticks': 0,
+                                  'lateTicks': 0, 'coalescedTicks': 0,
+                                  'avgPaintDuration': 0.0,
+                                  'p99PaintDuration': 0.0,
+                                  'revsPerSecond': 1.5,
+                                  'effectiveRevsPerSecond': 0.0,
+                                  'duration': 0}, 'getStats failed to '
+                         'return zeroed statistics.')
+
+    def test_getStats(self) -> None:
+        """
+        The getStats method must return the statistics of the window.
+        """
+        self.dut._windowTimer.elapsed.return_value = 2000
+        for duration in range(1000000, 101000000, 1000000):
+            self.dut.recordPaint(duration)
+        self.dut.recordFrames(60)
+        self.dut.recordTick(20, 20)
+        self.dut.recordTick(70, 20)
+        result = self.dut.getStats(20, 1.5)
+        self.assertEqual(result['paintedFrames'], 100, 'getStats failed to '
+                         'return the painted frame count.')
+        self.assertEqual((result['ticks'], result['lateTicks'],
+                          result['coalescedTicks']), (2, 1, 3), 'getStats '
+                         'failed to return the tick counts.')
+        self.assertAlmostEqual(result['avgPaintDuration'], 50.5, msg='getStats'
+                               ' failed to return the average paint '
+                               'duration.')
+        self.assertAlmostEqual(result['p99PaintDuration'], 99.0, msg='getStats'
+                               ' failed to return the 99th percentile paint '
+                               'duration.')
+        self.assertAlmostEqual(result['effectiveRevsPerSecond'], 1.5,
+                               msg='getStats failed to return the effective '
+                               'revolutions per second.')
+        self.assertEqual(result['duration'], 2000, 'getStats failed to '
+                         'return the window duration.')
@@ -0,0 +1,269 @@
+from unittest import TestCase
+from unittest.mock import call, Mock, patch
+
+from PySide2.QtCore import QRect, Qt
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.waitingSpinner.spinnerDelegate import \
+    SpinnerDelegate                                             # noqa: E402
+
+
+class TestSpinnerDelegate(TestCase):
+    """
+    The SpinnerDelegate class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.module = 'widgets.waitingSpinner.spinnerDelegate'
+        self.baseCls = f"{self.module}.QStyledItemDelegate"
+        self.spinnerCls = f"{self.module}.WaitingSpinner"
+        self.clockCls = f"{self.module}.AnimationClock"
+        self.optionCls = f"{self.module}.QStyleOptionViewItem"
+        self.view = Mock()
+        with patch(f"{self.baseCls}.__init__"), \
+                patch(self.spinnerCls) as mockedSpinnerCls:
+            self.dut = SpinnerDelegate(self.view)
+        self.spinner = mockedSpinnerCls.return_value
+        self.spinner.getLineCount.return_value = 8
+        self.spinner._getTickInterval.return_value = 40
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must create the template spinner and initialize the
+        delegate with the busy role.
+        """
+        with patch(f"{self.baseCls}.__init__") as mockedBaseClsConst, \
+                patch(self.spinnerCls) as mockedSpinnerCls:
+            dut = SpinnerDelegate(self.view, Qt.UserRole + 2)
+            mockedBaseClsConst.assert_called_once_with(self.view)
+            mockedSpinnerCls.assert_called_once_with(None, isCentered=False)
+        self.assertEqual(dut.getSpinner(), mockedSpinnerCls.return_value,
+                         'The constructor failed to create the template '
+                         'spinner.')
+        self.assertEqual(dut.getBusyRole(), Qt.UserRole + 2, 'The '
+                         'constructor failed to set the busy role.')
+
+    def test_isBusy(self) -> None:
+        """
+        The _isBusy method must check the busy role data of the cell.
+        """
+        testData = (True, False, None, 1)
+        expectedResults = (True, False, False, True)
+        for data, expectedResult in zip(testData, expectedResults):
+            mockedIndex = Mock()
+            mockedIndex.data.return_value = data
+            result = self.dut._isBusy(mockedIndex)
+            mockedIndex.data.assert_called_once_with(Qt.UserRole)
+            self.assertEqual(result, expectedResult, '_isBusy failed to '
+                             'check the busy role.')
+
+    def test_getTickInterval(self) -> None:
+        """
+        The _getTickInterval method must return the template spinner frame
+        interval.
+        """
+        self.assertEqual(self.dut._getTickInterval(), 40, '_getTickInterval '
+                         'failed to return the spinner frame interval.')
+
+    def test_advance(self) -> None:
+        """
+        The _advance method must advance the frame by the whole intervals
+        elapsed and keep the remainder.
+        """
+        testElapsed = (30, 30, 100, 250)
+        expectedResults = (False, True, True, True)
+        expectedCounters = (0, 1, 4, 2)
+        for elapsed, expectedResult, expectedCounter in \
+                zip(testElapsed, expectedResults, expectedCounters):
+            result = self.dut._advance(elapsed)
+            self.assertEqual(result, expectedResult, '_advance failed to '
+                             'report the frame change.')
+            self.assertEqual(self.dut._counter, expectedCounter, '_advance '
+                             'failed to advance the frame.')
+
+    def test_repaintFrame(self) -> None:
+        """
+        The _repaintFrame method must request the repaint of the valid busy
+        cells and forget them until they are painted again.
+        """
+        validIndex = Mock()
+        validIndex.isValid.return_value = True
+        removedIndex = Mock()
+        removedIndex.isValid.return_value = False
+        self.dut._busyIndexes = {validIndex, removedIndex}
+        with patch(f"{self.module}.QModelIndex") as mockedIndexConst, \
+                patch(self.clockCls) as mockedClockCls:
+            self.dut._repaintFrame()
+            mockedIndexConst.assert_called_once_with(validIndex)
+            self.view.update \
+                .assert_called_once_with(mockedIndexConst.return_value)
+            mockedClockCls.instance.return_value.unregister.assert_not_called()
+        self.assertEqual(self.dut._busyIndexes, set(), '_repaintFrame failed '
+                         'to forget the busy cells.')
+
+    def test_repaintFrameNoBusyCell(self) -> None:
+        """
+        The _repaintFrame method must stop the animation when no busy cell
+        was painted since the last frame.
+        """
+        with patch(self.clockCls) as mockedClockCls:
+            self.dut._repaintFrame()
+            mockedClockCls.instance.return_value.unregister \
+                .assert_called_once_with(self.dut)
+        self.view.update.assert_not_called()
+
+    def test_trackBusyCell(self) -> None:
+        """
+        The _trackBusyCell method must track the cell and start the
+        animation only when it is not running.
+        """
+        testRegistered = (False, True)
+        for isRegistered in testRegistered:
+            self.dut._tickElapsed = 10
+            self.dut._busyIndexes = set()
+            with patch(f"{self.module}.QPersistentModelIndex") \
+                    as mockedIndexConst, \
+                    patch(self.clockCls) as mockedClockCls:
+                mockedClock = mockedClockCls.instance.return_value
+                mockedClock.isRegistered.return_value = isRegistered
+                self.dut._trackBusyCell('index')
+                mockedIndexConst.assert_called_once_with('index')
+                self.assertEqual(self.dut._busyIndexes,
+                                 {mockedIndexConst.return_value},
+                                 '_trackBusyCell failed to track the cell.')
+                if isRegistered:
+                    mockedClock.register.assert_not_called()
+                    self.assertEqual(self.dut._tickElapsed, 10,
+                                     '_trackBusyCell failed to keep the '
+                                     'elapsed time.')
+                else:
+                    mockedClock.register.assert_called_once_with(self.dut)
+                    self.assertEqual(self.dut._tickElapsed, 0,
+                                     '_trackBusyCell failed to reset the '
+                                     'elapsed time.')
+
+    def test_drawSpinner(self) -> None:
+        """
+        The _drawSpinner method must paint the current frame centered in the
+        cell and scaled down to fit it.
+        """
+        testRects = (QRect(10, 20, 100, 20), QRect(0, 0, 60, 60))
+        expectedTranslations = ((50.0, 20.0), (10.0, 10.0))
+        expectedScales = (0.5, 1.0)
+        self.spinner.width.return_value = 40
+        self.dut._counter = 10
+        for rect, expectedTranslation, expectedScale in \
+                zip(testRects, expectedTranslations, expectedScales):
+            mockedPainter = Mock()
+            mockedOption = Mock()
+            mockedOption.rect = rect
+            self.spinner.getLineCount.return_value = 3
+            self.spinner.paintFrame.reset_mock()
+            self.dut._drawSpinner(mockedPainter, mockedOption)
+            self.spinner.paintFrame.assert_called_once_with(mockedPainter, 1)
+            mockedPainter.translate \
+                .assert_called_once_with(*expectedTranslation)
+            mockedPainter.scale.assert_called_once_with(expectedScale,
+                                                        expectedScale)
+            mockedPainter.setPen.assert_called_once_with(Qt.NoPen)
+            mockedPainter.save.assert_called_once()
+            mockedPainter.restore.assert_called_once()
+
+    def test_setBusyRole(self) -> None:
+        """
+        The setBusyRole method must set the busy role and repaint the view.
+        """
+        self.dut.setBusyRole(Qt.UserRole + 5)
+        self.assertEqual(self.dut.getBusyRole(), Qt.UserRole + 5,
+                         'setBusyRole failed to set the busy role.')
+        self.view.viewport.return_value.update.assert_called_once()
+
+    def test_isAnimating(self) -> None:
+        """
+        The isAnimating method must check if the delegate is registered in
+        the animation clock.
+        """
+        with patch(self.clockCls) as mockedClockCls:
+            mockedClock = mockedClockCls.instance.return_value
+            mockedClock.isRegistered.return_value = True
+            result = self.dut.isAnimating()
+            mockedClock.isRegistered.assert_called_once_with(self.dut)
+        self.assertTrue(result, 'isAnimating failed to check the animation '
+                        'clock.')
+
+    def test_paintIdle(self) -> None:
+        """
+        The paint method must let the base class paint the idle cells.
+        """
+        with patch(f"{self.baseCls}.paint") as mockedBasePaint, \
+                patch.object(self.dut, '_isBusy') as mockedIsBusy, \
+                patch.object(self.dut, '_drawSpinner') as mockedDraw, \
+                patch.object(self.dut, '_trackBusyCell') as mockedTrack:
+            mockedIsBusy.return_value = False
+            self.dut.paint('painter', 'option', 'index')
+            mockedBasePaint.assert_called_once_with('painter', 'option',
+                                                    'index')
+            mockedDraw.assert_not_called()
+            mockedTrack.assert_not_called()
+
+    def test_paintBusy(self) -> None:
+        """
+        The paint method must paint the background of a busy cell without
+        its content, draw the spinner over it and track the cell.
+        """
+        mockedOption = Mock()
+        with patch(f"{self.baseCls}.paint") as mockedBasePaint, \
+                patch(self.optionCls) as mockedOptionConst, \
+                patch(f"{self.module}.QIcon") as mockedIconConst, \
+                patch(f"{self.module}.QStyle") as mockedStyleCls, \
+                patch.object(self.dut, 'initStyleOption') as mockedInitOpt, \
+                patch.object(self.dut, '_isBusy') as mockedIsBusy, \
+                patch.object(self.dut, '_drawSpinner') as mockedDraw, \
+                patch.object(self.dut, '_trackBusyCell') as mockedTrack:
+            mockedIsBusy.return_value = True
+            mockedOptionConst.return_value = mockedOption
+            self.dut.paint('painter', 'option', 'index')
+            mockedBasePaint.assert_not_called()
+            mockedOptionConst.assert_called_once_with('option')
+            mockedInitOpt.assert_called_once_with(mockedOption, 'index')
+            self.assertEqual(mockedOption.text, '', 'paint failed to hide '
+                             'the busy cell text.')
+            self.assertEqual(mockedOption.icon, mockedIconConst.return_value,
+                             'paint failed to hide the busy cell icon.')
+            mockedOption.widget.style.return_value.drawControl \
+                .assert_called_once_with(mockedStyleCls.CE_ItemViewItem,
+                                         mockedOption, 'painter',
+                                         mockedOption.widget)
+            mockedDraw.assert_called_once_with('painter', 'option')
+            mockedTrack.assert_called_once_with('index')
+
+    def test_animation(self) -> None:
+        """
+        The busy cells must be repainted on every frame change until they
+        are not painted anymore.
+        """
+        mockedIndex = Mock()
+        mockedIndex.isValid.return_value = True
+        with patch(f"{self.module}.QPersistentModelIndex") \
+                as mockedPersistentConst, \
+                patch(f"{self.module}.QModelIndex") as mockedIndexConst, \
+                patch(self.clockCls) as mockedClockCls:
+            mockedPersistentConst.return_value = mockedIndex
+            mockedClock = mockedClockCls.instance.return_value
+            mockedClock.isRegistered.return_value = False
+            self.dut._trackBusyCell('index')
+            if self.dut._advance(40):
+                self.dut._repaintFrame()
+            if self.dut._advance(40):
+                self.dut._repaintFrame()
+            self.view.update \
+                .assert_called_once_with(mockedIndexConst.return_value)
+            self.assertEqual(mockedClock.mock_calls[-1],
+                             call.unregister(self.dut), 'The animation '
+                             'failed to stop without busy cell.')
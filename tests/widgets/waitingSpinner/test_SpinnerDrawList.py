@@ -0,0 +1,105 @@
+from unittest import TestCase
+from unittest.mock import call, Mock
+
+from PySide2.QtCore import QRectF, Qt
+from PySide2.QtGui import QBrush, QTransform
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.waitingSpinner.spinnerDrawList import \
+    SpinnerDrawList                                             # noqa: E402
+
+
+class TestSpinnerDrawList(TestCase):
+    """
+    The SpinnerDrawList class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.lineRect = QRectF(0, -1, 5, 2)
+        self.lineTransforms = []
+        for line in range(3):
+            transform = QTransform()
+            transform.rotate(120 * line)
+            self.lineTransforms.append(transform)
+        redBrush = QBrush(Qt.red)
+        self.lineBrushes = [QBrush(Qt.blue), redBrush, redBrush]
+        self.dut = SpinnerDrawList(self.lineRect, 50.0, self.lineTransforms,
+                                   self.lineBrushes)
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must keep the line geometry and brushes.
+        """
+        self.assertIs(self.dut._lineRect, self.lineRect, 'The constructor '
+                      'failed to keep the line rectangle.')
+        self.assertEqual(self.dut._roundness, 50.0, 'The constructor failed '
+                         'to keep the roundness.')
+        self.assertIs(self.dut.getLineBrushes(), self.lineBrushes,
+                      'The constructor failed to keep the line brushes.')
+        self.assertEqual(self.dut.getFrameCount(), 3, 'The constructor '
+                         'failed to keep the line transforms.')
+
+    def test_copy(self) -> None:
+        """
+        The copy method must return an equal draw list sharing no object
+        with the original one, the lines sharing a brush sharing its copy.
+        """
+        result = self.dut.copy()
+        self.assertIsInstance(result, SpinnerDrawList, 'copy failed to '
+                              'return a draw list.')
+        self.assertIsNot(result._lineRect, self.lineRect, 'copy failed to '
+                         'copy the line rectangle.')
+        self.assertEqual(result._lineRect, self.lineRect, 'copy failed to '
+                         'copy the line rectangle.')
+        self.assertEqual(result._roundness, 50.0, 'copy failed to copy the '
+                         'roundness.')
+        self.assertEqual(result.getFrameCount(), 3, 'copy failed to copy '
+                         'the line transforms.')
+        for transform, expectedTransform in zip(result._lineTransforms,
+                                                self.lineTransforms):
+            self.assertIsNot(transform, expectedTransform, 'copy failed to '
+                             'copy the line transforms.')
+            self.assertEqual(transform, expectedTransform, 'copy failed to '
+                             'copy the line transforms.')
+        brushes = result.getLineBrushes()
+        for brush, expectedBrush in zip(brushes, self.lineBrushes):
+            self.assertIsNot(brush, expectedBrush, 'copy failed to copy the '
+                             'brushes.')
+            self.assertEqual(brush, expectedBrush, 'copy failed to copy the '
+                             'brushes.')
+        self.assertIs(brushes[1], brushes[2], 'copy failed to share the '
+                      'brush copies.')
+
+    def test_paintFrame(self) -> None:
+        """
+        The paintFrame method must draw every line under its transform with
+        the brush of its alpha in the frame, only setting the brush when it
+        changes, and restore the painter transform.
+        """
+        mockedPainter = Mock()
+        self.dut._lineTransforms = ['transform0', 'transform1', 'transform2']
+        self.dut._lineBrushes = ['brush0', 'brush1', 'brush1']
+        self.dut.paintFrame(mockedPainter, 1)
+        transform = mockedPainter.worldTransform.return_value
+        self.assertEqual(mockedPainter.setBrush.call_args_list,
+                         [call('brush1'), call('brush0'), call('brush1')],
+                         'paintFrame failed to shift the brushes to the '
+                         'frame.')
+        expectedCalls = []
+        for line in range(3):
+            expectedCalls += [call.setWorldTransform(f"transform{line}",
+                                                     True),
+                              call.drawRoundedRect(self.lineRect, 50.0, 50.0,
+                                                   Qt.RelativeSize),
+                              call.setWorldTransform(transform)]
+        paintCalls = [paintCall for paintCall in mockedPainter.method_calls
+                      if paintCall[0] in ('setWorldTransform',
+                                          'drawRoundedRect')]
+        self.assertEqual(paintCalls, expectedCalls, 'paintFrame failed to '
+                         'draw every line under its transform.')
@@ -0,0 +1,342 @@
+from tempfile import TemporaryDirectory
+from unittest import skipIf, TestCase
+from unittest.mock import call, Mock, patch
+
+from PySide2.QtCore import QRectF, Qt
+from PySide2.QtGui import QBrush, QColor, QTransform
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from widgets.waitingSpinner import SpinnerDrawList, \
+    SpinnerExporter                                             # noqa: E402
+from widgets.waitingSpinner.spinnerExporter import Image        # noqa: E402
+
+
+class TestSpinnerExporter(TestCase):
+    """
+    The SpinnerExporter class test cases.
+    """
+    def setUp(self) -> None:
+        """
+        Test cases setup.
+        """
+        self.module = 'widgets.waitingSpinner.spinnerExporter'
+        self.threadCls = f"{self.module}.QThread"
+        self.imageCls = f"{self.module}.QImage"
+        self.painterCls = f"{self.module}.QPainter"
+        self.imageMod = f"{self.module}.Image"
+        self.makedirsFct = f"{self.module}.os.makedirs"
+        self.spinner = Mock()
+        self.spinner.width.return_value = 40
+        self.spinner.getLineCount.return_value = 10
+        self.spinner.getRevsPerSecond.return_value = 2.0
+        self.spinner.getDrawList.return_value.getFrameCount.return_value = 2
+        with patch(f"{self.threadCls}.__init__"):
+            self.dut = SpinnerExporter(self.spinner)
+
+    def test_constructor(self) -> None:
+        """
+        The constructor must copy the spinner draw list and compute the frame
+        duration.
+        """
+        with patch(f"{self.threadCls}.__init__") as mockedBaseClsConst:
+            dut = SpinnerExporter(self.spinner, scale=2.0,
+                                  background=Qt.white, parent='test parent')
+            mockedBaseClsConst.assert_called_once_with('test parent')
+        self.assertEqual(dut._drawList, self.spinner.getDrawList.return_value,
+                         'The constructor failed to copy the draw list.')
+        self.assertEqual(dut._frameSize, 40, 'The constructor failed to set '
+                         'the frame size.')
+        self.assertEqual(dut._frameDuration, 50.0, 'The constructor failed to '
+                         'compute the frame duration.')
+        self.assertEqual(dut._scale, 2.0, 'The constructor failed to set the '
+                         'scale factor.')
+        self.assertEqual(dut._background, QColor(Qt.white), 'The constructor '
+                         'failed to set the background color.')
+
+    def test_writeFrame(self) -> None:
+        """
+        The _writeFrame method must save the frame as a PNG image and raise
+        an OSError when it fails.
+        """
+        mockedFrame = Mock()
+        mockedFrame.save.return_value = True
+        self.dut._writeFrame(mockedFrame, 'test.png')
+        mockedFrame.save.assert_called_once_with('test.png', 'PNG')
+        mockedFrame.save.return_value = False
+        with self.assertRaises(OSError):
+            self.dut._writeFrame(mockedFrame, 'test.png')
+
+    def test_convertFrame(self) -> None:
+        """
+        The _convertFrame method must convert the frame to a RGBA Pillow
+        image.
+        """
+        mockedFrame = Mock()
+        converted = mockedFrame.convertToFormat.return_value
+        converted.width.return_value = 40
+        converted.height.return_value = 30
+        converted.constBits.return_value = b'test'
+        converted.bytesPerLine.return_value = 160
+        with patch(self.imageMod) as mockedImage:
+            result = self.dut._convertFrame(mockedFrame)
+            mockedImage.frombuffer \
+                .assert_called_once_with('RGBA', (40, 30), b'test', 'raw',
+                                         'RGBA', 160, 1)
+            self.assertEqual(result, mockedImage.frombuffer.return_value,
+                             '_convertFrame failed to return the Pillow '
+                             'image.')
+
+    def test_getAnimationFormat(self) -> None:
+        """
+        The _getAnimationFormat method must return the format matching the
+        file extension.
+        """
+        testPaths = ('test.gif', 'test.PNG', 'test.apng')
+        expectedFormats = (('GIF', {'disposal': 2}), ('PNG', {'disposal': 1}),
+                           ('PNG', {'disposal': 1}))
+        with patch(self.imageMod):
+            for path, expectedFormat in zip(testPaths, expectedFormats):
+                result = self.dut._getAnimationFormat(path)
+                self.assertEqual(result, expectedFormat, '_getAnimationFormat '
+                                 'failed to return the image format.')
+
+    def test_getAnimationFormatErrors(self) -> None:
+        """
+        The _getAnimationFormat method must raise a ValueError for an
+        unsupported extension and a RuntimeError without Pillow.
+        """
+        with patch(self.imageMod):
+            with self.assertRaises(ValueError):
+                self.dut._getAnimationFormat('test.bmp')
+        with patch(self.imageMod, None):
+            with self.assertRaises(RuntimeError):
+                self.dut._getAnimationFormat('test.gif')
+
+    def test_start(self) -> None:
+        """
+        The _start method must start the exporter thread with the job and
+        raise a RuntimeError when an export is already running.
+        """
+        with patch.object(self.dut, 'isRunning') as mockedIsRunning, \
+                patch.object(self.dut, 'start') as mockedStart:
+            mockedIsRunning.return_value = False
+            self.dut._start('test job')
+            self.assertEqual(self.dut._job, 'test job', '_start failed to set '
+                             'the job.')
+            mockedStart.assert_called_once()
+            mockedIsRunning.return_value = True
+            with self.assertRaises(RuntimeError):
+                self.dut._start('other job')
+            mockedStart.assert_called_once()
+
+    def test_getFrameCount(self) -> None:
+        """
+        The getFrameCount method must return the frame count of a
+        revolution.
+        """
+        result = self.dut.getFrameCount()
+        self.assertEqual(result, 2, 'getFrameCount failed to return the '
+                         'frame count.')
+
+    def test_getFrameDuration(self) -> None:
+        """
+        The getFrameDuration method must return the frame duration.
+        """
+        result = self.dut.getFrameDuration()
+        self.assertEqual(result, 50.0, 'getFrameDuration failed to return '
+                         'the frame duration.')
+
+    def test_renderFrames(self) -> None:
+        """
+        The renderFrames method must paint every frame of a revolution with
+        the spinner draw list in a scaled image.
+        """
+        self.dut._scale = 1.5
+        mockedImages = (Mock(), Mock())
+        mockedPainter = Mock()
+        with patch(self.imageCls) as mockedImageConst, \
+                patch(self.painterCls) as mockedPainterConst:
+            mockedImageConst.side_effect = mockedImages
+            mockedPainterConst.return_value = mockedPainter
+            result = self.dut.renderFrames()
+            mockedImageConst.assert_called_with(
+                60, 60, mockedImageConst.Format_ARGB32_Premultiplied)
+            self.dut._drawList.paintFrame.assert_has_calls(
+                (call(mockedPainter, 0), call(mockedPainter, 1)))
+        self.assertEqual(result, list(mockedImages), 'renderFrames failed to '
+                         'return the frames.')
+        for image in mockedImages:
+            image.fill.assert_called_once_with(self.dut._background)
+        mockedPainter.scale.assert_called_with(1.5, 1.5)
+        mockedPainter.setPen.assert_called_with(Qt.NoPen)
+        self.assertEqual(mockedPainter.end.call_count, 2, 'renderFrames '
+                         'failed to end the painting.')
+
+    def test_writePngSequence(self) -> None:
+        """
+        The writePngSequence method must write the frames as a numbered PNG
+        sequence in the directory.
+        """
+        testFrames = [Mock() for _ in range(12)]
+        with patch(self.makedirsFct) as mockedMakedirs, \
+                patch.object(self.dut, '_writeFrame') as mockedWriteFrame:
+            result = self.dut.writePngSequence(testFrames, 'out', 'spin')
+            mockedMakedirs.assert_called_once_with('out', exist_ok=True)
+            self.assertEqual(mockedWriteFrame.call_count, 12,
+                             'writePngSequence failed to write every frame.')
+            mockedWriteFrame.assert_called_with(testFrames[11],
+                                                os.path.join('out',
+                                                             'spin_11.png'))
+        self.assertEqual(result[0], os.path.join('out', 'spin_00.png'),
+                         'writePngSequence failed to number the frames.')
+
+    def _createDrawList(self, lineCount: int) -> SpinnerDrawList:
+        """
+        Create the draw list of a black spinner whose lines only differ by
+        their alpha.
+        """
+        lineTransforms = []
+        lineBrushes = []
+        for line in range(lineCount):
+            lineTransform = QTransform()
+            lineTransform.translate(20, 20)
+            lineTransform.rotate(360 * line / lineCount)
+            lineTransform.translate(6, 0)
+            lineTransforms.append(lineTransform)
+            color = QColor(Qt.black)
+            color.setAlphaF(1 - line / lineCount)
+            lineBrushes.append(QBrush(color))
+        return SpinnerDrawList(QRectF(0, -1, 12, 2), 0.0, lineTransforms,
+                               lineBrushes)
+
+    @skipIf(Image is None, 'Pillow is not available.')
+    def test_writeAnimation(self) -> None:
+        """
+        The writeAnimation method must write every frame of a spinner on a
+        transparent background as a looping animated image, even when the
+        frames only differ by their alpha.
+        """
+        lineCount = 10
+        self.spinner.getDrawList.return_value = \
+            self._createDrawList(lineCount)
+        with patch(f"{self.threadCls}.__init__"):
+            dut = SpinnerExporter(self.spinner)
+        frames = dut.renderFrames()
+        with TemporaryDirectory() as directory:
+            for fileName in ('test.gif', 'test.png'):
+                path = os.path.join(directory, fileName)
+                dut.writeAnimation(frames, path)
+                with Image.open(path) as image:
+                    self.assertEqual(image.n_frames, lineCount,
+                                     f"writeAnimation failed to write every "
+                                     f"frame of {fileName}.")
+                    self.assertEqual(image.info.get('loop'), 0,
+                                     f"writeAnimation failed to loop "
+                                     f"{fileName}.")
+
+    def test_exportFrames(self) -> None:
+        """
+        The exportFrames method must start a render only job.
+        """
+        with patch.object(self.dut, '_start') as mockedStart:
+            self.dut.exportFrames()
+            mockedStart.assert_called_once_with(None)
+
+    def test_exportPngSequence(self) -> None:
+        """
+        The exportPngSequence method must start a PNG sequence job.
+        """
+        with patch.object(self.dut, '_start') as mockedStart:
+            self.dut.exportPngSequence('out', 'spin')
+            mockedStart.assert_called_once_with((self.dut.writePngSequence,
+                                                 'out', 'spin'))
+
+    def test_exportAnimation(self) -> None:
+        """
+        The exportAnimation method must check the format before starting an
+        animated image job.
+        """
+        with patch.object(self.dut, '_getAnimationFormat') \
+                as mockedGetFormat, \
+                patch.object(self.dut, '_start') as mockedStart:
+            mockedGetFormat.side_effect = ValueError('test error')
+            with self.assertRaises(ValueError):
+                self.dut.exportAnimation('test.bmp')
+            mockedStart.assert_not_called()
+            mockedGetFormat.side_effect = None
+            self.dut.exportAnimation('test.gif')
+            mockedStart.assert_called_once_with((self.dut.writeAnimation,
+                                                 'test.gif'))
+
+    def test_run(self) -> None:
+        """
+        The run method must render the frames, run the job and report its
+        result.
+        """
+        testFrames = ['frame0', 'frame1']
+        mockedWrite = Mock()
+        self.dut._job = (mockedWrite, 'test target', 'test arg')
+        with patch.object(self.dut, 'renderFrames') as mockedRender, \
+                patch.object(SpinnerExporter, 'framesRendered') \
+                as mockedRendered, \
+                patch.object(SpinnerExporter, 'exportFinished') \
+                as mockedFinished, \
+                patch.object(SpinnerExporter, 'exportFailed') as mockedFailed:
+            mockedRender.return_value = testFrames
+            self.dut.run()
+            mockedRendered.emit.assert_called_once_with(testFrames)
+            mockedWrite.assert_called_once_with(testFrames, 'test target',
+                                                'test arg')
+            mockedFinished.emit.assert_called_once_with('test target')
+            mockedFailed.emit.assert_not_called()
+
+    def test_runRenderOnly(self) -> None:
+        """
+        The run method must only render the frames without job.
+        """
+        self.dut._job = None
+        with patch.object(self.dut, 'renderFrames'), \
+                patch.object(SpinnerExporter, 'framesRendered') \
+                as mockedRendered, \
+                patch.object(SpinnerExporter, 'exportFinished') \
+                as mockedFinished:
+            self.dut.run()
+            mockedRendered.emit.assert_called_once()
+            mockedFinished.emit.assert_not_called()
+
+    def test_runFailed(self) -> None:
+        """
+        The run method must report any writing error.
+        """
+        for error in (OSError('test error'), ValueError('test error'),
+                      KeyError('test error')):
+            mockedWrite = Mock()
+            mockedWrite.side_effect = error
+            self.dut._job = (mockedWrite, 'test target')
+            with patch.object(self.dut, 'renderFrames'), \
+                    patch.object(SpinnerExporter, 'framesRendered'), \
+                    patch.object(SpinnerExporter, 'exportFinished') \
+                    as mockedFinished, \
+                    patch.object(SpinnerExporter, 'exportFailed') \
+                    as mockedFailed:
+                self.dut.run()
+                mockedFailed.emit.assert_called_once_with(str(error))
+                mockedFinished.emit.assert_not_called()
+
+    def test_runRenderFailed(self) -> None:
+        """
+        The run method must report a rendering error.
+        """
+        self.dut._job = None
+        with patch.object(self.dut, 'renderFrames') as mockedRender, \
+                patch.object(SpinnerExporter, 'framesRendered') \
+                as mockedRendered, \
+                patch.object(SpinnerExporter, 'exportFailed') as mockedFailed:
+            mockedRender.side_effect = RuntimeError('test error')
+            self.dut.run()
+            mockedFailed.emit.assert_called_once_with('test error')
+            mockedRendered.emit.assert_not_called()
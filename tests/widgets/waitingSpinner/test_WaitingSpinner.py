@@ -1,8 +1,9 @@
-from unittest import TestCase
+from unittest import skipIf, TestCase
 from unittest.mock import call, Mock, patch
 
-from PySide2.QtCore import Qt
-from PySide2.QtGui import QColor
+from PySide2.QtCore import QEvent, QRect, QRectF, Qt
+from PySide2.QtGui import QColor, QImage, QPainter, QPainterPath, \
+    QRegion, QTransform
 
 import os
 import sys
@@ -10,6 +11,7 @@ import sys
 sys.path.append(os.path.abspath('./src'))
 
 from widgets.waitingSpinner import WaitingSpinner               # noqa: E402
+from widgets.waitingSpinner.waitingSpinner import np            # noqa: E402
 
 
 class TestWaitingSpinner(TestCase):
@@ -23,13 +25,23 @@ class TestWaitingSpinner(TestCase):
         self.widgetCls = 'widgets.waitingSpinner.waitingSpinner.QWidget'
         self.timerCls = 'widgets.waitingSpinner.waitingSpinner.QTimer'
         self.painterCls = 'widgets.waitingSpinner.waitingSpinner.QPainter'
-        self.colorCls = 'widgets.waitingSpinner.waitingSpinner.QColor'
-        self.rectCls = 'widgets.waitingSpinner.waitingSpinner.QRect'
+        self.pixmapCls = 'widgets.waitingSpinner.waitingSpinner.QPixmap'
+        self.numpyMod = 'widgets.waitingSpinner.waitingSpinner.np'
+        self.cacheCls = \
+            'widgets.waitingSpinner.waitingSpinner.SpinnerRenderCache'
+        self.clockCls = 'widgets.waitingSpinner.waitingSpinner.AnimationClock'
+        self.elapsedTimerCls = \
+            'widgets.waitingSpinner.waitingSpinner.QElapsedTimer'
+        self.appCls = 'widgets.waitingSpinner.waitingSpinner.QApplication'
         with patch(f"{self.widgetCls}.__init__"), \
                 patch.object(WaitingSpinner, '_initTimer'), \
                 patch.object(WaitingSpinner, '_initDisplayState'):
             self.dut = WaitingSpinner(None)
             self.dut._timer = Mock()
+            self.dut._elapsedTimer = Mock()
+            self.dut._repaintRateTimer = Mock()
+            self.dut._repaintRateTimer.elapsed.return_value = 0
+            self.dut._frameStatsTimer = Mock()
 
     def test_constructorDefault(self) -> None:
         """
@@ -74,6 +86,69 @@ class TestWaitingSpinner(TestCase):
             mockedInitTmr.assert_called_once()
             mockedInitDispState.assert_called_once_with(testModality)
 
+    def test_deferUpdate(self) -> None:
+        """
+        The _deferUpdate method must record the update and report it as
+        deferred only during a batch update.
+        """
+        self.dut._batchDepth = 0
+        result = self.dut._deferUpdate('size')
+        self.assertFalse(result, '_deferUpdate failed to run the update '
+                         'outside of a batch update.')
+        self.assertEqual(self.dut._pendingUpdates, set(), '_deferUpdate '
+                         'failed to run the update outside of a batch update.')
+        self.dut._batchDepth = 1
+        result = self.dut._deferUpdate('size')
+        self.assertTrue(result, '_deferUpdate failed to defer the update.')
+        self.assertEqual(self.dut._pendingUpdates, {'size'}, '_deferUpdate '
+                         'failed to record the deferred update.')
+
+    def test_flushUpdates(self) -> None:
+        """
+        The _flushUpdates method must run each deferred update once, in
+        dependency order.
+        """
+        self.dut._pendingUpdates = {'rendering', 'size', 'alphaTable'}
+        manager = Mock()
+        with patch.object(self.dut, '_updateAlphaTable') as mockedAlpha, \
+                patch.object(self.dut, '_updateSize') as mockedSize, \
+                patch.object(self.dut, '_updateTimer') as mockedTimer, \
+                patch.object(self.dut, '_updateRendering') as mockedRender:
+            manager.attach_mock(mockedAlpha, 'alphaTable')
+            manager.attach_mock(mockedSize, 'size')
+            manager.attach_mock(mockedRender, 'rendering')
+            self.dut._flushUpdates()
+            self.assertEqual(manager.mock_calls, [call.alphaTable(),
+                                                  call.size(),
+                                                  call.rendering()],
+                             '_flushUpdates failed to run the deferred '
+                             'updates in order.')
+            mockedTimer.assert_not_called()
+        self.assertEqual(self.dut._pendingUpdates, set(), '_flushUpdates '
+                         'failed to clear the deferred updates.')
+
+    def test_updatesDeferred(self) -> None:
+        """
+        The size, timer, alpha table and rendering updates must be deferred
+        during a batch update.
+        """
+        self.dut._batchDepth = 1
+        with patch.object(self.dut, 'setFixedSize') as mockedSetFixedSize, \
+                patch.object(self.dut, '_calcAlphaTable') as mockedCalcTable, \
+                patch.object(self.dut, '_updateLineGeometry') \
+                as mockedUpdateGeometry:
+            self.dut._updateSize()
+            self.dut._updateTimer()
+            self.dut._updateAlphaTable()
+            self.dut._updateRendering()
+            mockedSetFixedSize.assert_not_called()
+            self.dut._timer.setInterval.assert_not_called()
+            mockedCalcTable.assert_not_called()
+            mockedUpdateGeometry.assert_not_called()
+        self.assertEqual(self.dut._pendingUpdates,
+                         {'size', 'timer', 'alphaTable', 'rendering'},
+                         'The updates failed to be deferred.')
+
     def test_updateTimer(self) -> None:
         """
         The _updateTimer method must update the internal timer interval.
@@ -83,18 +158,76 @@ class TestWaitingSpinner(TestCase):
         self.dut._updateTimer()
         self.dut._timer.setInterval.assert_called_once_with(timeout)
 
+    def test_updateTimerTimeBased(self) -> None:
+        """
+        The _updateTimer method must cap the internal timer rate to the
+        maximum FPS in time based mode.
+        """
+        self.dut._isTimeBasedEnabled = True
+        self.dut._maxFps = 50.0
+        testLineCounts = (2, 200)
+        expectedTimeouts = (int(1000 / (2 * self.dut._revsPerSecond)), 20)
+        for idx, lineCount in enumerate(testLineCounts):
+            self.dut._timer.reset_mock()
+            self.dut._lineCount = lineCount
+            self.dut._updateTimer()
+            self.dut._timer.setInterval \
+                .assert_called_once_with(expectedTimeouts[idx])
+
+    def test_updateTimerSharedClock(self) -> None:
+        """
+        The _updateTimer method must update the shared animation clock
+        interval when the spinner is advanced by it.
+        """
+        testFlags = ((False, False), (False, True), (True, False),
+                     (True, True))
+        for isSharedClockEnabled, isSpinning in testFlags:
+            self.dut._isSharedClockEnabled = isSharedClockEnabled
+            self.dut._isSpinning = isSpinning
+            with patch(self.clockCls) as mockedClockCls:
+                self.dut._updateTimer()
+                mockedClock = mockedClockCls.instance.return_value
+                if isSharedClockEnabled and isSpinning:
+                    mockedClock.updateInterval.assert_called_once()
+                else:
+                    mockedClock.updateInterval.assert_not_called()
+
+    def test_getTickInterval(self) -> None:
+        """
+        The _getTickInterval method must return the internal timer interval
+        with a minimum of 1 ms.
+        """
+        testIntervals = (0, 1, 25)
+        expectedIntervals = (1, 1, 25)
+        for idx, testInterval in enumerate(testIntervals):
+            self.dut._timer.interval.return_value = testInterval
+            result = self.dut._getTickInterval()
+            self.assertEqual(result, expectedIntervals[idx],
+                             '_getTickInterval failed to return the frame '
+                             'interval.')
+
     def test_initTimer(self) -> None:
         """
-        The _initTimer method must create and update the internal timer.
+        The _initTimer method must create and update the internal timer and
+        create the frame statistics report timer.
         """
         testTimer = Mock()
+        testStatsTimer = Mock()
         with patch(self.timerCls) as mockedTmrClsConst, \
                 patch.object(self.dut, '_updateTimer') as mockedUpdateTmr:
-            mockedTmrClsConst.return_value = testTimer
+            mockedTmrClsConst.side_effect = (testTimer, testStatsTimer)
             self.dut._initTimer()
-            mockedTmrClsConst.assert_called_once()
+            self.assertEqual(mockedTmrClsConst.call_count, 2, '_initTimer '
+                             'failed to create the timers.')
             self.assertEqual(self.dut._timer, testTimer, '_initTimer failed '
                              'to create the internal timer.')
+            testTimer.timeout.connect.assert_called_once_with(self.dut._rotate)
+            self.assertEqual(self.dut._frameStatsTimer, testStatsTimer,
+                             '_initTimer failed to create the frame '
+                             'statistics timer.')
+            testStatsTimer.setInterval.assert_called_once_with(1000)
+            testStatsTimer.timeout.connect \
+                .assert_called_once_with(self.dut._reportFrameStats)
             mockedUpdateTmr.assert_called_once()
 
     def test_updateSize(self) -> None:
@@ -106,6 +239,217 @@ class TestWaitingSpinner(TestCase):
             self.dut._updateSize()
             mockedSetFixedSize.assert_called_once_with(size, size)
 
+    def test_updateFrameAtlasDisabled(self) -> None:
+        """
+        The _updateFrameAtlas method must release the frame atlas when the
+        feature is disabled.
+        """
+        self.dut._isFrameAtlasEnabled = False
+        self.dut._frameAtlas = Mock()
+        with patch.object(self.dut, '_cancelFrameAtlasBuild') \
+                as mockedCancel, \
+                patch.object(self.dut, '_startFrameAtlasBuild') as mockedStart:
+            self.dut._updateFrameAtlas()
+            mockedCancel.assert_called_once()
+            mockedStart.assert_not_called()
+            self.assertIsNone(self.dut._frameAtlas, '_updateFrameAtlas '
+                              'failed to release the frame atlas.')
+
+    def test_updateFrameAtlasCacheHit(self) -> None:
+        """
+        The _updateFrameAtlas method must use the frame atlas from the shared
+        render cache when the style was already rendered.
+        """
+        self.dut._isFrameAtlasEnabled = True
+        testKey = ('test', 'key')
+        mockedAtlas = Mock()
+        with patch(self.cacheCls) as mockedCacheCls, \
+                patch.object(self.dut, '_getStyleKey') as mockedGetKey, \
+                patch.object(self.dut, '_cancelFrameAtlasBuild'), \
+                patch.object(self.dut, '_startFrameAtlasBuild') \
+                as mockedStart, \
+                patch.object(self.dut, 'devicePixelRatioF') as mockedGetDpr:
+            mockedGetDpr.return_value = 2.0
+            mockedGetKey.return_value = testKey
+            mockedCache = mockedCacheCls.instance.return_value
+            mockedCache.get.return_value = mockedAtlas
+            self.dut._updateFrameAtlas()
+            mockedCache.get.assert_called_once_with(testKey)
+            mockedStart.assert_not_called()
+            self.assertEqual(self.dut._frameAtlas, mockedAtlas,
+                             '_updateFrameAtlas failed to use the cached '
+                             'frame atlas.')
+            self.assertEqual(self.dut._devicePixelRatio, 2.0,
+                             '_updateFrameAtlas failed to update the device '
+                             'pixel ratio.')
+
+    def test_updateFrameAtlasCacheMiss(self) -> None:
+        """
+        The _updateFrameAtlas method must cancel the older build and start
+        building the frame atlas, drawing directly meanwhile, when the style
+        was never rendered.
+        """
+        self.dut._isFrameAtlasEnabled = True
+        self.dut._frameAtlas = Mock()
+        testKey = ('test', 'key')
+        with patch(self.cacheCls) as mockedCacheCls, \
+                patch.object(self.dut, '_getStyleKey') as mockedGetKey, \
+                patch.object(self.dut, '_cancelFrameAtlasBuild') \
+                as mockedCancel, \
+                patch.object(self.dut, '_startFrameAtlasBuild') \
+                as mockedStart, \
+                patch.object(self.dut, 'devicePixelRatioF'):
+            mockedGetKey.return_value = testKey
+            mockedCache = mockedCacheCls.instance.return_value
+            mockedCache.get.return_value = None
+            self.dut._updateFrameAtlas()
+            mockedCancel.assert_called_once()
+            mockedStart.assert_called_once_with(testKey)
+            self.assertIsNone(self.dut._frameAtlas, '_updateFrameAtlas '
+                              'failed to draw directly during the build.')
+
+    def test_startFrameAtlasBuild(self) -> None:
+        """
+        The _startFrameAtlasBuild method must start a frame atlas build of
+        the current draw list.
+        """
+        builderCls = 'widgets.waitingSpinner.waitingSpinner.FrameAtlasBuilder'
+        testKey = ('test', 'key')
+        frameSize = int((self.dut._innerRadius + self.dut._lineLength) * 2)
+        with patch(builderCls) as mockedBuilderCls, \
+                patch.object(self.dut, 'getDrawList') as mockedGetDrawList:
+            self.dut._startFrameAtlasBuild(testKey)
+            mockedBuilderCls.assert_called_once_with(
+                testKey, frameSize, self.dut._devicePixelRatio,
+                mockedGetDrawList.return_value)
+            mockedBuilder = mockedBuilderCls.return_value
+            mockedBuilder.built.connect \
+                .assert_called_once_with(self.dut._onFrameAtlasBuilt)
+            mockedBuilder.start.assert_called_once()
+            self.assertEqual(self.dut._atlasBuilder, mockedBuilder,
+                             '_startFrameAtlasBuild failed to keep the '
+                             'builder.')
+
+    def test_cancelFrameAtlasBuild(self) -> None:
+        """
+        The _cancelFrameAtlasBuild method must cancel and release the pending
+        build.
+        """
+        self.dut._atlasBuilder = None
+        self.dut._cancelFrameAtlasBuild()
+        mockedBuilder = Mock()
+        self.dut._atlasBuilder = mockedBuilder
+        self.dut._cancelFrameAtlasBuild()
+        mockedBuilder.cancel.assert_called_once()
+        self.assertIsNone(self.dut._atlasBuilder, '_cancelFrameAtlasBuild '
+                          'failed to release the builder.')
+
+    def test_onFrameAtlasBuilt(self) -> None:
+        """
+        The _onFrameAtlasBuilt method must install the built frame atlas and
+        insert it in the shared render cache.
+        """
+        self.dut._isFrameAtlasEnabled = True
+        self.dut._atlasBuilder = Mock()
+        testKey = self.dut._getStyleKey()
+        mockedImage = Mock()
+        mockedImage.isNull.return_value = False
+        with patch(self.cacheCls) as mockedCacheCls, \
+                patch(self.pixmapCls) as mockedPixmapCls, \
+                patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._onFrameAtlasBuilt(testKey, mockedImage)
+            mockedPixmapCls.fromImage.assert_called_once_with(mockedImage)
+            mockedAtlas = mockedPixmapCls.fromImage.return_value
+            mockedCacheCls.instance.return_value.insert \
+                .assert_called_once_with(testKey, mockedAtlas)
+            mockedUpdate.assert_called_once()
+        self.assertEqual(self.dut._frameAtlas, mockedAtlas,
+                         '_onFrameAtlasBuilt failed to install the frame '
+                         'atlas.')
+        self.assertIsNone(self.dut._atlasBuilder, '_onFrameAtlasBuilt failed '
+                          'to release the builder.')
+
+    def test_onFrameAtlasBuiltFailed(self) -> None:
+        """
+        The _onFrameAtlasBuilt method must release the builder of a failed
+        build and keep drawing the lines directly.
+        """
+        self.dut._isFrameAtlasEnabled = True
+        self.dut._atlasBuilder = Mock()
+        self.dut._frameAtlas = None
+        with patch(self.cacheCls) as mockedCacheCls, \
+                patch(self.pixmapCls) as mockedPixmapCls:
+            self.dut._onFrameAtlasBuilt(self.dut._getStyleKey(), QImage())
+            mockedPixmapCls.fromImage.assert_not_called()
+            mockedCacheCls.instance.return_value.insert.assert_not_called()
+        self.assertIsNone(self.dut._frameAtlas, '_onFrameAtlasBuilt failed '
+                          'to keep drawing the lines directly.')
+        self.assertIsNone(self.dut._atlasBuilder, '_onFrameAtlasBuilt failed '
+                          'to release the builder.')
+
+    def test_onFrameAtlasBuiltStale(self) -> None:
+        """
+        The _onFrameAtlasBuilt method must drop a frame atlas built for an
+        older style or when the frame atlas was disabled.
+        """
+        testCases = ((True, ('stale', 'key')),
+                     (False, self.dut._getStyleKey()))
+        for isEnabled, styleKey in testCases:
+            self.dut._isFrameAtlasEnabled = isEnabled
+            self.dut._frameAtlas = None
+            with patch(self.cacheCls) as mockedCacheCls, \
+                    patch(self.pixmapCls) as mockedPixmapCls:
+                self.dut._onFrameAtlasBuilt(styleKey, Mock())
+                mockedPixmapCls.fromImage.assert_not_called()
+                mockedCacheCls.instance.return_value.insert \
+                    .assert_not_called()
+            self.assertIsNone(self.dut._frameAtlas, '_onFrameAtlasBuilt '
+                              'failed to drop the stale frame atlas.')
+
+    def test_getStyleKey(self) -> None:
+        """
+        The _getStyleKey method must return a key that changes with every
+        style setting of the spinner.
+        """
+        styleKey = self.dut._getStyleKey()
+        self.assertEqual(styleKey, self.dut._getStyleKey(), '_getStyleKey '
+                         'failed to return a stable key.')
+        settings = (('_color', QColor(Qt.red)), ('_roundness', 50.0),
+                    ('_lineCount', 15), ('_lineLength', 15),
+                    ('_lineWidth', 15), ('_innerRadius', 15),
+                    ('_trailFadePct', 15.0), ('_minTrailOpacity', 15.0),
+                    ('_devicePixelRatio', 2.0))
+        for attribute, value in settings:
+            oldValue = getattr(self.dut, attribute)
+            setattr(self.dut, attribute, value)
+            self.assertNotEqual(self.dut._getStyleKey(), styleKey,
+                                '_getStyleKey failed to return a key '
+                                'matching the style.')
+            setattr(self.dut, attribute, oldValue)
+
+    def test_updateDevicePixelRatio(self) -> None:
+        """
+        The _updateDevicePixelRatio method must update the frame atlas only
+        when it is enabled and the device pixel ratio changed.
+        """
+        self.dut._devicePixelRatio = 1.0
+        testCases = ((False, 2.0, False), (True, 1.0, False),
+                     (True, 2.0, True))
+        for isEnabled, devicePixelRatio, isUpdated in testCases:
+            self.dut._isFrameAtlasEnabled = isEnabled
+            with patch.object(self.dut, 'devicePixelRatioF') as mockedGetDpr, \
+                    patch.object(self.dut, '_updateFrameAtlas') \
+                    as mockedUpdateAtlas, \
+                    patch.object(self.dut, 'update') as mockedUpdate:
+                mockedGetDpr.return_value = devicePixelRatio
+                self.dut._updateDevicePixelRatio()
+                self.assertEqual(mockedUpdateAtlas.called, isUpdated,
+                                 '_updateDevicePixelRatio failed to update '
+                                 'the frame atlas on a ratio change.')
+                self.assertEqual(mockedUpdate.called, isUpdated,
+                                 '_updateDevicePixelRatio failed to repaint '
+                                 'on a ratio change.')
+
     def test_initDisplayState(self) -> None:
         """
         The _initDisplayState method must update the size, set the modality,
@@ -122,21 +466,457 @@ class TestWaitingSpinner(TestCase):
             mockedSetAtt.assert_called_once_with(Qt.WA_TranslucentBackground)
             mockedHide.assert_called_once()
 
+    def test_initDisplayStateAppState(self) -> None:
+        """
+        The _initDisplayState method must connect the application state
+        changed signal when the application exists.
+        """
+        with patch.object(self.dut, '_updateSize'), \
+                patch.object(self.dut, 'setWindowModality'), \
+                patch.object(self.dut, 'setAttribute'), \
+                patch.object(self.dut, 'hide'), \
+                patch(self.appCls) as mockedAppCls:
+            mockedApp = mockedAppCls.instance.return_value
+            self.dut._initDisplayState(Qt.NonModal)
+            mockedApp.applicationStateChanged.connect \
+                .assert_called_once_with(self.dut._onApplicationStateChanged)
+
     def test_rotate(self) -> None:
         """
         The _rotate method must increment the counter, reset when a full
-        circle have been done and update the widget.
+        circle have been done and repaint the frame.
         """
         for expectedCount in range(1, self.dut._lineCount + 1):
             if expectedCount >= self.dut._lineCount:
                 expectedCount = 0
-            with patch.object(self.dut, 'update') as mockedUpdate:
+            with patch.object(self.dut, '_repaintFrame') as mockedUpdate:
                 self.dut._rotate()
                 self.assertEqual(self.dut._counter, expectedCount,
                                  '_rotate failed to increment and reset the '
                                  'counter.')
                 mockedUpdate.assert_called_once()
 
+    def test_rotateFrameStats(self) -> None:
+        """
+        The _rotate method must record the timer tick and the advanced frame
+        in the frame statistics when enabled.
+        """
+        self.dut._frameStats = Mock()
+        self.dut._timer.interval.return_value = 31
+        with patch.object(self.dut, '_repaintFrame'):
+            self.dut._rotate()
+        self.dut._frameStats.recordTimerTick.assert_called_once_with(31)
+        self.dut._frameStats.recordFrames.assert_called_once_with(1)
+
+    def test_getPhase(self) -> None:
+        """
+        The _getPhase method must return the fraction of revolution done from
+        the phase origin and the elapsed time.
+        """
+        self.dut._revsPerSecond = 2.0
+        testOrigins = (0.0, 0.5, 0.75)
+        testElapsed = (100, 250, 1000)
+        expectedPhases = (0.2, 0.0, 0.75)
+        for idx, origin in enumerate(testOrigins):
+            self.dut._phaseOrigin = origin
+            self.dut._elapsedTimer.elapsed.return_value = testElapsed[idx]
+            result = self.dut._getPhase()
+            self.assertAlmostEqual(result, expectedPhases[idx], places=7,
+                                   msg='_getPhase failed to return the '
+                                   'spinner phase.')
+
+    def test_rebasePhase(self) -> None:
+        """
+        The _rebasePhase method must set the phase origin and restart the
+        elapsed time.
+        """
+        self.dut._rebasePhase(0.25)
+        self.assertEqual(self.dut._phaseOrigin, 0.25, '_rebasePhase failed '
+                         'to set the phase origin.')
+        self.dut._elapsedTimer.start.assert_called_once()
+
+    def test_calcActiveIdx(self) -> None:
+        """
+        The _calcActiveIdx method must return the active line index matching
+        the spinner phase.
+        """
+        self.dut._lineCount = 10
+        testPhases = (0.0, 0.05, 0.15, 0.99, 0.9999999999999999)
+        expectedIndexes = (0, 0, 1, 9, 9)
+        with patch.object(self.dut, '_getPhase') as mockedGetPhase:
+            for idx, phase in enumerate(testPhases):
+                mockedGetPhase.return_value = phase
+                result = self.dut._calcActiveIdx()
+                self.assertEqual(result, expectedIndexes[idx],
+                                 '_calcActiveIdx failed to return the '
+                                 'active line index.')
+
+    def test_rotateTimeBased(self) -> None:
+        """
+        The _rotate method must derive the counter from the elapsed time and
+        repaint the frame only when it changed in time based mode.
+        """
+        self.dut._isTimeBasedEnabled = True
+        self.dut._counter = 3
+        testIndexes = (3, 5)
+        for activeIdx in testIndexes:
+            with patch.object(self.dut, '_calcActiveIdx') as mockedCalcIdx, \
+                    patch.object(self.dut, '_repaintFrame') as mockedUpdate:
+                mockedCalcIdx.return_value = activeIdx
+                isChanged = activeIdx != self.dut._counter
+                self.dut._rotate()
+                self.assertEqual(self.dut._counter, activeIdx, '_rotate '
+                                 'failed to derive the counter from the '
+                                 'elapsed time.')
+                if isChanged:
+                    mockedUpdate.assert_called_once()
+                else:
+                    mockedUpdate.assert_not_called()
+
+    def test_rotateTimeBasedFrameStats(self) -> None:
+        """
+        The _rotate method must record the frames skipped by the counter in
+        time based mode.
+        """
+        self.dut._isTimeBasedEnabled = True
+        self.dut._frameStats = Mock()
+        self.dut._lineCount = 10
+        self.dut._counter = 8
+        with patch.object(self.dut, '_calcActiveIdx') as mockedCalcIdx, \
+                patch.object(self.dut, '_repaintFrame'):
+            mockedCalcIdx.return_value = 1
+            self.dut._rotate()
+        self.dut._frameStats.recordFrames.assert_called_once_with(3)
+
+    def test_advanceTimeBased(self) -> None:
+        """
+        The _advance method must derive the counter from the elapsed time in
+        time based mode.
+        """
+        self.dut._isTimeBasedEnabled = True
+        self.dut._counter = 3
+        testIndexes = (3, 5)
+        expectedResults = (False, True)
+        for idx, activeIdx in enumerate(testIndexes):
+            with patch.object(self.dut, '_calcActiveIdx') as mockedCalcIdx:
+                mockedCalcIdx.return_value = activeIdx
+                result = self.dut._advance(20)
+                self.assertEqual(result, expectedResults[idx], '_advance '
+                                 'failed to report the frame change.')
+                self.assertEqual(self.dut._counter, activeIdx, '_advance '
+                                 'failed to derive the counter from the '
+                                 'elapsed time.')
+
+    def test_advance(self) -> None:
+        """
+        The _advance method must advance the counter by the number of frame
+        intervals elapsed and keep the remaining time for the next advance.
+        """
+        self.dut._lineCount = 10
+        self.dut._counter = 8
+        self.dut._tickElapsed = 0
+        testElapsed = (10, 15, 50, 0)
+        expectedResults = (False, True, True, False)
+        expectedCounters = (8, 9, 1, 1)
+        expectedRemainders = (10, 5, 15, 15)
+        with patch.object(self.dut, '_getTickInterval') as mockedInterval:
+            mockedInterval.return_value = 20
+            for idx, elapsed in enumerate(testElapsed):
+                result = self.dut._advance(elapsed)
+                self.assertEqual(result, expectedResults[idx], '_advance '
+                                 'failed to report the frame change.')
+                self.assertEqual(self.dut._counter, expectedCounters[idx],
+                                 '_advance failed to advance the counter.')
+                self.assertEqual(self.dut._tickElapsed,
+                                 expectedRemainders[idx], '_advance failed '
+                                 'to keep the remaining time.')
+
+    def test_advanceFrameStats(self) -> None:
+        """
+        The _advance method must record the clock tick and the advanced
+        frames in the frame statistics when enabled.
+        """
+        self.dut._frameStats = Mock()
+        self.dut._lineCount = 10
+        self.dut._counter = 0
+        self.dut._tickElapsed = 0
+        with patch.object(self.dut, '_getTickInterval') as mockedInterval, \
+                patch(self.clockCls) as mockedClockCls:
+            mockedInterval.return_value = 20
+            mockedClockCls.instance.return_value.getInterval.return_value = 20
+            self.dut._advance(10)
+            self.dut._frameStats.recordFrames.assert_not_called()
+            self.dut._advance(50)
+        self.dut._frameStats.recordTick \
+            .assert_has_calls([call(10, 20), call(50, 20)])
+        self.dut._frameStats.recordFrames.assert_called_once_with(3)
+
+    def test_recordFrames(self) -> None:
+        """
+        The _recordFrames method must record the advanced frames only when
+        the frame statistics are enabled.
+        """
+        self.dut._frameStats = None
+        self.dut._recordFrames(2)
+        self.dut._frameStats = Mock()
+        self.dut._recordFrames(2)
+        self.dut._frameStats.recordFrames.assert_called_once_with(2)
+
+    def test_reportFrameStats(self) -> None:
+        """
+        The _reportFrameStats method must emit the frame statistics and start
+        a new window.
+        """
+        testStats = {'paintedFrames': 10}
+        self.dut._frameStats = Mock()
+        self.dut._frameStats.getStats.return_value = testStats
+        with patch.object(WaitingSpinner, 'frameStatsUpdated') \
+                as mockedSignal:
+            self.dut._reportFrameStats()
+            mockedSignal.emit.assert_called_once_with(testStats)
+        self.dut._frameStats.reset.assert_called_once()
+
+    def test_startTimerFrameStats(self) -> None:
+        """
+        The _startTimer method must restart the tick measurement of the
+        frame statistics and their report, only when they are enabled.
+        """
+        self.dut._startTimer()
+        self.dut._frameStatsTimer.start.assert_not_called()
+        self.dut._frameStats = Mock()
+        self.dut._startTimer()
+        self.dut._frameStats.restartTicks.assert_called_once()
+        self.dut._frameStatsTimer.start.assert_called_once()
+
+    def test_startTimer(self) -> None:
+        """
+        The _startTimer method must start the internal timer or register in
+        the shared animation clock.
+        """
+        for isSharedClockEnabled in (False, True):
+            self.dut._timer.reset_mock()
+            self.dut._isSharedClockEnabled = isSharedClockEnabled
+            self.dut._tickElapsed = 10
+            with patch(self.clockCls) as mockedClockCls:
+                self.dut._startTimer()
+                mockedClock = mockedClockCls.instance.return_value
+                if isSharedClockEnabled:
+                    mockedClock.register.assert_called_once_with(self.dut)
+                    self.dut._timer.start.assert_not_called()
+                    self.assertEqual(self.dut._tickElapsed, 0, '_startTimer '
+                                     'failed to reset the elapsed time.')
+                else:
+                    mockedClock.register.assert_not_called()
+                    self.dut._timer.start.assert_called_once()
+
+    def test_stopTimer(self) -> None:
+        """
+        The _stopTimer method must stop the internal timer or unregister from
+        the shared animation clock.
+        """
+        for isSharedClockEnabled in (False, True):
+            self.dut._timer.reset_mock()
+            self.dut._isSharedClockEnabled = isSharedClockEnabled
+            with patch(self.clockCls) as mockedClockCls:
+                self.dut._stopTimer()
+                mockedClock = mockedClockCls.instance.return_value
+                if isSharedClockEnabled:
+                    mockedClock.unregister.assert_called_once_with(self.dut)
+                    self.dut._timer.stop.assert_not_called()
+                else:
+                    mockedClock.unregister.assert_not_called()
+                    self.dut._timer.stop.assert_called_once()
+        self.dut._frameStatsTimer.stop.assert_called()
+
+    def test_suspend(self) -> None:
+        """
+        The _suspend method must stop the animation of a spinning spinner
+        that is not already suspended.
+        """
+        testFlags = ((False, False), (True, False), (True, True))
+        for isSpinning, isSuspended in testFlags:
+            self.dut._isSpinning = isSpinning
+            self.dut._isSuspended = isSuspended
+            with patch.object(self.dut, '_stopTimer') as mockedStopTmr:
+                self.dut._suspend()
+                if isSpinning and not isSuspended:
+                    mockedStopTmr.assert_called_once()
+                    self.assertTrue(self.dut._isSuspended, '_suspend failed '
+                                    'to set the suspended flag.')
+                else:
+                    mockedStopTmr.assert_not_called()
+                    self.assertEqual(self.dut._isSuspended, isSuspended,
+                                     '_suspend failed to keep the '
+                                     'suspended flag.')
+
+    def test_resume(self) -> None:
+        """
+        The _resume method must restart the animation of a suspended spinner
+        from the frame it was suspended at.
+        """
+        self.dut._lineCount = 10
+        self.dut._counter = 5
+        for isSuspended in (False, True):
+            self.dut._isSuspended = isSuspended
+            with patch.object(self.dut, '_startTimer') as mockedStartTmr, \
+                    patch.object(self.dut, '_rebasePhase') as mockedRebase:
+                self.dut._resume()
+                self.assertFalse(self.dut._isSuspended, '_resume failed to '
+                                 'clear the suspended flag.')
+                if isSuspended:
+                    mockedRebase.assert_called_once_with(0.5)
+                    mockedStartTmr.assert_called_once()
+                else:
+                    mockedRebase.assert_not_called()
+                    mockedStartTmr.assert_not_called()
+            self.assertEqual(self.dut._counter, 5, '_resume failed to keep '
+                             'the spinner frame.')
+
+    def test_updateSuspension(self) -> None:
+        """
+        The _updateSuspension method must suspend the animation when the
+        spinner is not visible, its window is minimized or the application
+        is not active and resume it otherwise, unless the feature is
+        disabled.
+        """
+        testStates = ((True, True, False, Qt.ApplicationActive, False),
+                      (True, False, False, Qt.ApplicationActive, True),
+                      (True, True, True, Qt.ApplicationActive, True),
+                      (True, True, False, Qt.ApplicationInactive, True),
+                      (True, True, False, Qt.ApplicationHidden, True),
+                      (False, False, False, Qt.ApplicationHidden, False))
+        for isEnabled, isVisible, isMinimized, appState, isSuspending \
+                in testStates:
+            self.dut._isAutoSuspendEnabled = isEnabled
+            with patch(self.appCls) as mockedAppCls, \
+                    patch.object(self.dut, 'isVisible') as mockedIsVisible, \
+                    patch.object(self.dut, 'window') as mockedWindow, \
+                    patch.object(self.dut, '_suspend') as mockedSuspend, \
+                    patch.object(self.dut, '_resume') as mockedResume:
+                mockedAppCls.applicationState.return_value = appState
+                mockedIsVisible.return_value = isVisible
+                mockedWindow.return_value.isMinimized.return_value = \
+                    isMinimized
+                self.dut._updateSuspension()
+                if isSuspending:
+                    mockedSuspend.assert_called_once()
+                    mockedResume.assert_not_called()
+                else:
+                    mockedSuspend.assert_not_called()
+                    mockedResume.assert_called_once()
+
+    def test_onApplicationStateChanged(self) -> None:
+        """
+        The _onApplicationStateChanged method must update the suspension.
+        """
+        with patch.object(self.dut, '_updateSuspension') as mockedUpdate:
+            self.dut._onApplicationStateChanged(Qt.ApplicationInactive)
+            mockedUpdate.assert_called_once()
+
+    def test_getFrameRegion(self) -> None:
+        """
+        The _getFrameRegion method must build the region of the first frame
+        changed lines rotated to the frame once and reuse it afterward.
+        """
+        self.dut._lineCount = 4
+        self.dut._changedLines = [0, 2, 3]
+        self.dut._lineRects = [QRect(0, 0, 2, 2), QRect(10, 0, 2, 2),
+                               QRect(0, 10, 2, 2), QRect(10, 10, 2, 2)]
+        self.dut._frameRegions = [None] * 4
+        expectedRegion = QRegion()
+        for rect in self.dut._lineRects[0:2] + self.dut._lineRects[3:]:
+            expectedRegion = expectedRegion.united(rect)
+        result = self.dut._getFrameRegion(1)
+        self.assertEqual(result, expectedRegion, '_getFrameRegion failed to '
+                         'return the changed lines region.')
+        self.assertIs(self.dut._frameRegions[1], result, '_getFrameRegion '
+                      'failed to store the frame region.')
+        self.dut._lineRects = None
+        self.assertIs(self.dut._getFrameRegion(1), result, '_getFrameRegion '
+                      'failed to reuse the frame region.')
+
+    def test_repaintFrame(self) -> None:
+        """
+        The _repaintFrame method must request the repaint of the regions of
+        every frame stepped since the last requested frame only.
+        """
+        self.dut._lineCount = 4
+        testRegions = [QRegion(QRect(idx * 10, 0, 2, 2)) for idx in range(4)]
+        testFrames = ((0, 1), (3, 1), (1, 1))
+        expectedRegions = (testRegions[1],
+                           testRegions[0].united(testRegions[1]), QRegion())
+        for (lastFrame, counter), expectedRegion in zip(testFrames,
+                                                        expectedRegions):
+            self.dut._lastFrame = lastFrame
+            self.dut._counter = counter
+            with patch.object(self.dut, 'update') as mockedUpdate, \
+                    patch.object(self.dut, '_getFrameRegion') \
+                    as mockedGetRegion:
+                mockedGetRegion.side_effect = lambda frame: testRegions[frame]
+                self.dut._repaintFrame()
+                mockedUpdate.assert_called_once_with(expectedRegion)
+            self.assertEqual(self.dut._lastFrame, counter, '_repaintFrame '
+                             'failed to save the last requested frame.')
+
+    def test_repaintFrameRegions(self) -> None:
+        """
+        The frame regions must match the lines changing alpha between the
+        frames, compared line by line.
+        """
+        lineCount = 24
+        self.dut._lineCount = lineCount
+        self.dut._alphaTable = self.dut._calcAlphaTable(lineCount, 60.0,
+                                                        3.14)
+        self.dut._updateLineGeometry()
+        for frame in range(lineCount):
+            lastAlphas = self.dut._alphaTable[frame - 1]
+            alphas = self.dut._alphaTable[frame]
+            expectedRegion = QRegion()
+            for line, lineRect in enumerate(self.dut._lineRects):
+                if lastAlphas[line] != alphas[line]:
+                    expectedRegion = expectedRegion.united(lineRect)
+            self.assertEqual(self.dut._getFrameRegion(frame), expectedRegion,
+                             'The frame region does not match the changed '
+                             'lines.')
+
+    def test_repaintFrameOutOfRange(self) -> None:
+        """
+        The _repaintFrame method must request the repaint of the whole
+        spinner when the last requested frame is out of range.
+        """
+        self.dut._lineCount = 4
+        self.dut._lastFrame = 10
+        self.dut._counter = 2
+        with patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._repaintFrame()
+            mockedUpdate.assert_called_once_with()
+        self.assertEqual(self.dut._lastFrame, 2, '_repaintFrame failed to '
+                         'save the last requested frame.')
+
+    def test_countRepaintedPixels(self) -> None:
+        """
+        The _countRepaintedPixels method must count the repainted pixels and
+        update the repainted pixel rate every second.
+        """
+        region = QRegion(QRect(0, 0, 10, 10)).united(QRect(20, 20, 5, 4))
+        self.dut._repaintedPixelCount = 0
+        self.dut._repaintedPixelRate = 0.0
+        self.dut._repaintRateTimer.elapsed.return_value = 500
+        self.dut._countRepaintedPixels(region)
+        self.assertEqual(self.dut._repaintedPixelCount, 120,
+                         '_countRepaintedPixels failed to count the '
+                         'repainted pixels.')
+        self.dut._repaintRateTimer.restart.assert_not_called()
+        self.dut._repaintRateTimer.elapsed.return_value = 2000
+        self.dut._countRepaintedPixels(region)
+        self.assertEqual(self.dut._repaintedPixelRate, 120.0,
+                         '_countRepaintedPixels failed to update the '
+                         'repainted pixel rate.')
+        self.assertEqual(self.dut._repaintedPixelCount, 0,
+                         '_countRepaintedPixels failed to reset the '
+                         'repainted pixel count.')
+        self.dut._repaintRateTimer.restart.assert_called_once()
+
     def test_centerInParent(self) -> None:
         """
         The _centerInParent method must center the spinner if the feature
@@ -219,83 +999,352 @@ class TestWaitingSpinner(TestCase):
                                    msg='_calcLineAlpha failed to calculate '
                                    'the current line alpha.')
 
-    def test_drawLineSavePainter(self) -> None:
+    def _calcExpectedAlphaTable(self, lineCount: int, fadePct: float,
+                                minOpacity: float) -> list:
         """
-        The _drawLine method must save, transform, set the brush
-        and restore the painter.
+        Calculate the expected alpha table line by line.
         """
-        mockedPainter = Mock()
-        mockedColor = Mock()
-        expectedAngles = (0, 18, 36, 54, 72)
-        expectedTransCalls = \
-            (call(self.dut._innerRadius + self.dut._lineLength,
-                  self.dut._innerRadius + self.dut._lineLength),
-             call(self.dut._innerRadius, 0))
-        for line, angle in enumerate(expectedAngles):
-            mockedPainter.reset_mock()
-            with patch(self.colorCls) as mockedColorConst, \
-                    patch.object(self.dut, '_calcLineTrailPos'), \
-                    patch.object(self.dut, '_calcLineAlpha'):
-                mockedColorConst.return_value = mockedColor
-                self.dut._drawLine(mockedPainter, line)
-                mockedPainter.save.assert_called_once()
-                mockedPainter.translate.assert_has_calls(expectedTransCalls)
-                mockedPainter.rotate.assert_called_once_with(angle)
-                mockedPainter.setBrush.assert_called_once_with(mockedColor)
-                mockedPainter.restore.assert_called_once()
-
-    def test_drawLineColor(self) -> None:
-        """
-        The _drawLine method must create the line color based on its position
-        in the trail the fade percentage and the minimal opacity.
+        return [[self.dut._calcLineAlpha(self.dut
+                                         ._calcLineTrailPos(line, frame,
+                                                            lineCount),
+                                         lineCount, fadePct, minOpacity)
+                 for line in range(lineCount)]
+                for frame in range(lineCount)]
+
+    @skipIf(np is None, 'NumPy is not available.')
+    def test_calcAlphaTableVectorized(self) -> None:
         """
-        mockedPainter = Mock()
-        mockedColor = Mock()
-        trailPositions = (0, 1, 2, 3, 4)
-        alphas = (1.0, 0.8, 0.7, 0.6, 0.5)
-        for line, trailPos in enumerate(trailPositions):
-            mockedColor.reset_mock()
-            with patch(self.colorCls) as mockedColorConst, \
-                    patch.object(self.dut, '_calcLineTrailPos') \
-                    as mockedCalcLineTrailPos, \
-                    patch.object(self.dut, '_calcLineAlpha') \
+        The _calcAlphaTable method must calculate the alpha of every line for
+        every frame in a vectorized way when NumPy is available.
+        """
+        testParams = ((10, 80, 3.1416), (20, 50, 25.0), (7, 0, 10.0),
+                      (1, 80, 3.1416), (12, 100, 0.0))
+        for lineCount, fadePct, minOpacity in testParams:
+            with patch.object(self.dut, '_calcLineAlpha') \
                     as mockedCalcLineAlpha:
-                mockedColorConst.return_value = mockedColor
-                mockedCalcLineTrailPos.return_value = trailPos
-                mockedCalcLineAlpha.return_value = alphas[line]
-                self.dut._drawLine(mockedPainter, line)
-                mockedColorConst.assert_called_once_with(self.dut._color)
-                mockedCalcLineTrailPos \
-                    .assert_called_once_with(line, self.dut._counter,
-                                             self.dut._lineCount)
-                mockedCalcLineAlpha \
-                    .assert_called_once_with(trailPos, self.dut._lineCount,
-                                             self.dut._trailFadePct,
-                                             self.dut._minTrailOpacity)
-                mockedColor.setAlphaF.assert_called_once_with(alphas[line])
-
-    def test_drawLineDrawRect(self) -> None:
-        """
-        The _drawLine must draw the line.
+                result = self.dut._calcAlphaTable(lineCount, fadePct,
+                                                  minOpacity)
+                mockedCalcLineAlpha.assert_not_called()
+            expectedTable = self._calcExpectedAlphaTable(lineCount, fadePct,
+                                                         minOpacity)
+            self.assertEqual(result, expectedTable, '_calcAlphaTable failed '
+                             'to calculate the alpha table.')
+
+    def test_calcAlphaTableFallback(self) -> None:
+        """
+        The _calcAlphaTable method must calculate the alpha of every line for
+        every frame with _calcLineAlpha when NumPy is not available.
+        """
+        testParams = ((10, 80, 3.1416), (20, 50, 25.0), (1, 80, 3.1416))
+        for lineCount, fadePct, minOpacity in testParams:
+            with patch(self.numpyMod, None):
+                result = self.dut._calcAlphaTable(lineCount, fadePct,
+                                                  minOpacity)
+            expectedTable = self._calcExpectedAlphaTable(lineCount, fadePct,
+                                                         minOpacity)
+            self.assertEqual(result, expectedTable, '_calcAlphaTable failed '
+                             'to calculate the alpha table.')
+
+    def test_updateAlphaTable(self) -> None:
+        """
+        The _updateAlphaTable method must update the alpha table with the
+        current spinner settings.
+        """
+        testTable = [[1.0]]
+        with patch.object(self.dut, '_calcAlphaTable') as mockedCalcTable:
+            mockedCalcTable.return_value = testTable
+            self.dut._updateAlphaTable()
+            mockedCalcTable \
+                .assert_called_once_with(self.dut._lineCount,
+                                         self.dut._trailFadePct,
+                                         self.dut._minTrailOpacity)
+            self.assertEqual(self.dut._alphaTable, testTable,
+                             '_updateAlphaTable failed to update the alpha '
+                             'table.')
+
+    def test_settersUpdateAlphaTable(self) -> None:
+        """
+        The line count, trail fade percentage and minimum trail opacity
+        setters must update the alpha table.
+        """
+        setters = ((self.dut.setLineCount, 15),
+                   (self.dut.setMinTrailOpacity, 15.0),
+                   (self.dut.setTrailFadePct, 15.0))
+        for setter, value in setters:
+            with patch.object(self.dut, '_updateAlphaTable') \
+                    as mockedUpdateTable, \
+                    patch.object(self.dut, '_updateRendering'):
+                setter(value)
+                mockedUpdateTable.assert_called_once()
+
+    def test_calcLinePath(self) -> None:
+        """
+        The _calcLinePath method must return the rounded outline of the line
+        rotated and moved in place around the spinner center.
+        """
+        self.dut._lineCount = 4
+        self.dut._innerRadius = 10
+        self.dut._lineLength = 10
+        self.dut._lineWidth = 2
+        self.dut._roundness = 100.0
+        expectedRects = (QRectF(10, -1, 10, 2), QRectF(-1, 10, 2, 10),
+                         QRectF(-20, -1, 10, 2), QRectF(-1, -20, 2, 10))
+        for line, expectedRect in enumerate(expectedRects):
+            result = self.dut._calcLinePath(line)
+            resultRect = result.boundingRect()
+            for resultValue, expectedValue in \
+                    zip(resultRect.getRect(), expectedRect.getRect()):
+                self.assertAlmostEqual(resultValue, expectedValue, places=7,
+                                       msg='_calcLinePath failed to return '
+                                       'the line outline.')
+            self.assertTrue(result.contains(expectedRect.center()),
+                            '_calcLinePath failed to return the line '
+                            'outline.')
+            self.assertFalse(result.contains(expectedRect.topLeft()),
+                             '_calcLinePath failed to round the line '
+                             'outline.')
+
+    def test_updateLineGeometry(self) -> None:
+        """
+        The _updateLineGeometry method must update the outline of every line
+        and its bounding rectangle in the spinner, with the antialiasing
+        margin.
+        """
+        self.dut._lineCount = 2
+        self.dut._innerRadius = 10
+        self.dut._lineLength = 10
+        testPaths = (QPainterPath(), QPainterPath())
+        testPaths[0].addRect(QRectF(0.5, 0.5, 10, 2))
+        testPaths[1].addRect(QRectF(20, 20, 2, 10))
+        expectedRects = [QRect(19, 19, 13, 5), QRect(39, 39, 4, 12)]
+        with patch.object(self.dut, '_calcLinePath') as mockedCalcPath:
+            mockedCalcPath.side_effect = testPaths
+            self.dut._updateLineGeometry()
+            mockedCalcPath.assert_has_calls((call(0), call(1)))
+        self.assertEqual(self.dut._linePaths, list(testPaths),
+                         '_updateLineGeometry failed to update the lines '
+                         'outline.')
+        self.assertEqual(self.dut._lineRects, expectedRects,
+                         '_updateLineGeometry failed to update the lines '
+                         'bounding rectangles.')
+
+    def test_updateLineGeometryFrameRegions(self) -> None:
+        """
+        The _updateLineGeometry method must find the lines changing alpha
+        when stepping to the first frame and reset the frame regions.
+        """
+        self.dut._lineCount = 3
+        self.dut._alphaTable = [[1.0, 0.1, 0.5],
+                                [0.5, 1.0, 0.1],
+                                [0.1, 0.5, 1.0]]
+        self.dut._frameRegions = [QRegion()] * 3
+        with patch.object(self.dut, '_calcLinePath') as mockedCalcPath:
+            mockedCalcPath.return_value = QPainterPath()
+            self.dut._updateLineGeometry()
+        self.assertEqual(self.dut._changedLines, [0, 1, 2],
+                         '_updateLineGeometry failed to find the changed '
+                         'lines.')
+        self.assertEqual(self.dut._frameRegions, [None] * 3,
+                         '_updateLineGeometry failed to reset the frame '
+                         'regions.')
+
+    def test_updateRendering(self) -> None:
+        """
+        The _updateRendering method must update the rendering caches and
+        request the repaint of the whole spinner.
+        """
+        self.dut._counter = 3
+        self.dut._lastFrame = 0
+        with patch.object(self.dut, '_updateLineGeometry') \
+                as mockedUpdateGeometry, \
+                patch.object(self.dut, '_updateDrawList') \
+                as mockedUpdateDrawList, \
+                patch.object(self.dut, '_updateFrameAtlas') \
+                as mockedUpdateAtlas, \
+                patch.object(self.dut, 'update') as mockedUpdate:
+            self.dut._updateRendering()
+            mockedUpdateGeometry.assert_called_once()
+            mockedUpdateDrawList.assert_called_once()
+            mockedUpdateAtlas.assert_called_once()
+            mockedUpdate.assert_called_once_with()
+        self.assertEqual(self.dut._lastFrame, 3, '_updateRendering failed '
+                         'to save the last requested frame.')
+
+    def test_updateDrawList(self) -> None:
+        """
+        The _updateDrawList method must create the transform of every line
+        and the brush of every line of the first frame, one per alpha.
+        """
+        self.dut._lineCount = 4
+        self.dut._innerRadius = 10
+        self.dut._lineLength = 10
+        self.dut._lineWidth = 3
+        self.dut._roundness = 50.0
+        self.dut._color = QColor(Qt.red)
+        self.dut._alphaTable = [[1.0, 0.1, 0.1, 0.5]]
+        self.dut._updateDrawList()
+        drawList = self.dut._drawList
+        self.assertEqual(drawList._lineRect, QRectF(0, -1, 10, 3),
+                         '_updateDrawList failed to create the line '
+                         'rectangle.')
+        self.assertEqual(drawList._roundness, 50.0, '_updateDrawList failed '
+                         'to keep the roundness.')
+        self.assertEqual(drawList.getFrameCount(), 4, '_updateDrawList '
+                         'failed to create the line transforms.')
+        for line, transform in enumerate(drawList._lineTransforms):
+            expectedTransform = QTransform()
+            expectedTransform.translate(20, 20)
+            expectedTransform.rotate(90 * line)
+            expectedTransform.translate(10, 0)
+            self.assertEqual(transform, expectedTransform, '_updateDrawList '
+                             'failed to create the line transforms.')
+        brushes = drawList.getLineBrushes()
+        for brush, alpha in zip(brushes, self.dut._alphaTable[0]):
+            expectedColor = QColor(Qt.red)
+            expectedColor.setAlphaF(alpha)
+            self.assertEqual(brush.color(), expectedColor, '_updateDrawList '
+                             'failed to create the brush of the line alpha.')
+        self.assertIs(brushes[1], brushes[2], '_updateDrawList failed to '
+                      'share the brush of an alpha.')
+
+    def test_updateDrawListPixels(self) -> None:
+        """
+        The frames drawn from the draw list must be the same pixels as the
+        lines drawn one by one with their alpha, as the widget painted them
+        before the draw list, including dense spinners whose lines overlap
+        and square lines.
+        """
+        testConfigs = ((7, 10, 12, 4, 100.0), (20, 10, 10, 2, 100.0),
+                       (64, 2, 10, 2, 100.0), (100, 5, 10, 2, 100.0),
+                       (200, 5, 10, 2, 0.0), (12, 7, 9, 5, 37.0))
+        for lineCount, innerRadius, lineLength, lineWidth, roundness \
+                in testConfigs:
+            self.dut._lineCount = lineCount
+            self.dut._innerRadius = innerRadius
+            self.dut._lineLength = lineLength
+            self.dut._lineWidth = lineWidth
+            self.dut._roundness = roundness
+            self.dut._alphaTable = self.dut._calcAlphaTable(lineCount, 60.0,
+                                                            20.0)
+            self.dut._updateDrawList()
+            center = innerRadius + lineLength
+            for frame in (0, 5):
+                images = []
+                for isReference in (True, False):
+                    image = QImage(2 * center, 2 * center,
+                                   QImage.Format_ARGB32_Premultiplied)
+                    image.fill(Qt.transparent)
+                    painter = QPainter(image)
+                    painter.setRenderHint(QPainter.Antialiasing, True)
+                    painter.setPen(Qt.NoPen)
+                    if isReference:
+                        for line in range(lineCount):
+                            painter.save()
+                            painter.translate(center, center)
+                            painter.rotate(360 * line / lineCount)
+                            painter.translate(innerRadius, 0)
+                            trailPos = self.dut._calcLineTrailPos(line,
+                                                                  frame,
+                                                                  lineCount)
+                            color = QColor(self.dut._color)
+                            color.setAlphaF(self.dut._calcLineAlpha(
+                                trailPos, lineCount, 60.0, 20.0))
+                            painter.setBrush(color)
+                            painter.drawRoundedRect(
+                                QRect(0, int(-lineWidth / 2), lineLength,
+                                      lineWidth),
+                                roundness, roundness, Qt.RelativeSize)
+                            painter.restore()
+                    else:
+                        self.dut.paintFrame(painter, frame)
+                    painter.end()
+                    images.append(bytes(image.constBits()))
+                self.assertEqual(images[1], images[0], f"The frame {frame} "
+                                 f"of {lineCount} lines does not match the "
+                                 f"lines drawn one by one.")
+
+    def test_getDrawList(self) -> None:
+        """
+        The getDrawList method must return a copy of the draw list.
+        """
+        self.dut._drawList = Mock()
+        result = self.dut.getDrawList()
+        self.dut._drawList.copy.assert_called_once_with()
+        self.assertEqual(result, self.dut._drawList.copy.return_value,
+                         'getDrawList failed to return a copy of the draw '
+                         'list.')
+
+    def test_paintFrame(self) -> None:
+        """
+        The paintFrame method must paint the frame of the draw list.
         """
         mockedPainter = Mock()
-        mockedRect = Mock()
-        for line in range(5):
-            mockedPainter.reset_mock()
-            with patch(self.colorCls), \
-                    patch(self.rectCls) as mockedRectConst, \
-                    patch.object(self.dut, '_calcLineTrailPos'), \
-                    patch.object(self.dut, '_calcLineAlpha'):
-                mockedRectConst.return_value = mockedRect
-                self.dut._drawLine(mockedPainter, line)
-                mockedRectConst \
-                    .assert_called_once_with(0, int(-self.dut._lineWidth / 2),
-                                             self.dut._lineLength,
-                                             self.dut._lineWidth)
-                mockedPainter.drawRoundedRect \
-                    .assert_called_once_with(mockedRect, self.dut._roundness,
-                                             self.dut._roundness,
-                                             Qt.RelativeSize)
+        self.dut._drawList = Mock()
+        self.dut.paintFrame(mockedPainter, 1)
+        self.dut._drawList.paintFrame.assert_called_once_with(mockedPainter,
+                                                              1)
+
+    def test_batchUpdate(self) -> None:
+        """
+        The batchUpdate context manager must flush the deferred updates only
+        when the outermost batch ends, even on error.
+        """
+        with patch.object(self.dut, '_flushUpdates') as mockedFlush:
+            with self.dut.batchUpdate() as spinner:
+                self.assertIs(spinner, self.dut, 'batchUpdate failed to '
+                              'return the spinner.')
+                with self.dut.batchUpdate():
+                    self.assertEqual(self.dut._batchDepth, 2, 'batchUpdate '
+                                     'failed to nest the batch updates.')
+                mockedFlush.assert_not_called()
+            mockedFlush.assert_called_once()
+            with self.assertRaises(ValueError):
+                with self.dut.batchUpdate():
+                    raise ValueError('test error')
+            self.assertEqual(mockedFlush.call_count, 2, 'batchUpdate failed '
+                             'to flush the updates on error.')
+        self.assertEqual(self.dut._batchDepth, 0, 'batchUpdate failed to '
+                         'end the batch update.')
+
+    def test_configure(self) -> None:
+        """
+        The configure method must apply every setting in a single batch
+        update with one update of each kind.
+        """
+        testParams = {'color': Qt.red, 'roundness': 50.0,
+                      'minTrailOpacity': 10.0, 'trailFadePct': 50.0,
+                      'revsPerSecond': 2.0, 'lineCount': 12,
+                      'lineLength': 15, 'lineWidth': 3, 'innerRadius': 12}
+        with patch.object(self.dut, 'setFixedSize') as mockedSetFixedSize, \
+                patch.object(self.dut, '_calcAlphaTable') as mockedCalcTable, \
+                patch.object(self.dut, '_updateLineGeometry') \
+                as mockedUpdateGeometry, \
+                patch.object(self.dut, '_updateDrawList'), \
+                patch.object(self.dut, '_updateFrameAtlas'), \
+                patch.object(self.dut, 'update'):
+            mockedCalcTable.return_value = [[1.0]]
+            self.dut.configure(**testParams)
+            mockedSetFixedSize.assert_called_once_with(54, 54)
+            self.dut._timer.setInterval.assert_called_once()
+            mockedCalcTable.assert_called_once_with(12, 50.0, 10.0)
+            mockedUpdateGeometry.assert_called_once()
+        self.assertEqual(self.dut._color, QColor(Qt.red), 'configure failed '
+                         'to apply the settings.')
+        self.assertEqual((self.dut._roundness, self.dut._revsPerSecond,
+                          self.dut._lineCount, self.dut._lineLength,
+                          self.dut._lineWidth, self.dut._innerRadius),
+                         (50.0, 2.0, 12, 15, 3, 12), 'configure failed to '
+                         'apply the settings.')
+
+    def test_configureUnknownParam(self) -> None:
+        """
+        The configure method must raise a TypeError without applying any
+        setting when a parameter is unknown.
+        """
+        with patch.object(self.dut, 'setLineCount') as mockedSetLineCount:
+            with self.assertRaises(TypeError):
+                self.dut.configure(lineCount=12, parent=None)
+            mockedSetLineCount.assert_not_called()
 
     def test_getLineCount(self) -> None:
         """
@@ -313,7 +1362,8 @@ class TestWaitingSpinner(TestCase):
         update the internal timer.
         """
         testLineCount = 15
-        with patch.object(self.dut, '_updateTimer') as mockedUpdateTmr:
+        with patch.object(self.dut, '_updateTimer') as mockedUpdateTmr, \
+                patch.object(self.dut, '_updateRendering'):
             self.dut.setLineCount(testLineCount)
             self.assertEqual(self.dut._lineCount, testLineCount,
                              'setLineCount failed to set the spinner current '
@@ -336,7 +1386,8 @@ class TestWaitingSpinner(TestCase):
         update the spinner size.
         """
         testLineLength = 15
-        with patch.object(self.dut, '_updateSize') as mockedUpdateSize:
+        with patch.object(self.dut, '_updateSize') as mockedUpdateSize, \
+                patch.object(self.dut, '_updateRendering'):
             self.dut.setLineLength(testLineLength)
             self.assertEqual(self.dut._lineLength, testLineLength,
                              'setLineLength failed to set the spinner '
@@ -359,7 +1410,8 @@ class TestWaitingSpinner(TestCase):
         update the spinner size.
         """
         testLineWidth = 15
-        with patch.object(self.dut, '_updateSize') as mockedUpdateSize:
+        with patch.object(self.dut, '_updateSize') as mockedUpdateSize, \
+                patch.object(self.dut, '_updateRendering'):
             self.dut.setLineWidth(testLineWidth)
             self.assertEqual(self.dut._lineWidth, testLineWidth,
                              'setLineWidth failed to set the spinner '
@@ -384,7 +1436,8 @@ class TestWaitingSpinner(TestCase):
         testRoundnesses = (-0.1, 0.0, 37.8, 85.4, 100.0, 100.1)
         expectedRoundnesses = (0.0, 0.0, 37.8, 85.4, 100.0, 100.0)
         for idx, testRoundness in enumerate(testRoundnesses):
-            self.dut.setRoundness(testRoundness)
+            with patch.object(self.dut, '_updateRendering'):
+                self.dut.setRoundness(testRoundness)
             self.assertEqual(self.dut._roundness, expectedRoundnesses[idx],
                              'setRoundness failed to set the spinner '
                              'line roundness.')
@@ -405,7 +1458,8 @@ class TestWaitingSpinner(TestCase):
         update the spinner size.
         """
         testInnerRadius = 15
-        with patch.object(self.dut, '_updateSize') as mockedUpdateSize:
+        with patch.object(self.dut, '_updateSize') as mockedUpdateSize, \
+                patch.object(self.dut, '_updateRendering'):
             self.dut.setInnerRadius(testInnerRadius)
             self.assertEqual(self.dut._innerRadius, testInnerRadius,
                              'setInnerRadius failed to set the spinner '
@@ -427,7 +1481,8 @@ class TestWaitingSpinner(TestCase):
         The setColor method must set the current spinner color.
         """
         testColor = QColor(Qt.green)
-        self.dut.setColor(Qt.green)
+        with patch.object(self.dut, '_updateRendering'):
+            self.dut.setColor(Qt.green)
         self.assertEqual(self.dut._color, testColor,
                          'setColor failed to set the spinner color.')
 
@@ -448,7 +1503,8 @@ class TestWaitingSpinner(TestCase):
         trail opacity.
         """
         testOpacity = 2.1
-        self.dut.setMinTrailOpacity(testOpacity)
+        with patch.object(self.dut, '_updateRendering'):
+            self.dut.setMinTrailOpacity(testOpacity)
         self.assertEqual(self.dut._minTrailOpacity, testOpacity,
                          'setMinTrailOpacity failed to set the spinner '
                          'minimum opacity.')
@@ -470,7 +1526,8 @@ class TestWaitingSpinner(TestCase):
         trail fade percentage.
         """
         testFadePct = 2.1
-        self.dut.setTrailFadePct(testFadePct)
+        with patch.object(self.dut, '_updateRendering'):
+            self.dut.setTrailFadePct(testFadePct)
         self.assertEqual(self.dut._trailFadePct, testFadePct,
                          'setTrailFadePct failed to set the spinner '
                          'trail fade percentage.')
@@ -500,6 +1557,353 @@ class TestWaitingSpinner(TestCase):
                              'setRevsPerSecond failed to set the spinner '
                              'revolutions per second.')
 
+    def test_isFrameAtlasEnabled(self) -> None:
+        """
+        The isFrameAtlasEnabled method must return the frame atlas enable
+        flag.
+        """
+        expectedRes = (False, True)
+        for expectedResult in expectedRes:
+            self.dut._isFrameAtlasEnabled = expectedResult
+            result = self.dut.isFrameAtlasEnabled()
+            self.assertEqual(result, expectedResult, 'isFrameAtlasEnabled '
+                             'failed to return the frame atlas enable flag.')
+
+    def test_setFrameAtlasEnabled(self) -> None:
+        """
+        The setFrameAtlasEnabled method must set the frame atlas enable flag
+        and update the rendering.
+        """
+        for isEnabled in (True, False):
+            with patch.object(self.dut, '_updateRendering') \
+                    as mockedUpdateAtlas:
+                self.dut.setFrameAtlasEnabled(isEnabled)
+                self.assertEqual(self.dut._isFrameAtlasEnabled, isEnabled,
+                                 'setFrameAtlasEnabled failed to set the '
+                                 'frame atlas enable flag.')
+                mockedUpdateAtlas.assert_called_once()
+
+    def test_settersUpdateRendering(self) -> None:
+        """
+        The style setters must update the rendering.
+        """
+        setters = ((self.dut.setLineCount, 15),
+                   (self.dut.setLineLength, 15),
+                   (self.dut.setLineWidth, 15),
+                   (self.dut.setRoundness, 15.0),
+                   (self.dut.setInnerRadius, 15),
+                   (self.dut.setColor, Qt.red),
+                   (self.dut.setMinTrailOpacity, 15.0),
+                   (self.dut.setTrailFadePct, 15.0))
+        for setter, value in setters:
+            with patch.object(self.dut, '_updateSize'), \
+                    patch.object(self.dut, '_updateRendering') \
+                    as mockedUpdateRendering:
+                setter(value)
+                mockedUpdateRendering.assert_called_once()
+
+    def test_isSharedClockEnabled(self) -> None:
+        """
+        The isSharedClockEnabled method must return the shared animation
+        clock enable flag.
+        """
+        expectedRes = (False, True)
+        for expectedResult in expectedRes:
+            self.dut._isSharedClockEnabled = expectedResult
+            result = self.dut.isSharedClockEnabled()
+            self.assertEqual(result, expectedResult, 'isSharedClockEnabled '
+                             'failed to return the shared animation clock '
+                             'enable flag.')
+
+    def test_setSharedClockEnabled(self) -> None:
+        """
+        The setSharedClockEnabled method must set the shared animation clock
+        enable flag and switch the animation driver if the spinner is
+        spinning.
+        """
+        for isSpinning in (False, True):
+            self.dut._isSpinning = isSpinning
+            self.dut._isSharedClockEnabled = False
+            with patch.object(self.dut, '_stopTimer') as mockedStopTmr, \
+                    patch.object(self.dut, '_startTimer') as mockedStartTmr:
+                mockedStopTmr.side_effect = \
+                    lambda: self.assertFalse(self.dut._isSharedClockEnabled)
+                mockedStartTmr.side_effect = \
+                    lambda: self.assertTrue(self.dut._isSharedClockEnabled)
+                self.dut.setSharedClockEnabled(True)
+                self.assertTrue(self.dut._isSharedClockEnabled,
+                                'setSharedClockEnabled failed to set the '
+                                'shared animation clock enable flag.')
+                if isSpinning:
+                    mockedStopTmr.assert_called_once()
+                    mockedStartTmr.assert_called_once()
+                else:
+                    mockedStopTmr.assert_not_called()
+                    mockedStartTmr.assert_not_called()
+
+    def test_setRevsPerSecondTimeBased(self) -> None:
+        """
+        The setRevsPerSecond method must keep the spinner phase when the
+        spinner is spinning in time based mode.
+        """
+        testFlags = ((False, False), (False, True), (True, False),
+                     (True, True))
+        for isTimeBasedEnabled, isSpinning in testFlags:
+            self.dut._isTimeBasedEnabled = isTimeBasedEnabled
+            self.dut._isSpinning = isSpinning
+            with patch.object(self.dut, '_updateTimer'), \
+                    patch.object(self.dut, '_getPhase') as mockedGetPhase, \
+                    patch.object(self.dut, '_rebasePhase') as mockedRebase:
+                mockedGetPhase.return_value = 0.3
+                self.dut.setRevsPerSecond(2.0)
+                if isTimeBasedEnabled and isSpinning:
+                    mockedRebase.assert_called_once_with(0.3)
+                else:
+                    mockedRebase.assert_not_called()
+
+    def test_isTimeBasedEnabled(self) -> None:
+        """
+        The isTimeBasedEnabled method must return the time based animation
+        enable flag.
+        """
+        expectedRes = (False, True)
+        for expectedResult in expectedRes:
+            self.dut._isTimeBasedEnabled = expectedResult
+            result = self.dut.isTimeBasedEnabled()
+            self.assertEqual(result, expectedResult, 'isTimeBasedEnabled '
+                             'failed to return the time based animation '
+                             'enable flag.')
+
+    def test_setTimeBasedEnabled(self) -> None:
+        """
+        The setTimeBasedEnabled method must set the time based animation
+        enable flag, rebase the phase on the current counter when enabling
+        and update the internal timer.
+        """
+        self.dut._lineCount = 10
+        self.dut._counter = 4
+        testFlags = ((False, True), (True, True), (True, False))
+        for isEnabled, isNewEnabled in testFlags:
+            self.dut._isTimeBasedEnabled = isEnabled
+            with patch.object(self.dut, '_updateTimer') as mockedUpdateTmr, \
+                    patch.object(self.dut, '_rebasePhase') as mockedRebase:
+                self.dut.setTimeBasedEnabled(isNewEnabled)
+                self.assertEqual(self.dut._isTimeBasedEnabled, isNewEnabled,
+                                 'setTimeBasedEnabled failed to set the time '
+                                 'based animation enable flag.')
+                if isNewEnabled and not isEnabled:
+                    mockedRebase.assert_called_once_with(0.4)
+                else:
+                    mockedRebase.assert_not_called()
+                mockedUpdateTmr.assert_called_once()
+
+    def test_getMaxFps(self) -> None:
+        """
+        The getMaxFps method must return the maximum FPS.
+        """
+        self.dut._maxFps = 30.0
+        result = self.dut.getMaxFps()
+        self.assertEqual(result, 30.0, 'getMaxFps failed to return the '
+                         'maximum FPS.')
+
+    def test_setMaxFps(self) -> None:
+        """
+        The setMaxFps method must set the maximum FPS and update the internal
+        timer.
+        """
+        with patch.object(self.dut, '_updateTimer') as mockedUpdateTmr:
+            self.dut.setMaxFps(30.0)
+            self.assertEqual(self.dut._maxFps, 30.0, 'setMaxFps failed to '
+                             'set the maximum FPS.')
+            mockedUpdateTmr.assert_called_once()
+
+    def test_getTimerType(self) -> None:
+        """
+        The getTimerType method must return the internal timer type.
+        """
+        self.dut._timer.timerType.return_value = Qt.PreciseTimer
+        result = self.dut.getTimerType()
+        self.assertEqual(result, Qt.PreciseTimer, 'getTimerType failed to '
+                         'return the internal timer type.')
+
+    def test_setTimerType(self) -> None:
+        """
+        The setTimerType method must set the internal timer type.
+        """
+        self.dut.setTimerType(Qt.CoarseTimer)
+        self.dut._timer.setTimerType.assert_called_once_with(Qt.CoarseTimer)
+
+    def test_setSharedClockEnabledSuspended(self) -> None:
+        """
+        The setSharedClockEnabled method must not restart the animation of a
+        suspended spinner.
+        """
+        self.dut._isSpinning = True
+        self.dut._isSuspended = True
+        with patch.object(self.dut, '_stopTimer') as mockedStopTmr, \
+                patch.object(self.dut, '_startTimer') as mockedStartTmr:
+            self.dut.setSharedClockEnabled(True)
+            mockedStopTmr.assert_not_called()
+            mockedStartTmr.assert_not_called()
+
+    def test_isAutoSuspendEnabled(self) -> None:
+        """
+        The isAutoSuspendEnabled method must return the automatic suspension
+        enable flag.
+        """
+        expectedRes = (False, True)
+        for expectedResult in expectedRes:
+            self.dut._isAutoSuspendEnabled = expectedResult
+            result = self.dut.isAutoSuspendEnabled()
+            self.assertEqual(result, expectedResult, 'isAutoSuspendEnabled '
+                             'failed to return the automatic suspension '
+                             'enable flag.')
+
+    def test_setAutoSuspendEnabled(self) -> None:
+        """
+        The setAutoSuspendEnabled method must set the automatic suspension
+        enable flag and update the suspension.
+        """
+        for isEnabled in (False, True):
+            with patch.object(self.dut, '_updateSuspension') as mockedUpdate:
+                self.dut.setAutoSuspendEnabled(isEnabled)
+                self.assertEqual(self.dut._isAutoSuspendEnabled, isEnabled,
+                                 'setAutoSuspendEnabled failed to set the '
+                                 'automatic suspension enable flag.')
+                mockedUpdate.assert_called_once()
+
+    def test_isSuspended(self) -> None:
+        """
+        The isSuspended method must return the suspended flag.
+        """
+        expectedRes = (False, True)
+        for expectedResult in expectedRes:
+            self.dut._isSuspended = expectedResult
+            result = self.dut.isSuspended()
+            self.assertEqual(result, expectedResult, 'isSuspended failed to '
+                             'return the suspended flag.')
+
+    def test_isFrameStatsEnabled(self) -> None:
+        """
+        The isFrameStatsEnabled method must return the frame statistics
+        enable flag.
+        """
+        for frameStats in (None, Mock()):
+            self.dut._frameStats = frameStats
+            result = self.dut.isFrameStatsEnabled()
+            self.assertEqual(result, frameStats is not None,
+                             'isFrameStatsEnabled failed to return the frame '
+                             'statistics enable flag.')
+
+    def test_setFrameStatsEnabled(self) -> None:
+        """
+        The setFrameStatsEnabled method must create the frame statistics and
+        start their report when enabled, release them and stop the report
+        when disabled.
+        """
+        frameStatsCls = 'widgets.waitingSpinner.waitingSpinner.FrameStats'
+        self.dut._isSpinning = True
+        self.dut._isSuspended = False
+        with patch(frameStatsCls) as mockedFrameStatsCls:
+            self.dut.setFrameStatsEnabled(True)
+            self.dut.setFrameStatsEnabled(True)
+            mockedFrameStatsCls.assert_called_once()
+            self.assertEqual(self.dut._frameStats,
+                             mockedFrameStatsCls.return_value,
+                             'setFrameStatsEnabled failed to create the frame '
+                             'statistics.')
+            self.dut._frameStatsTimer.start.assert_called_once()
+            self.dut.setFrameStatsEnabled(False)
+            self.assertIsNone(self.dut._frameStats, 'setFrameStatsEnabled '
+                              'failed to release the frame statistics.')
+            self.dut._frameStatsTimer.stop.assert_called_once()
+
+    def test_setFrameStatsEnabledNotAnimated(self) -> None:
+        """
+        The setFrameStatsEnabled method must not start the report of a
+        stopped or suspended spinner.
+        """
+        frameStatsCls = 'widgets.waitingSpinner.waitingSpinner.FrameStats'
+        for isSpinning, isSuspended in ((False, False), (True, True)):
+            self.dut._isSpinning = isSpinning
+            self.dut._isSuspended = isSuspended
+            self.dut._frameStats = None
+            with patch(frameStatsCls):
+                self.dut.setFrameStatsEnabled(True)
+            self.dut._frameStatsTimer.start.assert_not_called()
+
+    def test_getFrameStatsInterval(self) -> None:
+        """
+        The getFrameStatsInterval method must return the report interval.
+        """
+        self.dut._frameStatsTimer.interval.return_value = 500
+        result = self.dut.getFrameStatsInterval()
+        self.assertEqual(result, 500, 'getFrameStatsInterval failed to '
+                         'return the report interval.')
+
+    def test_setFrameStatsInterval(self) -> None:
+        """
+        The setFrameStatsInterval method must set the report interval.
+        """
+        self.dut.setFrameStatsInterval(500)
+        self.dut._frameStatsTimer.setInterval.assert_called_once_with(500)
+
+    def test_getFrameStats(self) -> None:
+        """
+        The getFrameStats method must return the frame statistics, None when
+        they are disabled.
+        """
+        self.dut._frameStats = None
+        self.assertIsNone(self.dut.getFrameStats(), 'getFrameStats failed to '
+                          'return None when disabled.')
+        self.dut._frameStats = Mock()
+        result = self.dut.getFrameStats()
+        self.dut._frameStats.getStats \
+            .assert_called_once_with(self.dut._lineCount,
+                                     self.dut._revsPerSecond)
+        self.assertEqual(result, self.dut._frameStats.getStats.return_value,
+                         'getFrameStats failed to return the frame '
+                         'statistics.')
+
+    def test_resetFrameStats(self) -> None:
+        """
+        The resetFrameStats method must reset the frame statistics when
+        enabled.
+        """
+        self.dut._frameStats = None
+        self.dut.resetFrameStats()
+        self.dut._frameStats = Mock()
+        self.dut.resetFrameStats()
+        self.dut._frameStats.reset.assert_called_once()
+
+    def test_setRepaintRateEnabled(self) -> None:
+        """
+        The setRepaintRateEnabled method must set the measurement flag and
+        restart the measurement.
+        """
+        self.assertFalse(self.dut.isRepaintRateEnabled(), 'The repainted '
+                         'pixel rate must be disabled by default.')
+        self.dut._repaintedPixelCount = 10
+        self.dut._repaintedPixelRate = 1234.5
+        self.dut.setRepaintRateEnabled(True)
+        self.assertTrue(self.dut.isRepaintRateEnabled(),
+                        'setRepaintRateEnabled failed to set the flag.')
+        self.assertEqual(self.dut._repaintedPixelCount, 0,
+                         'setRepaintRateEnabled failed to reset the count.')
+        self.assertEqual(self.dut.getRepaintedPixelRate(), 0.0,
+                         'setRepaintRateEnabled failed to reset the rate.')
+        self.dut._repaintRateTimer.restart.assert_called_once()
+
+    def test_getRepaintedPixelRate(self) -> None:
+        """
+        The getRepaintedPixelRate method must return the repainted pixel
+        rate.
+        """
+        self.dut._repaintedPixelRate = 1234.5
+        result = self.dut.getRepaintedPixelRate()
+        self.assertEqual(result, 1234.5, 'getRepaintedPixelRate failed to '
+                         'return the repainted pixel rate.')
+
     def test_isSpinning(self) -> None:
         """
         The isSpinning method must return True if the spinner is spinning and
@@ -520,7 +1924,8 @@ class TestWaitingSpinner(TestCase):
         spinningFlags = (False, True)
         with patch.object(self.dut, '_centerInParent') as mockedCenter, \
                 patch.object(self.dut, '_disableParent') as MockedDisable, \
-                patch.object(self.dut, 'show'):
+                patch.object(self.dut, 'show'), \
+                patch.object(self.dut, '_updateSuspension'):
             for spinningFlag in spinningFlags:
                 self.dut._isSpinning = spinningFlag
                 self.dut.start()
@@ -535,7 +1940,8 @@ class TestWaitingSpinner(TestCase):
         spinningFlags = (False, True)
         with patch.object(self.dut, '_centerInParent'), \
                 patch.object(self.dut, '_disableParent'), \
-                patch.object(self.dut, 'show') as mockedShow:
+                patch.object(self.dut, 'show') as mockedShow, \
+                patch.object(self.dut, '_updateSuspension'):
             for spinningFlag in spinningFlags:
                 self.dut._isSpinning = spinningFlag
                 self.dut._counter = 10
@@ -545,9 +1951,27 @@ class TestWaitingSpinner(TestCase):
                                     'set the spinning flag')
                     self.assertEqual(self.dut._counter, 0, 'start failed to '
                                      'initialize the line counter.')
+                    self.dut._elapsedTimer.start.assert_called_once()
+                    self.assertEqual(self.dut._phaseOrigin, 0.0, 'start '
+                                     'failed to initialize the phase.')
             self.dut._timer.start.assert_called_once()
             mockedShow.assert_called_once()
 
+    def test_startUpdateSuspension(self) -> None:
+        """
+        The start method must update the suspension once shown, a spinner
+        started in a hidden tab receiving no show event.
+        """
+        self.dut._isSpinning = False
+        with patch.object(self.dut, '_centerInParent'), \
+                patch.object(self.dut, '_disableParent'), \
+                patch.object(self.dut, 'show') as mockedShow, \
+                patch.object(self.dut, '_updateSuspension') as mockedUpdate:
+            mockedUpdate.side_effect = \
+                lambda: mockedShow.assert_called_once()
+            self.dut.start()
+            mockedUpdate.assert_called_once()
+
     def test_stopStopSpinning(self) -> None:
         """
         The stop method must stop the internal timer, clear the spinning flag
@@ -568,34 +1992,151 @@ class TestWaitingSpinner(TestCase):
             mockedEnable.assert_called_once()
             mockedHide.assert_called_once()
 
+    def test_stopSuspended(self) -> None:
+        """
+        The stop method must clear the suspended flag without stopping the
+        already stopped animation.
+        """
+        self.dut._isSpinning = True
+        self.dut._isSuspended = True
+        with patch.object(self.dut, '_enableParent'), \
+                patch.object(self.dut, '_stopTimer') as mockedStopTmr, \
+                patch.object(self.dut, 'hide'):
+            self.dut.stop()
+            mockedStopTmr.assert_not_called()
+            self.assertFalse(self.dut._isSuspended, 'stop failed to clear '
+                             'the suspended flag.')
+            self.assertFalse(self.dut._isSpinning, 'stop failed to clear '
+                             'the spinning flag.')
+
+    def test_showEvent(self) -> None:
+        """
+        The showEvent method must update the device pixel ratio and the
+        suspension.
+        """
+        with patch.object(self.dut, '_updateSuspension') as mockedUpdate, \
+                patch.object(self.dut, '_updateDevicePixelRatio') \
+                as mockedUpdateDpr:
+            self.dut.showEvent(None)
+            mockedUpdate.assert_called_once()
+            mockedUpdateDpr.assert_called_once()
+
+    def test_eventScreenChange(self) -> None:
+        """
+        The event method must update the device pixel ratio on a screen
+        change only and forward every event to the base class.
+        """
+        eventTypes = (QEvent.ScreenChangeInternal, QEvent.Resize)
+        for eventType in eventTypes:
+            mockedEvent = Mock()
+            mockedEvent.type.return_value = eventType
+            with patch(f"{self.widgetCls}.event") as mockedBaseEvent, \
+                    patch.object(self.dut, '_updateDevicePixelRatio') \
+                    as mockedUpdateDpr:
+                mockedBaseEvent.return_value = True
+                result = self.dut.event(mockedEvent)
+                mockedBaseEvent.assert_called_once_with(mockedEvent)
+                self.assertTrue(result, 'event failed to return the base '
+                                'class result.')
+                self.assertEqual(mockedUpdateDpr.called,
+                                 eventType == QEvent.ScreenChangeInternal,
+                                 'event failed to update the device pixel '
+                                 'ratio on a screen change.')
+
+    def test_hideEvent(self) -> None:
+        """
+        The hideEvent method must update the suspension.
+        """
+        with patch.object(self.dut, '_updateSuspension') as mockedUpdate:
+            self.dut.hideEvent(None)
+            mockedUpdate.assert_called_once()
+
     def test_paintEventInitPainter(self) -> None:
         """
         The paintEvent must initialize the painter.
         """
         mockedPainter = Mock()
         with patch(self.painterCls) as mockedPainterConst, \
+                patch.object(self.dut, '_countRepaintedPixels'), \
                 patch.object(self.dut, 'rect') as mockedRect, \
-                patch.object(self.dut, '_drawLine'):
+                patch.object(self.dut, '_drawList'):
             mockedPainterConst.return_value = mockedPainter
             mockedRect.return_value = 10
-            self.dut.paintEvent(None)
+            self.dut.paintEvent(Mock())
             mockedPainterConst.assert_called_once_with(self.dut)
-            mockedPainter.fillRect.assert_called_once_with(10, Qt.transparent)
+            mockedPainter.fillRect.assert_not_called()
             mockedPainter.setRenderHint \
                 .assert_called_once_with(mockedPainterConst.Antialiasing, True)
             mockedPainter.setPen.assert_called_once_with(Qt.NoPen)
 
-    def test_paintEventDrawLines(self) -> None:
+    def test_paintEventDrawFrame(self) -> None:
+        """
+        The paintEvent must draw the current frame of the spinner.
+        """
+        mockedPainter = Mock()
+        self.dut._counter = 3
+        with patch(self.painterCls) as mockedPainterConst, \
+                patch.object(self.dut, '_countRepaintedPixels'), \
+                patch.object(self.dut, 'rect'), \
+                patch.object(self.dut, '_drawList') as mockedDrawList:
+            mockedPainterConst.return_value = mockedPainter
+            self.dut.paintEvent(Mock())
+            mockedDrawList.paintFrame \
+                .assert_called_once_with(mockedPainter, 3)
+
+    def test_paintEventCountRepaintedPixels(self) -> None:
+        """
+        The paintEvent must count the repainted pixels of the event region
+        only when the repainted pixel rate is enabled.
+        """
+        for isEnabled in (False, True):
+            mockedEvent = Mock()
+            self.dut._isRepaintRateEnabled = isEnabled
+            with patch(self.painterCls), \
+                    patch.object(self.dut, '_countRepaintedPixels') \
+                    as mockedCount, \
+                    patch.object(self.dut, 'rect'), \
+                    patch.object(self.dut, '_drawList'):
+                self.dut.paintEvent(mockedEvent)
+                if isEnabled:
+                    mockedCount.assert_called_once_with(mockedEvent.region())
+                else:
+                    mockedCount.assert_not_called()
+
+    def test_paintEventFrameStats(self) -> None:
+        """
+        The paintEvent must paint the frame and record its duration in the
+        frame statistics when enabled.
+        """
+        perfCounterFct = \
+            'widgets.waitingSpinner.waitingSpinner.perf_counter_ns'
+        mockedEvent = Mock()
+        self.dut._frameStats = Mock()
+        with patch.object(self.dut, '_paint') as mockedPaint, \
+                patch(perfCounterFct) as mockedPerfCounter:
+            mockedPerfCounter.side_effect = (1000, 4000)
+            self.dut.paintEvent(mockedEvent)
+            mockedPaint.assert_called_once_with(mockedEvent)
+        self.dut._frameStats.recordPaint.assert_called_once_with(3000)
+
+    def test_paintEventDrawFrameAtlas(self) -> None:
         """
-        The paintEvent must draw all the lines of the spinner.
+        The paintEvent must blit the current frame from the frame atlas
+        instead of drawing the lines when the atlas is available.
         """
+        frameSize = 40
         mockedPainter = Mock()
-        expectedCalls = []
-        for line in range(self.dut._lineCount):
-            expectedCalls.append(call(mockedPainter, line))
+        mockedAtlas = Mock()
+        mockedAtlas.height.return_value = frameSize
+        self.dut._frameAtlas = mockedAtlas
+        self.dut._counter = 3
         with patch(self.painterCls) as mockedPainterConst, \
+                patch.object(self.dut, '_countRepaintedPixels'), \
                 patch.object(self.dut, 'rect'), \
-                patch.object(self.dut, '_drawLine') as mockedDrawLine:
+                patch.object(self.dut, '_drawList') as mockedDrawList:
             mockedPainterConst.return_value = mockedPainter
-            self.dut.paintEvent(None)
-            mockedDrawLine.assert_has_calls(expectedCalls)
+            self.dut.paintEvent(Mock())
+            mockedPainter.drawPixmap \
+                .assert_called_once_with(0, 0, mockedAtlas, 3 * frameSize, 0,
+                                         frameSize, frameSize)
+            mockedDrawList.paintFrame.assert_not_called()